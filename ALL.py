@@ -1,228 +1,527 @@
-import ply.lex as lex
-import ply.yacc as yacc
-
-# --- Lexer (token definitions) ---
-reserved = {
-    'var': 'VAR',
-    'let': 'LET',
-    'const': 'CONST',
-    'while': 'WHILE',
-    'if': 'IF',
-    'else': 'ELSE',
-    'function': 'FUNCTION',
-    'return': 'RETURN',  # Added return to reserved
-}
-
-tokens = [
-    'ID', 'NUMBER', 'STRING', 'ASSIGN', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE',
-    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET', 'COMMA', 'COLON', 'SEMICOLON', 'COMPARISON',
-] + list(reserved.values())
-
-# Regular expression rules for tokens
-t_ASSIGN = r'='
-t_PLUS = r'\+'
-t_MINUS = r'-'
-t_TIMES = r'\*'
-t_DIVIDE = r'/'
-t_LPAREN = r'\('
-t_RPAREN = r'\)'
-t_LBRACE = r'\{'
-t_RBRACE = r'\}'
-t_LBRACKET = r'\['
-t_RBRACKET = r'\]'
-t_COMMA = r','
-t_COLON = r':'
-t_SEMICOLON = r';'
-
-def t_VAR(t):
-    r'var'
-    return t
-
-def t_LET(t):
-    r'let'
-    return t
-
-def t_CONST(t):
-    r'const'
-    return t
-
-def t_WHILE(t):
-    r'while'
-    return t
-
-def t_FUNCTION(t):
-    r'function'
-    return t
-
-def t_RETURN(t):
-    r'return'
-    return t
-
-def t_ID(t):
-    r'[a-zA-Z_][a-zA-Z_0-9]*'
-    t.type = reserved.get(t.value, 'ID')  # Check for keywords
-    return t
-
-def t_NUMBER(t):
-    r'\d+\.\d*|\d+(\.\d*)?'  # Updated regex to handle decimal numbers
-    t.value = float(t.value)  # Convert number to float
-    return t
-
-def t_STRING(t):
-    r'"([^\\"]|\\.)*"'
-    return t
-
-def t_COMPARISON(t):
-    r'==|!=|<=|>=|<|>'
-    return t
-
-t_ignore = ' \t'
-
-def t_NEWLINE(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
-
-def t_error(t):
-    print(f"Illegal character '{t.value[0]}'")
-    t.lexer.skip(1)
-
-# --- Parser (grammar rules) ---
-
-def p_statement_return(t):
-    'statement : RETURN expr SEMICOLON'
-    print(f'Return statement: {t[2]}')
-
-def p_statement_var(t):
-    'statement : VAR ID ASSIGN expr SEMICOLON'
-    print(f'Var declaration with assignment: {t[2]} = {t[4]}')
-
-def p_statement_var_decl(t):
-    'statement : VAR ID SEMICOLON'
-    print(f'Var declaration without assignment: {t[2]}')
-
-def p_statement_let(t):
-    'statement : LET ID ASSIGN expr SEMICOLON'
-    print(f'Let declaration: {t[2]} = {t[4]}')
-
-def p_statement_const(t):
-    'statement : CONST ID ASSIGN expr SEMICOLON'
-    print(f'Const declaration: {t[2]} = {t[4]}')
-
-def p_statement_assign(t):
-    'statement : ID ASSIGN expr SEMICOLON'
-    print(f'{t[1]} = {t[3]}')
-
-def p_statement_expr(t):
-    'statement : expr SEMICOLON'
-    print(f'Expression: {t[1]}')
-
-def p_expr_binop(t):
-    '''expr : expr PLUS expr
-            | expr MINUS expr
-            | expr TIMES expr
-            | expr DIVIDE expr
-            | expr COMPARISON expr'''
-    t[0] = f"({t[1]} {t[2]} {t[3]})"
-
-def p_expr_number(t):
-    'expr : NUMBER'
-    t[0] = t[1]
-
-def p_expr_string(t):
-    'expr : STRING'
-    t[0] = t[1]
-
-def p_expr_id(t):
-    'expr : ID'
-    t[0] = t[1]
-
-def p_expr_parens(t):
-    'expr : LPAREN expr RPAREN'
-    t[0] = t[2]
-
-def p_expr_array(t):
-    'expr : LBRACKET elements RBRACKET'
-    t[0] = f"[{t[2]}]"
-
-def p_elements_single(t):
-    'elements : expr'
-    t[0] = f"{t[1]}"
-
-def p_elements_multiple(t):
-    'elements : expr COMMA elements'
-    t[0] = f"{t[1]}, {t[3]}"
-
-def p_expr_object(t):
-    'expr : LBRACE object_members RBRACE'
-    t[0] = f"{{{t[2]}}}"
-
-def p_object_members(t):
-    'object_members : ID COLON expr'
-    t[0] = f"{t[1]}: {t[3]}"
-
-def p_object_members_multiple(t):
-    'object_members : ID COLON expr COMMA object_members'
-    t[0] = f"{t[1]}: {t[3]}, {t[5]}"
-
-def p_statement_while(t):
-    'statement : WHILE LPAREN expr RPAREN LBRACE statements RBRACE'
-    print(f"While loop: while ({t[3]}) {{ {t[6]} }}")
-
-# Function declaration with body
-def p_statement_function(t):
-    'statement : FUNCTION ID LPAREN params RPAREN LBRACE statements RBRACE'
-    print(f"Function declaration: function {t[2]}({', '.join(t[4])}) {{ {t[7]} }}")
-
-# Function parameters (can be empty, single, or multiple)
-def p_params_empty(t):
-    'params : '
-    t[0] = []
-
-def p_params_single(t):
-    'params : ID'
-    t[0] = [t[1]]  # Store the parameter in a list
-
-def p_params_multiple(t):
-    'params : ID COMMA params'
-    t[0] = [t[1]] + t[3]  # Append the current parameter to the list of parameters
-
-# Recursively capture statements inside the function body
-def p_statements_single(t):
-    'statements : statement'
-    t[0] = f"{t[1]}"
-
-def p_statements_multiple(t):
-    'statements : statement statements'
-    t[0] = f"{t[1]} {t[2]}"
-
-def p_statements_empty(t):
-    'statements : '
-    t[0] = ''
-
-def p_error(t):
-    if t:
-        print(f"Syntax error at '{t.value}'")
-    else:
-        print("Syntax error at EOF")
-
-# --- Main ---
-lexer = lex.lex()
-parser = yacc.yacc()
-
-def parse_js_code(code):
-    lexer.input(code)
-    for token in lexer:
-        print(f'Token: {token.type}, Value: {token.value}')
-    
-    print("Parsing code...")
-    parser.parse(code)
-
-# Input loop
-while True:
-    try:
-        code = input("Enter JavaScript code: ")
-        if code.lower() == "exit":
-            break
-        parse_js_code(code)
-    except EOFError:
-        break
+import argparse
+import collections
+import functools
+import glob
+import os
+import sys
+import time
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from jsparse import chunked, expressions, parallel, preparse, sinks
+from jsparse import stats as stats_module
+from jsparse.cache import ParseCache, grammar_version
+from jsparse.diagnostics import syntax_error
+from jsparse.expressions import p_expr_binop, p_expr_id, p_expr_number, p_expr_parens
+from jsparse.lexer import FastLexer
+from jsparse.nodes import (
+    ArrayLiteral, Assign, Call, ExprStatement, FunctionDecl, ObjectLiteral, Program,
+    Return, String, VarDecl, While,
+)
+from jsparse.printer import describe
+from jsparse.split import split_statements
+
+# --- Lexer (token definitions) ---
+reserved = {
+    'var': 'VAR',
+    'let': 'LET',
+    'const': 'CONST',
+    'while': 'WHILE',
+    'if': 'IF',
+    'else': 'ELSE',
+    'function': 'FUNCTION',
+    'return': 'RETURN',  # Added return to reserved
+}
+
+tokens = [
+    'ID', 'NUMBER', 'STRING', 'ASSIGN', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE',
+    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET', 'COMMA', 'COLON', 'SEMICOLON', 'COMPARISON',
+    'AND', 'OR',
+] + list(reserved.values())
+
+# Regular expression rules for tokens
+t_ASSIGN = r'='
+t_PLUS = r'\+'
+t_MINUS = r'-'
+t_TIMES = r'\*'
+t_DIVIDE = r'/'
+t_LPAREN = r'\('
+t_RPAREN = r'\)'
+t_LBRACE = r'\{'
+t_RBRACE = r'\}'
+t_LBRACKET = r'\['
+t_RBRACKET = r'\]'
+t_COMMA = r','
+t_COLON = r':'
+t_SEMICOLON = r';'
+t_AND = r'&&'
+t_OR = r'\|\|'
+
+def t_ID(t):
+    r'[a-zA-Z_][a-zA-Z_0-9]*'
+    t.type = reserved.get(t.value, 'ID')  # Check for keywords
+    return t
+
+def t_NUMBER(t):
+    r'\d+\.\d*|\d+(\.\d*)?'  # Updated regex to handle decimal numbers
+    t.value = float(t.value)  # Convert number to float
+    return t
+
+def t_STRING(t):
+    r'"([^\\"]|\\.)*"'
+    return t
+
+def t_COMPARISON(t):
+    r'==|!=|<=|>=|<|>'
+    return t
+
+t_ignore = ' \t'
+
+def t_NEWLINE(t):
+    r'\n+'
+    t.lexer.lineno += len(t.value)
+
+def t_error(t):
+    print(f"Illegal character '{t.value[0]}'")
+    t.lexer.skip(1)
+
+# --- Parser (grammar rules) ---
+
+# Binary operators, numbers, identifiers and parentheses come from jsparse.expressions
+precedence = expressions.PRECEDENCE
+start = 'statement'
+
+def p_statement_return(t):
+    'statement : RETURN expr SEMICOLON'
+    t[0] = Return(t[2], t.lexpos(1))
+
+def p_statement_var(t):
+    'statement : VAR ID ASSIGN expr SEMICOLON'
+    t[0] = VarDecl('var', t[2], t[4], t.lexpos(1))
+
+def p_statement_var_decl(t):
+    'statement : VAR ID SEMICOLON'
+    t[0] = VarDecl('var', t[2], pos=t.lexpos(1))
+
+def p_statement_let(t):
+    'statement : LET ID ASSIGN expr SEMICOLON'
+    t[0] = VarDecl('let', t[2], t[4], t.lexpos(1))
+
+def p_statement_const(t):
+    'statement : CONST ID ASSIGN expr SEMICOLON'
+    t[0] = VarDecl('const', t[2], t[4], t.lexpos(1))
+
+def p_statement_assign(t):
+    'statement : ID ASSIGN expr SEMICOLON'
+    t[0] = Assign(t[1], t[3], t.lexpos(1))
+
+def p_statement_expr(t):
+    'statement : expr SEMICOLON'
+    t[0] = ExprStatement(t[1], t[1].pos)
+
+def p_expr_string(t):
+    'expr : STRING'
+    t[0] = String(t[1], t.lexpos(1))
+
+def p_expr_call(t):
+    'expr : ID LPAREN arguments RPAREN'
+    t[0] = Call(t[1], t[3], t.lexpos(1))
+
+def p_arguments_empty(t):
+    'arguments : '
+    t[0] = []
+
+def p_arguments_list(t):
+    'arguments : elements'
+    t[0] = t[1]
+
+def p_expr_array(t):
+    'expr : LBRACKET elements RBRACKET'
+    t[0] = ArrayLiteral(t[2], t.lexpos(1))
+
+# Lists are built left-recursively and appended to in place, so long literals
+# take linear time and constant parser stack depth
+def p_elements_single(t):
+    'elements : expr'
+    t[0] = [t[1]]
+
+def p_elements_multiple(t):
+    'elements : elements COMMA expr'
+    t[1].append(t[3])
+    t[0] = t[1]
+
+def p_expr_object(t):
+    'expr : LBRACE object_members RBRACE'
+    t[0] = ObjectLiteral(t[2], t.lexpos(1))
+
+def p_object_members(t):
+    'object_members : ID COLON expr'
+    t[0] = [(t[1], t[3])]
+
+def p_object_members_multiple(t):
+    'object_members : object_members COMMA ID COLON expr'
+    t[1].append((t[3], t[5]))
+    t[0] = t[1]
+
+def p_statement_while(t):
+    'statement : WHILE LPAREN expr RPAREN LBRACE statements RBRACE'
+    t[0] = While(t[3], t[6], t.lexpos(1))
+
+# Function declaration with body
+def p_statement_function(t):
+    'statement : FUNCTION ID LPAREN params RPAREN LBRACE statements RBRACE'
+    t[0] = FunctionDecl(t[2], t[4], t[7], t.lexpos(1))
+
+# Function parameters (can be empty, single, or multiple)
+def p_params_empty(t):
+    'params : '
+    t[0] = []
+
+def p_params_list(t):
+    'params : param_list'
+    t[0] = t[1]
+
+def p_param_list_single(t):
+    'param_list : ID'
+    t[0] = [t[1]]  # Store the parameter in a list
+
+def p_param_list_multiple(t):
+    'param_list : param_list COMMA ID'
+    t[1].append(t[3])  # Append the current parameter to the list of parameters
+    t[0] = t[1]
+
+# Capture the statements inside a function or while body, in source order
+def p_statements_multiple(t):
+    'statements : statements statement'
+    if t[2] is not None:  # Skipped by error recovery
+        t[1].append(t[2])
+    t[0] = t[1]
+
+def p_statements_empty(t):
+    'statements : '
+    t[0] = []
+
+# Panic-mode recovery: after a syntax error the parser skips to the next ';',
+# or to the '}' closing the enclosing while or function body, and carries on
+def p_statement_error(t):
+    'statement : error SEMICOLON'
+    t[0] = None
+
+def p_statement_while_error(t):
+    'statement : WHILE LPAREN expr RPAREN LBRACE statements error RBRACE'
+    t[0] = While(t[3], t[6], t.lexpos(1))
+
+def p_statement_function_error(t):
+    'statement : FUNCTION ID LPAREN params RPAREN LBRACE statements error RBRACE'
+    t[0] = FunctionDecl(t[2], t[4], t[7], t.lexpos(1))
+
+# Parsing gives up after this many errors, so a garbage file cannot keep recovery busy
+MAX_ERRORS = 100
+
+class TooManyErrors(Exception):
+    pass
+
+class _ErrorState:
+    """The diagnostics of one parse_tokens() call, which gives up after limit of them."""
+    __slots__ = ('errors', 'limit')
+
+    def __init__(self, limit):
+        self.errors = []
+        self.limit = limit
+
+def p_error(t):
+    state = parser.error_state
+    state.errors.append(syntax_error(parser, t))
+    if len(state.errors) >= state.limit:
+        raise TooManyErrors
+
+# --- Main ---
+lexer = lex.lex()
+parser = yacc.yacc(debug=False, tabmodule='jsparse.tables.parsetab_all')
+parser.error_state = None  # _ErrorState of the parse_tokens() call in progress
+
+# tokenize() uses the single-regex scanner built from the same rules as the PLY lexer above.
+# Identifiers are interned, so every use of a name in a tree shares one string
+fast_lexer = FastLexer(
+    [('ID', t_ID.__doc__), ('NUMBER', t_NUMBER.__doc__), ('STRING', t_STRING.__doc__),
+     ('COMPARISON', t_COMPARISON.__doc__), ('NEWLINE', t_NEWLINE.__doc__)]
+    + [(name, globals()[f't_{name}']) for name in tokens if isinstance(globals().get(f't_{name}'), str)],
+    reserved=reserved, ignore=t_ignore, converters={'NUMBER': float, 'ID': sys.intern})
+
+def tokenize(code, chunked_lexer=None, report=True):
+    """Lex the whole input once and return the tokens as a TokenStream.
+
+    Literal values are only sliced out of code, and numbers converted, when a grammar action reads them.
+    A jsparse.chunked.ChunkedLexer given as chunked_lexer lexes large inputs in parallel chunks.
+    report=False leaves illegal characters unprinted; they are in the lexer's errors either way.
+    """
+    if chunked_lexer is not None:
+        return chunked_lexer.tokenize_stream(code, report=report)
+    return fast_lexer.tokenize_stream(code, report=report)
+
+def token_feed(token_buffer):
+    """Return a PLY tokenfunc that replays a token buffer, then signals end of input."""
+    return functools.partial(next, iter(token_buffer), None)
+
+# Result of parse_js_code(): the Program node, the token buffer, the syntax error messages
+# and the illegal characters the lexer skipped, as (character, offset) pairs
+ParseResult = collections.namedtuple('ParseResult', 'tree tokens errors illegal')
+
+def parse_tokens(token_buffer, max_errors=MAX_ERRORS):
+    """Parse one statement from already-lexed tokens and return (tree, syntax errors).
+
+    The errors are Diagnostic objects. After max_errors of them the statement is abandoned and tree is None.
+    """
+    state = _ErrorState(max_errors)
+    outer, parser.error_state = parser.error_state, state
+    try:
+        tree = parser.parse(lexer=fast_lexer, tokenfunc=token_feed(token_buffer))
+    except TooManyErrors:
+        tree = None
+    finally:
+        parser.error_state = outer
+    errors = state.errors
+    if errors and errors[-1].found == 'EOF' and token_buffer:
+        last = token_buffer[-1]
+        errors[-1] = errors[-1]._replace(lineno=last.lineno, lexpos=last.lexpos, column=last.column)
+    return tree, errors
+
+def preparse_statement(token_buffer, first, end, max_errors=MAX_ERRORS):
+    """Parse the while or function statement token_buffer[first:end] with its body left as a LazyBody.
+
+    Returns (tree, syntax errors) like parse_tokens(). Only the header is
+    parsed now, followed by the body's closing brace. A well-formed function
+    header is read without the parser, as p_statement_function would build it.
+    """
+    brace = preparse.body_start(token_buffer, first, end)
+    closing = token_buffer[end - 1]
+    if brace is None or closing.type != 'RBRACE':
+        return parse_tokens(token_buffer[first:end], max_errors)
+    body = preparse.LazyBody(token_buffer[brace + 1:end - 1], parse_program_tokens,
+                             (token_buffer[brace].lexpos + 1, closing.lexpos))
+    header = preparse.function_header(token_buffer[first:brace + 1])
+    if header is not None:
+        name, params = header
+        return FunctionDecl(name, params, body, token_buffer[first].lexpos), []
+    tree, errors = parse_tokens(list(token_buffer[first:brace + 1]) + [closing], max_errors)
+    if tree is not None:
+        tree.body = body
+    return tree, errors
+
+def parse_program_tokens(token_buffer, max_errors=MAX_ERRORS, stats=None, lazy_bodies=False):
+    """Parse a whole program statement by statement and return (Program, syntax errors).
+
+    Parsing stops once max_errors diagnostics have been collected. A Stats
+    object given as stats records the split and parse phases and every reduction.
+    With lazy_bodies, top-level while and function bodies are only parsed
+    when first read; see jsparse/preparse.py.
+    """
+    with stats_module.phase(stats, 'split'):
+        spans, tail = split_statements(token_buffer)
+    if tail < len(token_buffer):
+        spans.append((tail, len(token_buffer)))  # Unfinished last statement, reported as an error
+    body = []
+    errors = []
+    with stats_module.phase(stats, 'parse'), stats_module.instrument(stats, parser):
+        for first, end in spans:
+            if lazy_bodies and token_buffer[first].type in ('WHILE', 'FUNCTION'):
+                tree, statement_errors = preparse_statement(token_buffer, first, end, max_errors - len(errors))
+            else:
+                tree, statement_errors = parse_tokens(token_buffer[first:end], max_errors - len(errors))
+            if tree is not None:
+                body.append(tree)
+            errors.extend(statement_errors)
+            if len(errors) >= max_errors:
+                break
+    return Program(body, 0), errors
+
+GRAMMAR_VERSION = grammar_version(__file__)
+
+def _print_tokens(token_buffer):
+    for token in token_buffer:
+        print(f'Token: {token.type}, Value: {token.value}')
+    print("Parsing code...")
+
+def parse_js_code(code, verbose=True, cache=None, stats=None, chunked_lexer=None, lazy_bodies=False, report=True):
+    """Parse a JavaScript program into a Program node; verbose echoes the tokens and the result.
+
+    With a ParseCache, unchanged inputs are served from disk without lexing or parsing.
+    A jsparse.stats.Stats object given as stats collects timings and counts for the call.
+    chunked_lexer and report are passed on to tokenize(), lazy_bodies to parse_program_tokens().
+    The cache is not used with lazy_bodies, since storing the tree would parse every body.
+    """
+    entry = None
+    if lazy_bodies:
+        cache = None
+    if cache is not None:
+        with stats_module.phase(stats, 'cache'):
+            key = cache.key(code, 'ALL')
+            entry = cache.get(key)
+    if entry is not None:
+        tree, token_buffer, errors, illegal = entry
+        if verbose:
+            _print_tokens(token_buffer)
+    else:
+        with stats_module.phase(stats, 'lex'):
+            token_buffer = tokenize(code, chunked_lexer, report)
+        illegal = list((fast_lexer if chunked_lexer is None else chunked_lexer).errors)
+        if verbose:
+            _print_tokens(token_buffer)
+        tree, errors = parse_program_tokens(token_buffer, stats=stats, lazy_bodies=lazy_bodies)
+        if cache is not None:
+            with stats_module.phase(stats, 'cache'):
+                cache.put(key, (tree, token_buffer, errors, illegal))
+    if stats is not None:
+        stats.files += 1
+        stats.count_tokens(token_buffer)
+    if verbose:
+        for error in errors:
+            print(error)
+        if tree.body:
+            print(describe(tree))
+    return ParseResult(tree, token_buffer, errors, illegal)
+
+# --- Batch mode ---
+
+def find_sources(patterns):
+    """Expand files, directories (searched for *.js) and glob patterns into a path list."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.js'))
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return paths
+
+def parse_files(paths, jobs=1, cache=None, sink=None, verbose=False, log=None, stats=None, chunked_lexer=None):
+    """Parse every file in one call each, write the results to sink and print the totals to log.
+
+    A status line is printed for every file with verbose, otherwise only for files with syntax errors
+    or illegal characters; both count as errors.
+    With jobs > 1 the files are spread over a process pool; results still come out in input order.
+    Otherwise a chunked_lexer lexes each large file in parallel chunks.
+    With a jsparse.stats.Stats object, every phase is profiled into it and its report printed at the end.
+    """
+    sink = sink or sinks.NullSink()
+    log = log or sys.stdout
+    keep_tree = not isinstance(sink, sinks.NullSink)
+    total_bytes = 0
+    failed = 0
+    start = time.perf_counter()
+    if jobs > 1:
+        results = parallel.parse_files(
+            paths, workers=jobs, keep_tree=keep_tree, cache_dir=cache and cache.directory,
+            cache_bytes=cache and cache.max_bytes, collect_stats=stats is not None)
+    else:
+        parse = functools.partial(parse_js_code, cache=cache, chunked_lexer=chunked_lexer, report=False)
+        results = (parallel.parse_file(path, parse, keep_tree, stats) for path in paths)
+    for result in results:
+        if jobs > 1:
+            if stats is not None:
+                stats.merge(result.stats)
+            # The workers have caches of their own; count their hits and misses on this one
+            if result.cache_hit is not None:
+                cache.hits += result.cache_hit
+                cache.misses += not result.cache_hit
+        with stats_module.phase(stats, 'output'):
+            sink.write(result)
+        total_bytes += result.size
+        if result.exception:
+            status = f'failed: {result.exception}'
+        elif result.errors or result.illegal:
+            status = f'{len(result.errors)} syntax error(s), {len(result.illegal)} illegal character(s)'
+        else:
+            status = 'ok'
+        if result.exception or result.errors or result.illegal:
+            failed += 1
+        elif not verbose:
+            continue
+        print(f"{result.path}: {status} ({result.size} bytes, {result.seconds * 1000:.2f} ms)", file=log)
+        for char, pos, line, column in result.illegal:
+            print(f"  line {line}, column {column}: Illegal character '{char}'", file=log)
+        for error in result.errors:
+            print(f"  {error.describe()}", file=log)
+    with stats_module.phase(stats, 'output'):
+        sink.close()
+    elapsed = time.perf_counter() - start
+    rate = elapsed or 1e-9
+    print(f"Parsed {len(paths)} file(s), {total_bytes / 1e6:.2f} MB in {elapsed:.3f} s "
+          f"({len(paths) / rate:.1f} files/s, {total_bytes / 1e6 / rate:.2f} MB/s), {failed} with errors", file=log)
+    if cache is not None:
+        if jobs > 1:
+            cache.trim()
+        counts = cache.stats()
+        print(f"Cache: {counts['hits']} hit(s), {counts['misses']} miss(es), {counts['evictions']} eviction(s), "
+              f"{counts['entries']} entries, {counts['bytes'] / 1e6:.2f} MB", file=log)
+    if stats is not None:
+        print(stats.report(), file=log)
+    return failed
+
+# --- Interactive mode ---
+
+def repl():
+    while True:
+        try:
+            code = input("Enter JavaScript code: ")
+            if code.lower() == "exit":
+                break
+            parse_js_code(code)
+        except EOFError:
+            break
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Parse JavaScript with the AFLL grammar.')
+    arg_parser.add_argument('sources', nargs='*',
+                            help='files, directories or glob patterns to parse; starts the prompt if omitted')
+    arg_parser.add_argument('-j', '--jobs', type=int, default=1,
+                            help='number of worker processes for batch mode (default: 1)')
+    arg_parser.add_argument('--lex-jobs', type=int, default=1, metavar='N',
+                            help='with -j 1, lex each large file in chunks on N worker processes (default: 1)')
+    arg_parser.add_argument('--cache', metavar='DIR',
+                            help='reuse parse results stored in DIR for unchanged files')
+    arg_parser.add_argument('--cache-size', type=float, default=256, metavar='MB',
+                            help='evict least recently used cache entries above this size (default: 256)')
+    arg_parser.add_argument('--format', choices=('none', 'ndjson', 'binary', 'js', 'minjs'), default='none',
+                            help='write tokens, trees and errors of every file in this format, or the code of '
+                                 'every file without errors, pretty-printed or minified (default: none)')
+    arg_parser.add_argument('-o', '--output', default='-', metavar='FILE',
+                            help='file for --format output; - writes to stdout (default: -)')
+    arg_parser.add_argument('-v', '--verbose', action='store_true',
+                            help='print a status line for every file, not only those with errors')
+    arg_parser.add_argument('--stats', action='store_true',
+                            help='print time per phase, token counts, grammar rule reductions and peak memory')
+    args = arg_parser.parse_args(argv)
+    if not args.sources:
+        repl()
+        return 0
+    paths = find_sources(args.sources)
+    cache = None
+    if args.cache:
+        cache = ParseCache(args.cache, int(args.cache_size * 1024 * 1024), GRAMMAR_VERSION)
+    log = sys.stdout
+    if args.format == 'none':
+        stream = None
+    elif args.output == '-':
+        stream = sys.stdout.buffer
+        log = sys.stderr  # Keep stdout machine-readable
+    else:
+        stream = open(args.output, 'wb')
+    chunked_lexer = chunked.ChunkedLexer(args.lex_jobs) if args.lex_jobs > 1 and args.jobs <= 1 else None
+    try:
+        sink = sinks.open_sink(args.format, stream)
+        failed = parse_files(paths, jobs=args.jobs, cache=cache, sink=sink, verbose=args.verbose, log=log,
+                             stats=stats_module.Stats() if args.stats else None, chunked_lexer=chunked_lexer)
+    finally:
+        if chunked_lexer is not None:
+            chunked_lexer.close()
+        if stream is not None and stream is not sys.stdout.buffer:
+            stream.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,43 @@
+"""Cold vs warm batch parse of an unchanged tree with the on-disk ParseCache."""
+import argparse
+import os
+import tempfile
+import time
+
+from common import load_all
+from jsparse import parallel
+from jsparse.cache import ParseCache
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--files', type=int, default=300)
+    arg_parser.add_argument('--elements', type=int, default=300)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(directory, f'file{i:05d}.js')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'var data{i} = [' + ', '.join(f'x{j} * {i} + {j}' for j in range(args.elements)) + '];\n')
+            paths.append(path)
+        cache_dir = os.path.join(directory, 'cache')
+
+        timings = []
+        for label in ('no cache', 'cold cache', 'warm cache'):
+            cache = None if label == 'no cache' else ParseCache(cache_dir, version=ALL.GRAMMAR_VERSION)
+            start = time.perf_counter()
+            for path in paths:
+                parallel.parse_file(path, lambda code, verbose: ALL.parse_js_code(code, verbose, cache))
+            timings.append((label, time.perf_counter() - start, cache))
+
+    base = timings[0][1]
+    for label, elapsed, cache in timings:
+        hits = '' if cache is None else f"  hits={cache.hits} misses={cache.misses}"
+        print(f"{label:11} {elapsed:7.3f} s  {base / elapsed:5.1f}x{hits}")
+
+
+if __name__ == '__main__':
+    main()
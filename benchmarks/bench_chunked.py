@@ -0,0 +1,51 @@
+"""Lexing one large file sequentially against jsparse.chunked.ChunkedLexer with 1, 2, 4... workers.
+
+The input is the corpus generators' output concatenated and repeated up
+to --mb megabytes. The workers start, and are warmed up with one input,
+before timing begins. Every run checks that the chunked token stream and
+illegal characters are identical to the sequential lex, and reports how
+many cuts had to be dropped because they fell inside a token.
+"""
+import argparse
+import os
+
+import corpus
+from common import best_of, load_all
+from jsparse.chunked import ChunkedLexer
+
+
+def same_tokens(left, right):
+    return left.codes == right.codes and left.starts == right.starts and left.lengths == right.lengths
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--mb', type=float, default=20, help='input size in MB (default: 20)')
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='largest worker count to try (default: CPU count)')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    unit = ''.join(corpus.source(corpus.generate(name, 2000)) for name in sorted(corpus.GENERATORS))
+    code = unit * max(1, round(args.mb * 1e6 / len(unit)))
+    megabytes = len(code) / 1e6
+    expected = ALL.fast_lexer.tokenize_stream(code, report=False)
+    expected_errors = ALL.fast_lexer.errors
+    print(f'input: {megabytes:.1f} MB, {len(expected)} tokens, {os.cpu_count()} CPU(s)')
+    seconds = best_of(lambda: ALL.fast_lexer.tokenize_stream(code, report=False), args.repeat)
+    print(f"{'sequential':>12} {seconds:8.3f} s {megabytes / seconds:8.1f} MB/s")
+    workers = 1
+    while workers <= args.workers:
+        with ChunkedLexer(workers) as chunked_lexer:
+            chunked_lexer.tokenize_stream(code[:1 << 20], report=False)
+            stream = chunked_lexer.tokenize_stream(code, report=False)
+            same = same_tokens(stream, expected) and chunked_lexer.errors == expected_errors
+            seconds = best_of(lambda: chunked_lexer.tokenize_stream(code, report=False), args.repeat)
+            print(f"{f'{workers} worker(s)':>12} {seconds:8.3f} s {megabytes / seconds:8.1f} MB/s "
+                  f"{'identical' if same else 'MISMATCH'}, {chunked_lexer.merged_cuts} cut(s) dropped")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Throughput of jsparse.codegen on large bundles, pretty-printed and minified.
+
+A bundle is every corpus generator's output for --statements statements,
+concatenated into one program. It is parsed once; the timings are of
+generating code from the tree into a file, reported in MB of output and
+MB of bundle source per second. The output of each style is parsed again
+and must give the same tree without errors.
+"""
+import argparse
+import os
+import tempfile
+
+import corpus
+from common import best_of, load_all
+from jsparse.codegen import write_code
+from jsparse.printer import to_source
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--statements', type=int, default=5000,
+                            help='statements per corpus generator in the bundle (default: 5000)')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    bundle = ''.join(corpus.source(corpus.generate(name, args.statements)) for name in sorted(corpus.GENERATORS))
+    result = ALL.parse_js_code(bundle, verbose=False)
+    assert not result.errors, result.errors[:3]
+    expected = to_source(result.tree)
+    source_mb = len(bundle.encode('utf-8')) / 1e6
+    print(f'bundle: {source_mb:.2f} MB, {len(result.tree.body)} statements')
+    print(f"{'style':7} {'seconds':>8} {'output MB':>10} {'output MB/s':>12} {'source MB/s':>12} round trip")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bundle.js')
+        for style, minify in (('pretty', False), ('minify', True)):
+            def run():
+                with open(path, 'w', encoding='utf-8') as out:
+                    write_code(result.tree, out.write, minify)
+            seconds = best_of(run, args.repeat)
+            with open(path, encoding='utf-8') as f:
+                code = f.read()
+            output_mb = len(code.encode('utf-8')) / 1e6
+            reparsed = ALL.parse_js_code(code, verbose=False)
+            same = not reparsed.errors and to_source(reparsed.tree) == expected
+            print(f'{style:7} {seconds:8.3f} {output_mb:10.2f} {output_mb / seconds:12.1f} '
+                  f"{source_mb / seconds:12.1f} {'ok' if same else 'MISMATCH'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""Loop-heavy programs run by a naive tree-walking interpreter and by jsparse.vm compiled closures."""
+import argparse
+import operator
+import time
+
+from common import load_all
+from jsparse import vm
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    Number, ObjectLiteral, Return, String, VarDecl, While,
+)
+
+PROGRAMS = {
+    'counting loop': '''
+        var i = 0; var total = 0;
+        while (i < {n}) {{ total = total + i * 2 - i / 2; i = i + 1; }}
+        return total;''',
+    'nested loops': '''
+        var i = 0; var hits = 0;
+        while (i < {n} / 100) {{
+            var j = 0;
+            while (j < 100) {{ hits = hits + (i < j && j < 90 || i == j); j = j + 1; }}
+            i = i + 1;
+        }}
+        return hits;''',
+    'calls in a loop': '''
+        function fib(n) {{ var a = 0; var b = 1; var k = 0; while (k < n) {{ var t = a + b; a = b; b = t; k = k + 1; }} return a; }}
+        var i = 0; var total = 0;
+        while (i < {n} / 20) {{ total = total + fib(20); i = i + 1; }}
+        return total;''',
+    'recursion': '''
+        function f(n) {{ return (n < 2 && 1) || f(n - 1) + f(n - 2); }}
+        return f({depth});''',
+}
+
+
+class _ReturnSignal(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class TreeWalker:
+    """Evaluate nodes directly with recursive calls and a dict per scope."""
+
+    OPERATORS = {
+        '+': vm._add, '-': operator.sub, '*': operator.mul, '/': vm._divide,
+        '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+        '==': operator.eq, '!=': operator.ne,
+    }
+
+    def __init__(self):
+        self.globals = {}
+
+    def run(self, program):
+        try:
+            self.block(program.body, self.globals)
+        except _ReturnSignal as signal:
+            return signal.value
+
+    def block(self, body, scope):
+        for statement in body:
+            if type(statement) is FunctionDecl:
+                scope[statement.name] = statement
+        for statement in body:
+            self.statement(statement, scope)
+
+    def lookup(self, name, scope):
+        return scope[name] if name in scope else self.globals[name]
+
+    def assign(self, name, value, scope):
+        (scope if name in scope else self.globals)[name] = value
+
+    def statement(self, node, scope):
+        kind = type(node)
+        if kind is VarDecl:
+            scope[node.name] = None if node.init is None else self.expression(node.init, scope)
+        elif kind is Assign:
+            self.assign(node.name, self.expression(node.value, scope), scope)
+        elif kind is ExprStatement:
+            self.expression(node.expr, scope)
+        elif kind is Return:
+            raise _ReturnSignal(self.expression(node.value, scope))
+        elif kind is While:
+            while vm._truthy(self.expression(node.test, scope)):
+                self.block(node.body, scope)
+
+    def expression(self, node, scope):
+        kind = type(node)
+        if kind is Number:
+            return node.value
+        if kind is Identifier:
+            return self.lookup(node.name, scope)
+        if kind is String:
+            return vm._string_value(node.value)
+        if kind is BinOp:
+            left = self.expression(node.left, scope)
+            if node.op == '&&':
+                return self.expression(node.right, scope) if vm._truthy(left) else left
+            if node.op == '||':
+                return left if vm._truthy(left) else self.expression(node.right, scope)
+            right = self.expression(node.right, scope)
+            return self.OPERATORS[node.op](left, right)
+        if kind is Call:
+            function = self.lookup(node.callee, scope)
+            args = [self.expression(arg, scope) for arg in node.args]
+            local_scope = dict(zip(function.params, args + [None] * len(function.params)))
+            try:
+                self.block(function.body, local_scope)
+            except _ReturnSignal as signal:
+                return signal.value
+            return None
+        if kind is ArrayLiteral:
+            return [self.expression(element, scope) for element in node.elements]
+        if kind is ObjectLiteral:
+            return {key: self.expression(value, scope) for key, value in node.properties}
+        raise TypeError(kind.__name__)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--iterations', type=int, default=100000)
+    arg_parser.add_argument('--depth', type=int, default=18)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    for label, template in PROGRAMS.items():
+        result = ALL.parse_js_code(template.format(n=args.iterations, depth=args.depth), verbose=False)
+        assert not result.errors, result.errors
+
+        start = time.perf_counter()
+        walked = TreeWalker().run(result.tree)
+        walk_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        function = vm.compile_program(result.tree)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        executed = vm.run(function, max_steps=None)
+        run_time = time.perf_counter() - start
+
+        assert walked == executed, (label, walked, executed)
+        print(f"{label:16} tree walk {walk_time:7.3f} s  compiled {run_time:7.3f} s"
+              f" (+{compile_time * 1e3:.2f} ms compile)  {walk_time / run_time:4.1f}x  result {vm.to_display(executed)}")
+
+
+if __name__ == '__main__':
+    main()
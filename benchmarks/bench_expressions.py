@@ -0,0 +1,140 @@
+"""Reductions and time per expression: layered rules vs the shared precedence table.
+
+'layered' is the expression/term/factor style While Loop Declaration.py used
+before, extended to every operator level; 'no precedence' is the old ALL.py
+rule that lumped all operators together; 'precedence' is jsparse.expressions.
+Trees are checked against the layered grammar, which is unambiguous.
+"""
+import argparse
+import random
+
+import ply.yacc as yacc
+
+from common import best_of, load_all
+from jsparse import expressions
+from jsparse.nodes import BinOp, Identifier, Number
+
+OPERATORS = ['||', '&&', '<', '==', '+', '-', '*', '/']
+TOKENS = ('ID', 'NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'COMPARISON', 'AND', 'OR', 'LPAREN', 'RPAREN')
+
+
+class LayeredGrammar:
+    tokens = TOKENS
+    start = 'or_expr'
+
+    def p_binop(self, p):
+        '''or_expr : or_expr OR and_expr
+                   | and_expr
+           and_expr : and_expr AND comparison
+                    | comparison
+           comparison : comparison COMPARISON additive
+                      | additive
+           additive : additive PLUS term
+                    | additive MINUS term
+                    | term
+           term : term TIMES factor
+                | term DIVIDE factor
+                | factor'''
+        p[0] = BinOp(p[2], p[1], p[3]) if len(p) == 4 else p[1]
+
+    def p_factor_number(self, p):
+        'factor : NUMBER'
+        p[0] = Number(p[1])
+
+    def p_factor_id(self, p):
+        'factor : ID'
+        p[0] = Identifier(p[1])
+
+    def p_factor_parens(self, p):
+        'factor : LPAREN or_expr RPAREN'
+        p[0] = p[2]
+
+    def p_error(self, p):
+        raise SyntaxError(f'unexpected {p!r}')
+
+
+class NoPrecedenceGrammar:
+    tokens = TOKENS
+    start = 'expr'
+    p_expr_binop = staticmethod(expressions.p_expr_binop)
+    p_expr_number = staticmethod(expressions.p_expr_number)
+    p_expr_id = staticmethod(expressions.p_expr_id)
+    p_expr_parens = staticmethod(expressions.p_expr_parens)
+    p_error = LayeredGrammar.p_error
+
+
+class PrecedenceGrammar(NoPrecedenceGrammar):
+    precedence = expressions.PRECEDENCE
+
+
+def build(grammar):
+    return yacc.yacc(module=grammar, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+
+def count_reductions(parser, token_lists):
+    """Parse every token list with each grammar action wrapped by a counter."""
+    count = 0
+    originals = [production.callable for production in parser.productions]
+
+    def counting(action):
+        def wrapper(p):
+            nonlocal count
+            count += 1
+            action(p)
+        return wrapper
+
+    for production in parser.productions:
+        if production.callable:
+            production.callable = counting(production.callable)
+    try:
+        for tokens in token_lists:
+            parser.parse(tokenfunc=_feed(tokens))
+    finally:
+        for production, action in zip(parser.productions, originals):
+            production.callable = action
+    return count
+
+
+def _feed(tokens):
+    remaining = iter(tokens)
+    return lambda: next(remaining, None)
+
+
+def random_expression(rng, operators):
+    text = rng.choice(['x', 'y', 'total', '1', '2.5', '42'])
+    for _ in range(operators):
+        operand = rng.choice(['x', 'y', 'total', '1', '2.5', '42'])
+        if rng.random() < 0.1:
+            operand = f'({operand} {rng.choice(OPERATORS)} {rng.choice(["a", "3"])})'
+        text += f' {rng.choice(OPERATORS)} {operand}'
+    return text
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--expressions', type=int, default=2000)
+    arg_parser.add_argument('--operators', type=int, default=12)
+    arg_parser.add_argument('--seed', type=int, default=1)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    rng = random.Random(args.seed)
+    texts = [random_expression(rng, args.operators) for _ in range(args.expressions)]
+    token_lists = [ALL.tokenize(text) for text in texts]
+    operator_count = sum(1 for tokens in token_lists for token in tokens
+                         if token.type in ('PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'COMPARISON', 'AND', 'OR'))
+
+    parsers = [('layered', build(LayeredGrammar())),
+               ('no precedence', build(NoPrecedenceGrammar())),
+               ('precedence', build(PrecedenceGrammar()))]
+    reference = [parsers[0][1].parse(tokenfunc=_feed(tokens)) for tokens in token_lists]
+    for label, parser in parsers:
+        wrong = sum(parser.parse(tokenfunc=_feed(tokens)) != tree for tokens, tree in zip(token_lists, reference))
+        reductions = count_reductions(parser, token_lists)
+        elapsed = best_of(lambda: [parser.parse(tokenfunc=_feed(tokens)) for tokens in token_lists], 3)
+        print(f"{label:13} {len(parser.action):3} states  {reductions / operator_count:5.2f} reductions/operator"
+              f"  {elapsed / len(texts) * 1e6:7.1f} us/expression  {wrong} wrong trees")
+
+
+if __name__ == '__main__':
+    main()
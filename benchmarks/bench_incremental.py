@@ -0,0 +1,61 @@
+"""Per-keystroke latency of jsparse.incremental on a large file, compared with a full reparse."""
+import argparse
+import random
+import time
+
+from common import load_all, quiet
+from jsparse.incremental import parse_document
+
+
+def make_program(lines):
+    out = []
+    for i in range(lines):
+        kind = i % 4
+        if kind == 0:
+            out.append(f'var x{i} = {i} + y * 2;')
+        elif kind == 1:
+            out.append(f'let o{i} = {{id: {i}, tags: [1, 2, 3]}};')
+        elif kind == 2:
+            out.append(f'while (a < {i}) {{ a = a + 1; }}')
+        else:
+            out.append(f'function f{i}(a, b) {{ return a * b; }}')
+    return '\n'.join(out) + '\n'
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=50000)
+    arg_parser.add_argument('--edits', type=int, default=200)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    rng = random.Random(0)
+    text = make_program(args.lines)
+
+    start = time.perf_counter()
+    doc = parse_document(text, ALL)
+    full = time.perf_counter() - start
+
+    latencies = []
+    reparsed = 0
+    with quiet():
+        for _ in range(args.edits):
+            # Type one identifier character somewhere in the file, like a keystroke
+            offset = doc.text.index(' = ', rng.randrange(len(doc.text) - 10))
+            start = time.perf_counter()
+            doc = doc.edit(offset, 0, 'z')
+            latencies.append(time.perf_counter() - start)
+            reparsed += doc.reparsed
+        check = parse_document(doc.text, ALL)
+    assert doc.statements == check.statements
+
+    latencies.sort()
+    print(f"{args.lines} lines, {len(text) / 1e6:.2f} MB, {len(doc.segments)} statements")
+    print(f"full parse:             {full * 1000:9.1f} ms")
+    print(f"edit latency median:    {latencies[len(latencies) // 2] * 1000:9.3f} ms")
+    print(f"edit latency max:       {latencies[-1] * 1000:9.3f} ms")
+    print(f"statements reparsed:    {reparsed / len(latencies):9.1f} per edit")
+
+
+if __name__ == '__main__':
+    main()
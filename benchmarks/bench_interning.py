@@ -0,0 +1,99 @@
+"""Memory and parse time of the array and object modes with and without a LiteralInterner.
+
+Each input is a list of declarations parsed with one jsparse.constructs.parse()
+call each:
+  matrix   arrays of 0/1 pairs, as in generated lookup tables
+  config   objects repeating a few option records and coordinate arrays
+  arrays   the random arrays corpus, with little repetition
+  objects  the random objects corpus, with little repetition
+Memory is what tracemalloc sees the declarations retain, plus the table for
+"kept" (interner still alive). The interner's own saved_bytes estimate and hit
+rate are printed alongside. Every interned result is checked against the plain
+one after thawing tuples and mappings back into lists and dicts.
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+import types
+
+import corpus
+from common import best_of
+from jsparse import constructs
+from jsparse.interning import LiteralInterner
+
+
+def matrix(rng, count):
+    return [f"var m{i} = [{', '.join(f'[{rng.randrange(2)}, {rng.randrange(2)}]' for _ in range(50))}];"
+            for i in range(count)]
+
+
+def config(rng, count):
+    options = ['{retries: 3, timeout: 30}', '{retries: 5, timeout: 60}', '{enabled: true, level: "debug"}']
+    points = ['[0, 0]', '[0, 1]', '[1, 0]', '[1, 1]']
+    statements = []
+    for i in range(count):
+        members = [f'k{j}: {{options: {rng.choice(options)}, origin: {rng.choice(points)}, '
+                   f'name: "service", tags: ["a", "b"]}}' for j in range(10)]
+        statements.append(f"const c{i} = {{{', '.join(members)}}};")
+    return statements
+
+
+def thaw(value):
+    """Return value with tuples and mappingproxies turned back into lists and dicts."""
+    if isinstance(value, (tuple, list)):
+        return [thaw(item) for item in value]
+    if isinstance(value, (types.MappingProxyType, dict)):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
+
+
+def parse_all(mode, statements, interner):
+    return [constructs.parse(mode, statement, report=False, interner=interner).tree for statement in statements]
+
+
+def retained(build):
+    """Return (result of build(), bytes it retains)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--count', type=int, default=2000, help='declarations per input (default: 2000)')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    inputs = [('matrix', 'array', matrix(rng, args.count)), ('config', 'object', config(rng, args.count)),
+              ('arrays', 'array', corpus.generate('arrays', args.count).mode_statements),
+              ('objects', 'object', corpus.generate('objects', args.count).mode_statements)]
+    print(f"{'input':8} {'plain ms':>9} {'intern ms':>10} {'plain MB':>9} {'kept MB':>8} {'dropped MB':>11} "
+          f"{'saved MB':>9} {'hit rate':>9} same")
+    for name, mode, statements in inputs:
+        constructs.get_parser(mode)
+        plain_seconds = best_of(lambda: parse_all(mode, statements, None), args.repeat)
+        intern_seconds = best_of(lambda: parse_all(mode, statements, LiteralInterner()), args.repeat)
+        plain, plain_bytes = retained(lambda: parse_all(mode, statements, None))
+        interner = LiteralInterner()
+        interned, kept_bytes = retained(lambda: (parse_all(mode, statements, interner), interner))
+        interned = interned[0]
+        del interner
+        _, dropped_bytes = retained(lambda: parse_all(mode, statements, LiteralInterner()))
+        stats = LiteralInterner()
+        parse_all(mode, statements, stats)
+        same = all(thaw(a.value) == thaw(b.value) and a.name == b.name for a, b in zip(plain, interned))
+        print(f'{name:8} {plain_seconds * 1000:9.1f} {intern_seconds * 1000:10.1f} {plain_bytes / 2**20:9.2f} '
+              f'{kept_bytes / 2**20:8.2f} {dropped_bytes / 2**20:11.2f} {stats.saved_bytes / 2**20:9.2f} '
+              f"{stats.hit_rate:9.1%} {'yes' if same else 'NO'}")
+        del plain, interned
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare tokens/second of ALL.py's PLY lexer and the single-regex FastLexer on a synthetic corpus."""
+import argparse
+import random
+
+from common import best_of, load_all
+
+
+def make_corpus(statements, seed=0):
+    rng = random.Random(seed)
+    names = ['count', 'total', 'value', 'variable', 'letter', 'constant', 'x', 'y']
+    lines = []
+    for i in range(statements):
+        name = rng.choice(names) + str(i)
+        choice = rng.randrange(4)
+        if choice == 0:
+            lines.append(f'var {name} = {rng.randrange(1000)} + {rng.random():.3f} * {rng.choice(names)};')
+        elif choice == 1:
+            lines.append(f'let {name} = [1, "two", {{key: {i}, other: "s\\"q"}}];')
+        elif choice == 2:
+            lines.append(f'while ({name} <= {i}) {{ {name} = {name} - 1; }}')
+        else:
+            lines.append(f'function {name}(a, b) {{ return a / b; }}')
+    return '\n'.join(lines) + '\n'
+
+
+def token_tuples(tokens):
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in tokens]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--statements', type=int, default=50000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    code = make_corpus(args.statements)
+
+    def ply_lex():
+        ALL.lexer.lineno = 1
+        ALL.lexer.input(code)
+        return list(ALL.lexer)
+
+    reference = ply_lex()
+    if token_tuples(reference) != token_tuples(ALL.fast_lexer.tokenize(code)):
+        raise SystemExit('FastLexer output differs from the PLY lexer')
+
+    ply_time = best_of(ply_lex, args.repeat)
+    fast_time = best_of(lambda: ALL.fast_lexer.tokenize(code), args.repeat)
+    count = len(reference)
+    print(f"corpus: {len(code) / 1e6:.2f} MB, {count} tokens (identical streams)")
+    print(f"PLY lexer:   {count / ply_time / 1e6:6.2f} M tokens/s")
+    print(f"FastLexer:   {count / fast_time / 1e6:6.2f} M tokens/s ({ply_time / fast_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Report the speedup curve of jsparse.parallel over 1..N worker processes."""
+import argparse
+import os
+import tempfile
+import time
+
+from common import load_all
+from jsparse import parallel
+
+
+def write_corpus(directory, files, elements):
+    paths = []
+    for i in range(files):
+        path = os.path.join(directory, f'file{i:05d}.js')
+        body = ', '.join(f'{{id: {j}, name: "item{j}", score: x{j} * {i} + 1}}' for j in range(elements))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'var data{i} = [{body}];\n')
+        paths.append(path)
+    return paths
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--files', type=int, default=400)
+    arg_parser.add_argument('--elements', type=int, default=200)
+    arg_parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    worker_counts = []
+    n = 1
+    while n < args.max_workers:
+        worker_counts.append(n)
+        n *= 2
+    worker_counts.append(args.max_workers)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory, args.files, args.elements)
+        start = time.perf_counter()
+        for path in paths:
+            parallel.parse_file(path, ALL.parse_js_code)
+        sequential = time.perf_counter() - start
+        print(f"{args.files} files, in-process sequential: {sequential:.2f} s")
+        print(f"{'workers':>7} {'seconds':>8} {'files/s':>9} {'speedup':>8}")
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results = list(parallel.parse_files(paths, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert [r.path for r in results] == paths
+            assert not any(r.errors or r.exception for r in results)
+            print(f"{workers:7d} {elapsed:8.2f} {len(paths) / elapsed:9.1f} {sequential / elapsed:7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
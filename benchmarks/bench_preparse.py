@@ -0,0 +1,36 @@
+"""Full parsing against preparse mode (parse_js_code(..., lazy_bodies=True)) on every corpus.
+
+Times are best-of parses of already-lexed tokens, with no body read, so
+they show what a consumer that only lists declarations pays. Reading
+every body afterwards must give the same tree as the full parse.
+"""
+import argparse
+
+import corpus
+from common import best_of, load_all
+from jsparse.nodes import FunctionDecl
+from jsparse.printer import to_source
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--statements', type=int, default=5000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    print(f"{'corpus':13} {'full ms':>9} {'lazy ms':>9} {'speedup':>8} {'functions':>10} same tree")
+    for name in sorted(corpus.GENERATORS):
+        tokens = ALL.tokenize(corpus.source(corpus.generate(name, args.statements)))
+        full = best_of(lambda: ALL.parse_program_tokens(tokens), args.repeat)
+        lazy = best_of(lambda: ALL.parse_program_tokens(tokens, lazy_bodies=True), args.repeat)
+        program, errors = ALL.parse_program_tokens(tokens, lazy_bodies=True)
+        declared = [(node.name, node.params) for node in program.body if type(node) is FunctionDecl]
+        expected, expected_errors = ALL.parse_program_tokens(tokens)
+        same = to_source(program) == to_source(expected) and errors == expected_errors
+        print(f'{name:13} {full * 1000:9.1f} {lazy * 1000:9.1f} {full / lazy:7.1f}x {len(declared):10} '
+              f"{'yes' if same else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Check that long arrays, objects and statement lists parse in linear time (1k/10k/100k elements)."""
+import argparse
+
+from common import best_of, load_all, quiet
+from jsparse import constructs
+
+
+def array_source(n):
+    return 'var a = [' + ', '.join(str(i) for i in range(n)) + '];'
+
+
+def object_source(n):
+    return 'var o = {' + ', '.join(f'k{i}: {i}' for i in range(n)) + '};'
+
+
+def function_source(n):
+    return 'function f() { ' + ' '.join(f'x{i} = {i};' for i in range(n)) + ' }'
+
+
+def while_source(n):
+    return 'while (x < 1) { ' + ' '.join(f'x{i} = {i};' for i in range(n)) + ' }'
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+
+    def all_parse(code):
+        return ALL.parse_js_code(code, verbose=False)
+
+    cases = [
+        ('ALL.py array', all_parse, array_source),
+        ('ALL.py object', all_parse, object_source),
+        ('ALL.py function body', all_parse, function_source),
+    ]
+    for mode, make_source in [('array', array_source), ('object', object_source), ('while', while_source)]:
+        cases.append((f'{mode} mode', lambda code, mode=mode: constructs.parse(mode, code), make_source))
+
+    print(f"{'case':28} {'elements':>9} {'ms':>10} {'us/elem':>9}")
+    for label, parse, make_source in cases:
+        for n in args.sizes:
+            code = make_source(n)
+            with quiet():
+                elapsed = best_of(lambda: parse(code), args.repeat)
+            print(f"{label:28} {n:9d} {elapsed * 1000:10.1f} {elapsed / n * 1e6:9.2f}")
+
+
+if __name__ == '__main__':
+    main()
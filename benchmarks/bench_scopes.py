@@ -0,0 +1,88 @@
+"""Time and memory of jsparse.scopes.analyze() on programs with up to millions of identifier uses.
+
+The corpus is parsed at a quarter, half and all of --size statements, so
+the time per identifier shows whether the pass stays linear. Memory is the
+tracemalloc size of the scope tree and symbols analyze() returns, and its
+peak while running. The name strings the tree holds are also counted: with
+ALL.py interning identifiers there is one string object per distinct name,
+against one per use without it.
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+
+import corpus
+from common import best_of, load_all
+from jsparse.nodes import Assign, Call, FunctionDecl, Identifier, ObjectLiteral, VarDecl
+from jsparse.scopes import analyze
+
+
+def name_strings(program):
+    """Return every identifier string held by the tree, one entry per use."""
+    names = []
+    stack = list(program.body)
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+        if kind is Identifier:
+            names.append(node.name)
+            continue
+        if kind is Call or kind is Assign or kind is VarDecl or kind is FunctionDecl:
+            names.append(node.callee if kind is Call else node.name)
+        if kind is FunctionDecl:
+            names.extend(node.params)
+        if kind is ObjectLiteral:
+            names.extend(key for key, value in node.properties)
+            stack.extend(value for key, value in node.properties)
+            continue
+        for field in node.__slots__:
+            value = getattr(node, field)
+            if isinstance(value, list):
+                stack.extend(item for item in value if not isinstance(item, str))
+            elif value is not None and not isinstance(value, (str, float)):
+                stack.append(value)
+    return names
+
+
+def measure_memory(program):
+    """Return (bytes retained by the Analysis, peak bytes while analyzing)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        analysis = analyze(program)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del analysis
+    return retained, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--corpus', default='functions', choices=sorted(corpus.GENERATORS))
+    arg_parser.add_argument('--size', type=int, default=120000,
+                            help='statements in the largest program (default: 120000, about 1M identifiers)')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    print(f"{'statements':>10} {'identifiers':>12} {'scopes ms':>10} {'ns/ident':>9} {'symbols MB':>11} "
+          f"{'peak MB':>8} {'names':>8} {'name MB':>8} {'uninterned MB':>14}")
+    for size in (args.size // 4, args.size // 2, args.size):
+        result = ALL.parse_js_code(corpus.source(corpus.generate(args.corpus, size)), verbose=False)
+        program = result.tree
+        names = name_strings(program)
+        distinct = {id(name): name for name in names}
+        interned_bytes = sum(sys.getsizeof(name) for name in distinct.values())
+        uninterned_bytes = sum(sys.getsizeof(name) for name in names)
+        seconds = best_of(lambda: analyze(program), args.repeat)
+        retained, peak = measure_memory(program)
+        print(f'{size:10} {len(names):12} {seconds * 1000:10.1f} {seconds / len(names) * 1e9:9.0f} '
+              f'{retained / 2**20:11.2f} {peak / 2**20:8.2f} {len(distinct):8} {interned_bytes / 2**20:8.2f} '
+              f'{uninterned_bytes / 2**20:14.2f}')
+        del result, program, names, distinct
+
+
+if __name__ == '__main__':
+    main()
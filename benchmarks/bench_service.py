@@ -0,0 +1,131 @@
+"""Load-test jsparse.service: request latency percentiles and throughput.
+
+Starts the service in a subprocess on a temporary Unix socket (or on
+localhost TCP with --tcp), then sends generated statements from --clients
+concurrent connections, each keeping --in-flight requests outstanding.
+Latency is measured per request, from writing it to reading its response.
+With --cold it also times the same number of `python ALL.py` runs, one
+process per request, which is what a client without the service pays.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import corpus
+from common import ROOT
+from jsparse.service import Client
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def start_service(args, directory):
+    command = [sys.executable, '-m', 'jsparse.service', '--batch-size', str(args.batch_size)]
+    if args.workers:
+        command += ['--workers', str(args.workers)]
+    if args.tcp:
+        command += ['--port', str(args.port)]
+        address = {'port': args.port}
+    else:
+        path = os.path.join(directory, 'jsparse.sock')
+        command += ['--unix', path]
+        address = {'path': path}
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    print(process.stdout.readline().strip())  # The "Listening on" line, printed once the workers are warm
+    return process, address
+
+
+async def run_client(address, sources, in_flight, op, mode, latencies, failures):
+    client = await Client.connect(**address)
+    queue = iter(sources)
+
+    async def worker():
+        for source in queue:
+            start = time.perf_counter()
+            response = await client.request(source, op=op, mode=mode)
+            latencies.append(time.perf_counter() - start)
+            if 'failure' in response or not response['valid']:
+                failures.append(response)
+
+    await asyncio.gather(*(worker() for _ in range(in_flight)))
+    await client.close()
+
+
+async def load(address, sources, clients, in_flight, op, mode):
+    latencies = []
+    failures = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(address, sources[i::clients], in_flight, op, mode, latencies, failures)
+                           for i in range(clients)))
+    return time.perf_counter() - start, sorted(latencies), failures
+
+
+def report(label, seconds, latencies):
+    print(f'{label:26} {len(latencies) / seconds:10.0f} req/s   p50 {percentile(latencies, 0.50) * 1000:8.2f} ms   '
+          f'p99 {percentile(latencies, 0.99) * 1000:8.2f} ms')
+
+
+def cold(sources, count, directory):
+    """Time one `python ALL.py file` process per request."""
+    path = os.path.join(directory, 'request.js')
+    latencies = []
+    start = time.perf_counter()
+    for source in sources[:count]:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, 'ALL.py', path], cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        latencies.append(time.perf_counter() - begin)
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--corpus', default='declarations', choices=sorted(corpus.GENERATORS))
+    arg_parser.add_argument('--requests', type=int, default=5000)
+    arg_parser.add_argument('--statements', type=int, default=1, help='statements per request (default: 1)')
+    arg_parser.add_argument('--clients', type=int, default=8, help='concurrent connections (default: 8)')
+    arg_parser.add_argument('--in-flight', type=int, default=4, help='requests outstanding per connection')
+    arg_parser.add_argument('--op', default='parse', choices=['parse', 'validate'])
+    arg_parser.add_argument('--mode', action='store_true', help="send statements in the corpus's constructs mode")
+    arg_parser.add_argument('-j', '--workers', type=int)
+    arg_parser.add_argument('--batch-size', type=int, default=64)
+    arg_parser.add_argument('--tcp', action='store_true', help='use localhost TCP instead of a Unix socket')
+    arg_parser.add_argument('--port', type=int, default=8765)
+    arg_parser.add_argument('--cold', type=int, default=0, metavar='N',
+                            help='also time N requests as separate ALL.py processes')
+    args = arg_parser.parse_args()
+
+    generated = corpus.generate(args.corpus, args.requests * args.statements)
+    if args.mode:
+        sources, mode = generated.mode_statements[:args.requests], generated.mode
+    else:
+        statements = generated.statements
+        sources = ['\n'.join(statements[i:i + args.statements]) + '\n'
+                   for i in range(0, len(statements), args.statements)][:args.requests]
+        mode = 'program'
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, address = start_service(args, directory)
+        try:
+            # One short round first, so the timed run starts with connected, warmed-up workers
+            asyncio.run(load(address, sources[:100], args.clients, args.in_flight, args.op, mode))
+            seconds, latencies, failures = asyncio.run(
+                load(address, sources, args.clients, args.in_flight, args.op, mode))
+        finally:
+            process.terminate()
+            process.wait()
+        if failures:
+            print(f'{len(failures)} request(s) failed or were invalid, e.g. {failures[0]}')
+        report(f'service ({"tcp" if args.tcp else "unix"}, {mode})', seconds, latencies)
+        if args.cold:
+            report('one process per request', *cold(sources, args.cold, directory))
+
+
+if __name__ == '__main__':
+    main()
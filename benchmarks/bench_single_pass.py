@@ -0,0 +1,44 @@
+"""Compare lexing the input twice (token dump, then parser.parse(code)) with lexing it once into a buffer."""
+import argparse
+
+from common import best_of, load_all, quiet
+
+
+def make_source(elements):
+    return 'var data = [' + ', '.join(f'{i} + x{i}' for i in range(elements)) + '];'
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--elements', type=int, default=20000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    code = make_source(args.elements)
+    lexer, parser = ALL.fast_lexer, ALL.parser
+
+    def lex_twice():
+        lexer.input(code)
+        for _ in lexer:
+            pass
+        parser.parse(code, lexer=lexer)
+
+    def lex_once():
+        token_buffer = ALL.tokenize(code)
+        parser.parse(lexer=lexer, tokenfunc=ALL.token_feed(token_buffer))
+
+    with quiet():
+        lex_only = best_of(lambda: ALL.tokenize(code), args.repeat)
+        before = best_of(lex_twice, args.repeat)
+        after = best_of(lex_once, args.repeat)
+
+    print(f"input: {len(code) / 1e6:.2f} MB, {len(ALL.tokenize(code))} tokens")
+    print(f"lex only:            {lex_only * 1000:9.1f} ms")
+    print(f"lex twice + parse:   {before * 1000:9.1f} ms")
+    print(f"lex once + parse:    {after * 1000:9.1f} ms")
+    print(f"saved:               {(before - after) * 1000:9.1f} ms ({(1 - after / before) * 100:.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
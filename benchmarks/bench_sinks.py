@@ -0,0 +1,55 @@
+"""Batch output cost: verbose print() per token against the none, ndjson and binary sinks."""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from common import load_all
+from jsparse import parallel, sinks
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--files', type=int, default=200)
+    arg_parser.add_argument('--statements', type=int, default=50)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(directory, f'file{i:05d}.js')
+            with open(path, 'w', encoding='utf-8') as f:
+                for j in range(args.statements):
+                    f.write(f'var v{j} = [x * {j}, "s{j}", {{k: {i}}}];\nwhile (v{j} < {i}) {{ v{j} = v{j} + 1; }}\n')
+            paths.append(path)
+        out_path = os.path.join(directory, 'out')
+
+        def verbose():
+            with open(out_path, 'w') as out, contextlib.redirect_stdout(out):
+                for path in paths:
+                    parallel.parse_file(path, lambda code, verbose: ALL.parse_js_code(code, True))
+
+        def with_sink(output_format):
+            def run():
+                with open(out_path, 'wb') as out:
+                    sink = sinks.open_sink(output_format, out)
+                    for path in paths:
+                        sink.write(parallel.parse_file(path, ALL.parse_js_code, output_format != 'none'))
+                    sink.close()
+            return run
+
+        for label, func in [('print', verbose)] + [(name, with_sink(name)) for name in ('none', 'ndjson', 'binary')]:
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
+            print(f"{label:7} {elapsed:7.3f} s  {size / 1e6:8.2f} MB written")
+            if os.path.exists(out_path):
+                os.remove(out_path)
+
+
+if __name__ == '__main__':
+    main()
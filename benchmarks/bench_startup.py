@@ -0,0 +1,60 @@
+"""Measure parser start-up: cold interpreter start with the cached tables, table load vs rebuild,
+and importing jsparse.constructs against a first parse in one mode and in every mode."""
+import argparse
+import subprocess
+import sys
+
+import ply.yacc as yacc
+
+from common import ROOT, best_of, load_all
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--repeat', type=int, default=10)
+    args = arg_parser.parse_args()
+
+    def cold_start():
+        subprocess.run([sys.executable, '-c', 'import ALL'], cwd=ROOT, check=True)
+
+    def bare_interpreter():
+        subprocess.run([sys.executable, '-c', 'import ply.yacc'], cwd=ROOT, check=True)
+
+    def empty_interpreter():
+        subprocess.run([sys.executable, '-c', 'pass'], cwd=ROOT, check=True)
+
+    def construct_start(code):
+        return lambda: subprocess.run(
+            [sys.executable, '-c', 'from jsparse import constructs\n' + code], cwd=ROOT, check=True)
+
+    ALL = load_all()
+
+    def load_tables():
+        yacc.yacc(module=ALL, debug=False, tabmodule='jsparse.tables.parsetab_all',
+                  write_tables=False, errorlog=yacc.NullLogger())
+
+    def rebuild_tables():
+        yacc.yacc(module=ALL, debug=False, tabmodule='jsparse.tables.parsetab_missing',
+                  write_tables=False, errorlog=yacc.NullLogger())
+
+    baseline = best_of(bare_interpreter, args.repeat)
+    cold = best_of(cold_start, args.repeat)
+    load = best_of(load_tables, args.repeat)
+    rebuild = best_of(rebuild_tables, args.repeat)
+    empty = best_of(empty_interpreter, args.repeat)
+    import_only = best_of(construct_start(''), args.repeat)
+    one_mode = best_of(construct_start("constructs.parse('variable', 'var x = 1;')"), args.repeat)
+    all_modes = best_of(construct_start("for mode in constructs.MODES: constructs.parse(mode, '')"), args.repeat)
+
+    print(f"interpreter + ply import:    {baseline * 1000:8.1f} ms")
+    print(f"cold start of ALL.py:        {cold * 1000:8.1f} ms ({(cold - baseline) * 1000:.1f} ms over bare)")
+    print(f"yacc() with cached tables:   {load * 1000:8.1f} ms")
+    print(f"yacc() rebuilding tables:    {rebuild * 1000:8.1f} ms ({rebuild / load:.1f}x slower)")
+    print(f"bare interpreter:            {empty * 1000:8.1f} ms")
+    print(f"import jsparse.constructs:   {import_only * 1000:8.1f} ms ({(import_only - empty) * 1000:.1f} ms over bare)")
+    print(f"+ first variable parse:      {one_mode * 1000:8.1f} ms ({(one_mode - empty) * 1000:.1f} ms over bare)")
+    print(f"+ first parse in every mode: {all_modes * 1000:8.1f} ms ({(all_modes - empty) * 1000:.1f} ms over bare)")
+
+
+if __name__ == '__main__':
+    main()
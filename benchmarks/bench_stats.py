@@ -0,0 +1,31 @@
+"""Cost of --stats: parse_js_code without a Stats object, with one, and with one per call."""
+import argparse
+
+from common import best_of, load_all
+from jsparse.stats import Stats
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--statements', type=int, default=5000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    code = ''.join(f'var v{i} = [x * {i}, "s{i}", {{k: {i}}}];\nwhile (v{i} < {i}) {{ v{i} = v{i} + 1; }}\n'
+                   for i in range(args.statements))
+    small = 'var a = 1 + 2 * 3;\n'
+
+    stats = Stats()
+    for label, source, count in (('one large file', code, 1), ('many small files', small, 2000)):
+        disabled = best_of(lambda: [ALL.parse_js_code(source, False) for _ in range(count)], args.repeat)
+        enabled = best_of(lambda: [ALL.parse_js_code(source, False, stats=stats) for _ in range(count)],
+                          args.repeat)
+        print(f'{label:18} disabled {disabled * 1000:9.2f} ms   enabled {enabled * 1000:9.2f} ms   '
+              f'overhead {(enabled / disabled - 1) * 100:6.1f}%')
+    print()
+    print(stats.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Peak memory and time of parse_stream() against parsing the whole file at once."""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from common import load_all
+from jsparse.stream import parse_stream
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--statements', type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'big.js')
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(args.statements):
+                f.write(f'var v{i} = [{i}, x * {i}, "s{i}"];\n')
+
+        def whole():
+            with open(path, encoding='utf-8') as f:
+                return len(ALL.parse_js_code(f.read(), verbose=False).tree.body)
+
+        def streamed():
+            with open(path, encoding='utf-8') as f:
+                return sum(1 for _ in parse_stream(f))
+
+        for label, func in (('whole file', whole), ('streamed', streamed)):
+            count, elapsed, peak = measure(func)
+            print(f"{label:10} {count} statements  {elapsed:7.3f} s  peak {peak / 2**20:7.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""Throughput and peak memory on the generated corpora, checked against stored baselines.
+
+Every corpus from corpus.py is parsed by ALL.py as one program and, one
+statement per call, in its jsparse.constructs mode. Each run records tokens/s,
+statements/s and the tracemalloc peak of a separate untimed pass. Exits with
+status 1 when a run falls more than --tolerance below the baseline speed or
+above its memory.
+
+Speeds are compared after scaling the baseline by a pure-Python calibration
+loop timed next to each run, so a baseline recorded on another machine, or
+under different load, still roughly applies. Baselines only apply to the
+--size and --seed they were recorded with; refresh them with --update after
+an intended change.
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+import corpus
+from common import best_of, load_all, quiet
+from jsparse import constructs
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+CALIBRATION_ITERATIONS = 100000
+
+
+def _calibration_workload():
+    return sum(len(str(i)) for i in range(CALIBRATION_ITERATIONS))
+
+
+def peak_memory(run):
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(run, tokens, statements, repeat):
+    # The calibration loop is timed alongside every repeat, so both see the same machine load
+    calibration = seconds = float('inf')
+    with quiet():
+        for _ in range(repeat):
+            calibration = min(calibration, best_of(_calibration_workload, 1))
+            seconds = min(seconds, best_of(run, 1))
+        peak = peak_memory(run)
+    return {'tokens_per_s': tokens / seconds, 'statements_per_s': statements / seconds, 'peak_bytes': peak,
+            'calibration': CALIBRATION_ITERATIONS / calibration}
+
+
+def run_all(ALL, generated, repeat):
+    code = corpus.source(generated)
+    result = ALL.parse_js_code(code, False)
+    if result.errors:
+        raise SystemExit(f'{generated.name}: ALL.py rejects the generated corpus: {result.errors[0].describe()}')
+    return measure(lambda: ALL.parse_js_code(code, False), len(result.tokens), len(generated.statements), repeat)
+
+
+def run_mode(generated, repeat):
+    mode = generated.mode
+    tokens = 0
+    for statement in generated.mode_statements:
+        result = constructs.parse(mode, statement)
+        if result.errors:
+            raise SystemExit(f'{generated.name}: the {mode} mode rejects the generated corpus: '
+                             f'{result.errors[0].describe()}')
+        tokens += len(result.tokens)
+
+    def run():
+        for statement in generated.mode_statements:
+            constructs.parse(mode, statement)
+    return measure(run, tokens, len(generated.mode_statements), repeat)
+
+
+def compare(name, result, baseline, tolerance):
+    """Return a description of each way result regressed from baseline."""
+    problems = []
+    speed_ratio = result['calibration'] / baseline['calibration']
+    for metric in ('tokens_per_s', 'statements_per_s'):
+        expected = baseline[metric] * speed_ratio
+        if result[metric] < expected * (1 - tolerance):
+            problems.append(f'{name}: {metric} {result[metric]:.0f} is {(1 - result[metric] / expected) * 100:.0f}% '
+                            f'below the baseline {expected:.0f}')
+    if result['peak_bytes'] > baseline['peak_bytes'] * (1 + tolerance):
+        problems.append(f'{name}: peak memory {result["peak_bytes"]} B is '
+                        f'{(result["peak_bytes"] / baseline["peak_bytes"] - 1) * 100:.0f}% above the baseline '
+                        f'{baseline["peak_bytes"]} B')
+    return problems
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--size', type=int, default=1000, help='statements per corpus (default: 1000)')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--corpus', action='append', choices=sorted(corpus.GENERATORS),
+                            help='run only this corpus; may be repeated (default: all)')
+    arg_parser.add_argument('--baseline', default=BASELINE, metavar='FILE',
+                            help='baseline file (default: benchmarks/baselines.json)')
+    arg_parser.add_argument('--tolerance', type=float, default=0.25,
+                            help='allowed fractional slowdown or memory growth (default: 0.25)')
+    arg_parser.add_argument('--update', action='store_true', help='write the results as the new baseline')
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    results = {}
+    print(f"{'run':42} {'tokens/s':>10} {'stmts/s':>10} {'peak MB':>8}")
+    for name in args.corpus or corpus.GENERATORS:
+        generated = corpus.generate(name, args.size, args.seed)
+        runs = [('ALL.py', lambda: run_all(ALL, generated, args.repeat)),
+                (f'{generated.mode} mode', lambda: run_mode(generated, args.repeat))]
+        for target, run in runs:
+            key = f'{name}/{target}'
+            results[key] = result = run()
+            print(f"{key:42} {result['tokens_per_s']:10.0f} {result['statements_per_s']:10.0f} "
+                  f"{result['peak_bytes'] / 2**20:8.2f}")
+
+    if args.update:
+        baseline = {'size': args.size, 'seed': args.seed, 'results': results}
+        if os.path.exists(args.baseline) and args.corpus:
+            # Keep the stored runs of corpora that were not rerun
+            with open(args.baseline) as f:
+                previous = json.load(f)
+            if (previous['size'], previous['seed']) == (args.size, args.seed):
+                baseline['results'] = dict(previous['results'], **results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Wrote {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}; run with --update to record one')
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if (baseline['size'], baseline['seed']) != (args.size, args.seed):
+        print(f"Baseline was recorded with --size {baseline['size']} --seed {baseline['seed']}; not comparing")
+        return 0
+    problems = []
+    for key, result in results.items():
+        if key in baseline['results']:
+            problems += compare(key, result, baseline['results'][key], args.tolerance)
+    for problem in problems:
+        print(f'REGRESSION {problem}')
+    if problems:
+        return 1
+    print(f'No regressions beyond {args.tolerance * 100:.0f}%')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
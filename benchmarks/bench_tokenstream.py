@@ -0,0 +1,47 @@
+"""Memory per token and speed: a list of Token objects against the array-backed TokenStream."""
+import argparse
+import gc
+import tracemalloc
+
+import corpus
+from common import best_of, load_all
+
+
+def retained(make):
+    """Return (result, bytes still allocated once make() has returned)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = make()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--size', type=int, default=2000, help='statements per corpus (default: 2000)')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ALL = load_all()
+    lexer = ALL.fast_lexer
+    print(f"{'corpus':14} {'tokens':>8} {'list B/tok':>11} {'stream B/tok':>13} "
+          f"{'list lex ms':>12} {'stream lex ms':>14} {'list parse ms':>14} {'stream parse ms':>16}")
+    for name in corpus.GENERATORS:
+        code = corpus.source(corpus.generate(name, args.size))
+        token_list, list_bytes = retained(lambda: lexer.tokenize(code))
+        token_stream, stream_bytes = retained(lambda: lexer.tokenize_stream(code))
+        count = len(token_list)
+        assert len(token_stream) == count
+        list_lex = best_of(lambda: lexer.tokenize(code), args.repeat)
+        stream_lex = best_of(lambda: lexer.tokenize_stream(code), args.repeat)
+        list_parse = best_of(lambda: ALL.parse_program_tokens(token_list), args.repeat)
+        stream_parse = best_of(lambda: ALL.parse_program_tokens(token_stream), args.repeat)
+        print(f'{name:14} {count:8} {list_bytes / count:11.1f} {stream_bytes / count:13.1f} '
+              f'{list_lex * 1000:12.1f} {stream_lex * 1000:14.1f} {list_parse * 1000:14.1f} '
+              f'{stream_parse * 1000:16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""Helpers shared by the benchmark scripts."""
+import contextlib
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def load_all():
+    """Import ALL.py from the project root."""
+    import ALL
+    return ALL
+
+
+@contextlib.contextmanager
+def quiet():
+    """Send the grammar actions' print() output to /dev/null."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def best_of(func, repeat=5):
+    """Return the fastest wall time of `repeat` calls to func()."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
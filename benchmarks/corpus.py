@@ -0,0 +1,162 @@
+"""Seeded generators for synthetic JavaScript corpora.
+
+Each corpus stresses one part of the grammars. generate() returns the
+statements twice: once using everything ALL.py accepts, and once limited to
+what the matching jsparse.constructs mode accepts, since those parse a
+single statement of their own construct per call. The same name, size and
+seed always give the same text.
+"""
+import collections
+import random
+
+# statements is a list of sources for ALL.py; mode_statements are parsed one at a time in mode
+Corpus = collections.namedtuple('Corpus', 'name statements mode mode_statements')
+
+OPERATORS = ['+', '-', '*', '/', '<', '<=', '==', '!=', '&&', '||']
+
+
+def _name(rng):
+    return f'x{rng.randrange(1000)}'
+
+
+def _scalar(rng, decimals=True):
+    if rng.random() < 0.5:
+        return f'"s{rng.randrange(1000)}"'
+    if decimals and rng.random() < 0.3:
+        return f'{rng.randrange(1000)}.{rng.randrange(100)}'
+    return str(rng.randrange(1000))
+
+
+def _chain(rng, length):
+    """Return a binary expression of `length` operands with the odd parenthesized group."""
+    parts = []
+    for i in range(length):
+        operand = _name(rng) if rng.random() < 0.5 else str(rng.randrange(1000))
+        if i and rng.random() < 0.1:
+            operand = f'({operand} {rng.choice(OPERATORS)} {rng.randrange(1000)})'
+        if i:
+            parts.append(rng.choice(OPERATORS))
+        parts.append(operand)
+    return ' '.join(parts)
+
+
+def _array(rng, length, depth):
+    """Return an array literal with `length` elements, nested `depth` levels deep along its last element."""
+    elements = [_scalar(rng, decimals=False) for _ in range(length)]
+    if depth:
+        elements.append(_array(rng, max(1, length // 4), depth - 1))
+    return '[' + ', '.join(elements) + ']'
+
+
+def _object(rng, length, depth):
+    properties = [f'x{i}: {_scalar(rng, decimals=False)}' for i in range(length)]
+    if depth:
+        properties.append(f'xs: [{_scalar(rng, decimals=False)}, {_scalar(rng, decimals=False)}]')
+        properties.append(f'xn: {_object(rng, max(1, length // 4), depth - 1)}')
+    return '{' + ', '.join(properties) + '}'
+
+
+def declarations(rng, size):
+    """Long runs of var/let/const declarations."""
+    statements = []
+    for i in range(size):
+        if i % 7 == 0:
+            statements.append(f'var x{i};')
+        else:
+            statements.append(f"{('var', 'let', 'const')[i % 3]} x{i} = {_scalar(rng)};")
+    return statements, list(statements)
+
+
+def arrays(rng, size):
+    """Many small arrays, one huge flat array and one deeply nested array."""
+    statements = [f'var x{i} = {_array(rng, rng.randrange(1, 10), rng.randrange(3))};' for i in range(size)]
+    statements.append(f'const xhuge = {_array(rng, size * 10, 0)};')
+    statements.append(f'let xdeep = {_array(rng, 2, min(size, 200))};')
+    return statements, list(statements)
+
+
+def objects(rng, size):
+    """Many small objects, one huge flat object and one deeply nested object."""
+    statements = [f'var x{i} = {_object(rng, rng.randrange(1, 10), rng.randrange(3))};' for i in range(size)]
+    statements.append(f'const xhuge = {_object(rng, size * 10, 0)};')
+    statements.append(f'let xdeep = {_object(rng, 1, min(size, 200))};')
+    return statements, list(statements)
+
+
+def expressions(rng, size):
+    """Long binary operator chains, as initializers and as while conditions."""
+    length = max(2, size // 10)
+    statements = [f'var x{i} = {_chain(rng, length)};' for i in range(size // 10 or 1)]
+    mode_statements = [f'while ({_chain(rng, length)}) {{ x = {_chain(rng, length)}; }}'
+                         for _ in range(size // 10 or 1)]
+    return statements, mode_statements
+
+
+def functions(rng, size):
+    """Many function declarations; only ALL.py accepts bodies."""
+    statements = []
+    mode_statements = []
+    for i in range(size):
+        params = ', '.join(f'x{j}' for j in range(rng.randrange(6)))
+        body = ' '.join(f'var x{j} = {_chain(rng, 3)};' for j in range(rng.randrange(4)))
+        statements.append(f'function x{i}({params}) {{ {body} return {_chain(rng, 2)}; }}')
+        mode_statements.append(f'function x{i}({params}) {{ }}')
+    return statements, mode_statements
+
+
+def _while(rng, depth, width):
+    body = [f'x{j} = {_chain(rng, 3)};' for j in range(width)]
+    if depth:
+        body.insert(width // 2, _while(rng, depth - 1, width))
+    return f'while ({_chain(rng, 3)}) {{ {" ".join(body)} }}'
+
+
+def loops(rng, size):
+    """Nested while bodies for ALL.py; flat bodies for the while mode, which cannot nest."""
+    statements = [_while(rng, rng.randrange(8), rng.randrange(1, 4)) for _ in range(size // 4 or 1)]
+    statements.append(_while(rng, min(size, 200), 1))
+    mode_statements = []
+    for _ in range(size // 4 or 1):
+        body = ' '.join(f'x{j} = {_chain(rng, 3)};' for j in range(rng.randrange(1, 10)))
+        mode_statements.append(f'while ({_chain(rng, 3)}) {{ {body} }}')
+    return statements, mode_statements
+
+
+# Corpus name -> (generator, jsparse.constructs mode that gets its mode_statements)
+GENERATORS = {
+    'declarations': (declarations, 'variable'),
+    'arrays': (arrays, 'array'),
+    'objects': (objects, 'object'),
+    'expressions': (expressions, 'while'),
+    'functions': (functions, 'function'),
+    'while': (loops, 'while'),
+}
+
+
+def generate(name, size=1000, seed=0):
+    """Return the Corpus called name with about `size` statements."""
+    generator, mode = GENERATORS[name]
+    # Seeding per corpus keeps each one stable when others are added or skipped
+    statements, mode_statements = generator(random.Random(f'{name}:{seed}'), size)
+    return Corpus(name, statements, mode, mode_statements)
+
+
+def source(corpus):
+    """Return the ALL.py statements of corpus as one program."""
+    return '\n'.join(corpus.statements) + '\n'
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    arg_parser = argparse.ArgumentParser(description='Write a generated corpus to stdout.')
+    arg_parser.add_argument('name', choices=sorted(GENERATORS))
+    arg_parser.add_argument('--size', type=int, default=1000)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--mode', action='store_true',
+                            help="write the construct mode's statements instead of ALL.py's")
+    args = arg_parser.parse_args()
+    corpus = generate(args.name, args.size, args.seed)
+    lines = corpus.mode_statements if args.mode else corpus.statements
+    sys.stdout.write('\n'.join(lines) + '\n')
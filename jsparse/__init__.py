@@ -0,0 +1 @@
+"""Support modules for the AFLL JavaScript parser scripts."""
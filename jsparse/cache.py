@@ -0,0 +1,132 @@
+"""On-disk parse cache keyed by content hash and grammar version.
+
+Entries are pickles named after sha256(version, namespace, source), one
+file per entry in the cache directory. The directory is kept under a size
+cap by evicting the least recently used entries; a hit refreshes the
+entry's mtime, so the order also survives across runs.
+
+Processes sharing a directory each only account for what they see, so
+together they can write more than max_bytes; trim() rescans the directory
+and brings it back under the cap, e.g. once a pool of workers is done.
+"""
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+
+from jsparse import diagnostics, expressions, lexer, nodes, tokenstream
+
+
+def source_version(*paths):
+    """Return a version string that changes whenever any of the given source files does."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def grammar_version(grammar_path):
+    """Return the version for the grammar module at grammar_path.
+
+    Cache entries are invalidated whenever the grammar, its node classes or the lexer change.
+    """
+    return source_version(grammar_path, diagnostics.__file__, expressions.__file__, nodes.__file__,
+                          lexer.__file__, tokenstream.__file__)
+
+
+class ParseCache:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, version=''):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        # key -> size in bytes, least recently used first
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # Evicted by another process meanwhile
+                    continue
+                found.append((stat.st_mtime, entry.name[:-len('.pickle')], stat.st_size))
+        for mtime, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+
+    def key(self, code, namespace):
+        digest = hashlib.sha256(f'{self.version}\0{namespace}\0'.encode())
+        digest.update(code.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        if key in self._entries:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+                os.utime(path)
+            except (OSError, EOFError, RecursionError, pickle.UnpicklingError):
+                # Removed or truncated by another process sharing the directory, or too deep to load
+                self._size -= self._entries.pop(key)
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store value under key; a value that cannot be pickled is not cached."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (RecursionError, pickle.PicklingError):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        self._size += len(data) - self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        self._evict()
+
+    def _evict(self):
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            old_key, size = self._entries.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(old_key))
+            except FileNotFoundError:
+                pass
+
+    def trim(self):
+        """Rescan the directory, including entries written by other processes, and evict down to max_bytes."""
+        self._scan()
+        self._evict()
+
+    def get_or_parse(self, code, namespace, parse):
+        """Return the cached result of parse(code), calling parse only on a miss."""
+        key = self.key(code, namespace)
+        value = self.get(key)
+        if value is None:
+            value = parse(code)
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'bytes': self._size}
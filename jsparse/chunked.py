@@ -0,0 +1,146 @@
+"""Lex one large input in parallel chunks.
+
+A process pool only helps batch mode when there are many files. A single
+generated file of hundreds of megabytes is lexed on one core. A
+ChunkedLexer cuts such an input into about two chunks per worker. Each cut
+goes just after a ';' or '}', preferably one that ends a line. Workers
+then lex the chunks with the grammar's FastLexer. The token arrays come
+back with absolute offsets and are appended to one TokenStream over the
+whole input. Line numbers need no stitching, because the stream looks them
+up in the line index of the whole text.
+
+A cut can land inside a string literal, since strings may span lines. The
+lexer then sees an illegal '"' where it would have seen a string, and the
+chunk after the cut is lexed from the middle of the string. So every cut
+is checked before its chunks are used:
+  * the chunk before the cut must end with the ';' or '}' as a token of
+    its own;
+  * every illegal '"' in that chunk must still be illegal when it is
+    matched against the whole input.
+A chunk that passes both checks and starts at a true token boundary holds
+exactly the tokens a sequential lex finds in that span, so the cut is a
+true boundary for the next chunk too. A cut that fails the checks is
+dropped, and its two chunks are lexed again as one, in this process.
+The resulting stream and illegal characters are therefore always those of
+FastLexer.tokenize_stream() on the whole input.
+benchmarks/bench_chunked.py compares the two on every run.
+"""
+import array
+import concurrent.futures
+import importlib
+import os
+import re
+
+# Inputs smaller than this many characters per chunk are lexed in this process
+MIN_CHUNK = 1 << 20
+
+_LINE_END_CUT = re.compile(r'[;}]\n')
+_CUT = re.compile(r'[;}]')
+
+_lexer = None
+
+
+def _init_worker(parser_module):
+    global _lexer
+    _lexer = importlib.import_module(parser_module).fast_lexer
+
+
+def _lex(lexer, text, offset):
+    """Return the (codes, starts, lengths, illegal characters) of text, with offsets moved by offset."""
+    stream = lexer.tokenize_stream(text, report=False)
+    starts = stream.starts
+    if offset:
+        starts = array.array(starts.typecode, [start + offset for start in starts])
+    return stream.codes, starts, stream.lengths, [(char, pos + offset) for char, pos in lexer.errors]
+
+
+def _lex_in_worker(text, offset):
+    return _lex(_lexer, text, offset)
+
+
+def cut_points(data, chunks):
+    """Return increasing offsets that cut data into at most `chunks` pieces, each just after a ';' or '}'."""
+    points = []
+    for index in range(1, chunks):
+        target = max(len(data) * index // chunks, points[-1] if points else 0)
+        match = _LINE_END_CUT.search(data, target) or _CUT.search(data, target)
+        if match is None:
+            break
+        point = match.start() + 1
+        if point < len(data) and (not points or point > points[-1]):
+            points.append(point)
+    return points
+
+
+class ChunkedLexer:
+    """Lex inputs on a pool of worker processes, each running the FastLexer of parser_module.
+
+    Inputs under 2 * min_chunk characters skip the pool. Use as a context
+    manager, or call close(), to stop the workers.
+    """
+
+    def __init__(self, workers=None, parser_module='ALL', min_chunk=MIN_CHUNK):
+        self.workers = workers or os.cpu_count() or 1
+        self.lexer = importlib.import_module(parser_module).fast_lexer
+        self.min_chunk = min_chunk
+        self.lineno = 1
+        self.errors = []  # (character, lexpos) of each illegal character in the last input
+        self.merged_cuts = 0  # Cuts of the last input that fell inside a token and were dropped
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(parser_module,))
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def tokenize_stream(self, data, lineno=1, report=True):
+        """Return the TokenStream of data, like FastLexer.tokenize_stream()."""
+        chunks = min(self.workers * 2, len(data) // self.min_chunk)
+        points = cut_points(data, chunks) if chunks > 1 else []
+        if not points:
+            stream = self.lexer.tokenize_stream(data, lineno, report)
+            self.lineno = self.lexer.lineno
+            self.errors = self.lexer.errors
+            self.merged_cuts = 0
+            return stream
+        bounds = [0] + points + [len(data)]
+        futures = [self._pool.submit(_lex_in_worker, data[start:end], start)
+                   for start, end in zip(bounds, bounds[1:])]
+        stream = self.lexer.empty_stream(data, lineno)
+        errors = []
+        self.merged_cuts = 0
+        start = 0
+        for index, future in enumerate(futures):
+            end = bounds[index + 1]
+            chunk = future.result()
+            if start != bounds[index]:
+                # Earlier cuts were dropped: lex everything since the last good one
+                chunk = _lex(self.lexer, data[start:end], start)
+            if end < len(data) and not self._is_true_cut(data, chunk, end):
+                self.merged_cuts += 1
+                continue
+            codes, starts, lengths, chunk_errors = chunk
+            stream.codes.extend(codes)
+            stream.starts.extend(starts)
+            stream.lengths.extend(lengths)
+            errors.extend(chunk_errors)
+            start = end
+        if report:
+            for char, pos in errors:
+                print(f"Illegal character '{char}'")
+        self.lineno = lineno + data.count('\n')
+        self.errors = errors
+        return stream
+
+    def _is_true_cut(self, data, chunk, cut):
+        """Return whether the chunk ending at cut was lexed as the whole input would be."""
+        codes, starts, lengths, chunk_errors = chunk
+        if not starts or starts[-1] != cut - 1 or lengths[-1] != 1:
+            return False
+        # A '"' that could not start a string within the chunk may close one further on
+        return all(char != '"' or self.lexer.match_end(data, pos) == pos + 1 for char, pos in chunk_errors)
@@ -0,0 +1,205 @@
+"""Write parsed programs back out as JavaScript, minified or pretty-printed.
+
+write_code() renders a tree from jsparse.nodes and passes the text to a
+write() callable in chunks, so a large bundle is never held in memory
+as one string. to_code() collects the chunks into a string. Like the
+printer, the renderer walks the tree with an explicit stack, so deep
+trees do not hit the recursion limit.
+
+Both styles only keep the parentheses operator precedence needs, and
+reparsing the output with ALL.py gives a tree equal to the one rendered.
+Minified output has no whitespace except after keywords. Pretty output
+puts one statement per line, indents blocks, and spaces out operators,
+commas and colons.
+
+Numbers are written without an exponent, since the grammar has none:
+integral values as integers, others as their shortest decimal
+expansion.
+"""
+import decimal
+
+from jsparse.expressions import LEVELS
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    Number, ObjectLiteral, Program, Return, String, VarDecl, While,
+)
+
+# Pieces rendered between two write() calls
+CHUNK_PIECES = 1 << 14
+
+# Stack markers: the statements between them are one block deeper
+_INDENT = 1
+_DEDENT = -1
+
+
+def format_number(value):
+    """Return the literal for a number, with no exponent."""
+    if type(value) is int:
+        return str(value)
+    if value.is_integer():
+        return str(int(value))
+    if value != value:
+        raise ValueError('NaN has no literal')
+    if value in (float('inf'), float('-inf')):
+        # Reads back as a float overflow, which is infinite again
+        return '1' + '0' * 309
+    text = repr(value)
+    if 'e' in text:
+        text = format(decimal.Decimal(text), 'f')
+    return text
+
+
+class _Style:
+    """The separators of one output style."""
+    __slots__ = ('operators', 'comma', 'colon', 'assign', 'paren_open', 'block_open', 'empty_block', 'indent',
+                 'statement_end', 'pretty')
+
+    def __init__(self, pretty, indent):
+        self.pretty = pretty
+        space = ' ' if pretty else ''
+        self.operators = {op: f'{space}{op}{space}' for op in LEVELS}
+        self.comma = ',' + space
+        self.colon = ':' + space
+        self.assign = f'{space}={space}'
+        self.paren_open = space + '('  # After while
+        self.block_open = ')' + space + '{'
+        self.empty_block = ')' + space + '{}'
+        self.indent = indent
+        self.statement_end = '\n' if pretty else ''  # After each top-level statement
+
+
+def _push_operand(push, operand, level):
+    if type(operand) is BinOp and LEVELS[operand.op] < level:
+        push(')')
+        push(operand)
+        push('(')
+    else:
+        push(operand)
+
+
+def _push_separated(push, items, separator):
+    """Push items, to be emitted in order with separator between them."""
+    for index in range(len(items) - 1, -1, -1):
+        push(items[index])
+        if index:
+            push(separator)
+
+
+def _render(node, style, write):
+    out = []
+    emit = out.append
+    stack = [node]
+    push = stack.append
+    pop = stack.pop
+    operators = style.operators
+    pretty = style.pretty
+    depth = 0
+    margins = ['\n']  # Newline and indentation for each block depth
+    while stack:
+        if len(out) >= CHUNK_PIECES:
+            write(''.join(out))
+            out.clear()
+        item = pop()
+        kind = type(item)
+        if kind is str:
+            emit(item)
+        elif kind is Identifier:
+            emit(item.name)
+        elif kind is Number:
+            emit(format_number(item.value))
+        elif kind is String:
+            emit(item.value)
+        elif kind is BinOp:
+            level = LEVELS[item.op]
+            # Every operator is left-associative, so only a right operand at the same level needs parentheses
+            _push_operand(push, item.right, level + 1)
+            push(operators[item.op])
+            _push_operand(push, item.left, level)
+        elif kind is int:
+            depth += item
+            if depth >= len(margins):
+                margins.append(margins[-1] + style.indent)
+        elif kind is VarDecl:
+            push(';')
+            if item.init is not None:
+                push(item.init)
+                push(style.assign)
+            emit(item.kind)
+            emit(' ')
+            emit(item.name)
+        elif kind is Assign:
+            push(';')
+            push(item.value)
+            emit(item.name)
+            emit(style.assign)
+        elif kind is ExprStatement:
+            push(';')
+            push(item.expr)
+        elif kind is Return:
+            push(';')
+            push(item.value)
+            emit('return ')
+        elif kind is Call:
+            push(')')
+            _push_separated(push, item.args, style.comma)
+            emit(item.callee)
+            emit('(')
+        elif kind is ArrayLiteral:
+            push(']')
+            _push_separated(push, item.elements, style.comma)
+            emit('[')
+        elif kind is ObjectLiteral:
+            push('}')
+            properties = item.properties
+            for index in range(len(properties) - 1, -1, -1):
+                key, value = properties[index]
+                push(value)
+                push(key + style.colon)
+                if index:
+                    push(style.comma)
+            emit('{')
+        elif kind is While or kind is FunctionDecl:
+            if not item.body:
+                push(style.empty_block)
+            else:
+                push('}')
+                if pretty:
+                    if depth + 1 >= len(margins):
+                        margins.append(margins[-1] + style.indent)
+                    push(margins[depth])
+                push(_DEDENT)
+                for index in range(len(item.body) - 1, -1, -1):
+                    push(item.body[index])
+                    if pretty:
+                        push(margins[depth + 1])
+                push(_INDENT)
+                push(style.block_open)
+            if kind is While:
+                push(item.test)
+                emit('while')
+                emit(style.paren_open)
+            else:
+                emit('function ')
+                emit(item.name)
+                emit('(')
+                emit(style.comma.join(item.params))
+        elif kind is Program:
+            for index in range(len(item.body) - 1, -1, -1):
+                push(style.statement_end)
+                push(item.body[index])
+        else:
+            raise TypeError(f'cannot generate code for {kind.__name__}')
+    if out:
+        write(''.join(out))
+
+
+def write_code(node, write, minify=False, indent='  '):
+    """Render node as JavaScript, passing the text to write() in chunks."""
+    _render(node, _Style(not minify, indent), write)
+
+
+def to_code(node, minify=False, indent='  '):
+    """Return node rendered as JavaScript."""
+    chunks = []
+    write_code(node, chunks.append, minify, indent)
+    return ''.join(chunks)
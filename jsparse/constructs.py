@@ -0,0 +1,371 @@
+"""One lexer and grammar for the five per-construct parsers.
+
+The variable, array, function, object and while-loop declarations each
+used to be a standalone script with its own token list, lexer rules and
+parse tables, all built on import. Here they share one token set, one
+FastLexer and one set of grammar rules. Each construct is a mode whose
+start symbol is listed in MODES.
+
+Nothing is built on import, and ply.yacc is not even imported then. The
+first parse in a mode loads that mode's table module from jsparse/tables,
+or builds and writes it when the grammar has changed. Only the rules
+reachable from the mode's start symbol are handed to yacc, so using one
+mode never pays for the rules of the others.
+
+parse() returns a ParseResult like ALL.parse_js_code(). Its tree is a
+Declaration for the variable, array and object modes, and a FunctionDecl or
+While node for the other two. describe() turns it into the line the scripts
+print. Given a LiteralInterner, parse() freezes and shares the literal values;
+see jsparse/interning.py.
+"""
+import collections
+import functools
+
+from jsparse.diagnostics import syntax_error
+from jsparse.expressions import PRECEDENCE, p_expr_binop, p_expr_id, p_expr_number, p_expr_parens
+from jsparse.lexer import FastLexer
+from jsparse.nodes import Assign, ExprStatement, FunctionDecl, Identifier, While
+from jsparse.printer import to_infix
+
+# Mode -> start symbol
+MODES = {
+    'variable': 'variable_declaration',
+    'array': 'array_declaration',
+    'function': 'function_declaration',
+    'object': 'object_declaration',
+    'while': 'while_loop',
+}
+
+PROMPTS = {
+    'variable': 'Enter JavaScript variable declaration: ',
+    'array': 'Enter JavaScript array declaration: ',
+    'function': 'Enter JavaScript function declaration: ',
+    'object': 'Enter JavaScript object declaration: ',
+    'while': 'Enter JavaScript while loop: ',
+}
+
+# Result of parse(): tree is None when the input did not parse; illegal holds (character, offset) pairs
+ParseResult = collections.namedtuple('ParseResult', 'tree tokens errors illegal')
+
+# value is None for a variable declared without one
+Declaration = collections.namedtuple('Declaration', 'kind name value')
+
+# ============= LEXER ====================
+
+reserved = {
+    'var': 'VAR', 'let': 'LET', 'const': 'CONST',
+    'function': 'FUNCTION', 'while': 'WHILE',
+    'true': 'TRUE', 'false': 'FALSE', 'null': 'NULL',
+}
+
+_RULES = [
+    ('ID', r'[a-zA-Z_][a-zA-Z0-9_]*'),
+    ('NUMBER', r'\d+(\.\d+)?'),
+    ('STRING', r'\"([^\\\n]|(\\.))*?\"|\'.*?\''),
+    ('COMPARISON', r'==|!=|<=|>=|<|>'),  # Before ASSIGN, so '==' is not read as two '='
+    ('NEWLINE', r'\n+'),
+    ('ASSIGN', r'='), ('SEMICOLON', r';'), ('COMMA', r','), ('COLON', r':'),
+    ('LPAREN', r'\('), ('RPAREN', r'\)'), ('LBRACE', r'\{'), ('RBRACE', r'\}'),
+    ('LBRACKET', r'\['), ('RBRACKET', r'\]'),
+    ('PLUS', r'\+'), ('MINUS', r'-'), ('TIMES', r'\*'), ('DIVIDE', r'/'), ('AND', r'&&'), ('OR', r'\|\|'),
+]
+
+tokens = [name for name, regex in _RULES if name != 'NEWLINE'] + sorted(set(reserved.values()))
+
+
+def _number(text):
+    return float(text) if '.' in text else int(text)
+
+
+def _string(text):
+    return text[1:-1]
+
+
+@functools.lru_cache(maxsize=None)
+def lexer():
+    """Return the shared FastLexer, building it on first use."""
+    return FastLexer(_RULES, reserved=reserved, converters={'NUMBER': _number, 'STRING': _string})
+
+
+def tokenize(code, report=True):
+    """Return the TokenStream for code; report=False leaves illegal characters unprinted."""
+    return lexer().tokenize_stream(code, report=report)
+
+# ============= PARSER ====================
+
+# Shared by the variable, array and object declarations
+def p_kind(p):
+    '''kind : VAR
+            | LET
+            | CONST'''
+    p[0] = p[1]
+
+def p_scalar(p):
+    '''scalar : NUMBER
+              | STRING'''
+    p[0] = p[1] if _interner is None else _interner.scalar(p[1])
+
+def p_scalar_boolean(p):
+    '''scalar : TRUE
+              | FALSE'''
+    p[0] = p[1] == 'true'
+
+def p_literal(p):
+    '''literal : scalar'''
+    p[0] = p[1]
+
+def p_literal_null(p):
+    '''literal : NULL'''
+    p[0] = None
+
+# Variable declarations
+def p_variable_declaration(p):
+    '''variable_declaration : kind ID SEMICOLON
+                            | kind ID ASSIGN scalar SEMICOLON'''
+    p[0] = Declaration(p[1], p[2], p[4] if len(p) == 6 else None)
+
+# Array declarations
+def p_array_declaration(p):
+    '''array_declaration : kind ID ASSIGN array SEMICOLON'''
+    p[0] = Declaration(p[1], p[2], p[4])
+
+def p_array(p):
+    '''array : LBRACKET array_elements RBRACKET
+             | LBRACKET RBRACKET'''
+    elements = p[2] if len(p) == 4 else []
+    p[0] = elements if _interner is None else _interner.array(elements)
+
+# Lists are extended in place so long literals stay linear
+def p_array_elements(p):
+    '''array_elements : array_elements COMMA array_element
+                      | array_element'''
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+
+def p_array_element(p):
+    '''array_element : literal
+                     | array'''  # Arrays nest, but hold no objects
+    p[0] = p[1]
+
+# Object declarations; their values may be objects and arrays of values
+def p_object_declaration(p):
+    '''object_declaration : kind ID ASSIGN object SEMICOLON'''
+    p[0] = Declaration(p[1], p[2], p[4])
+
+def p_object(p):
+    '''object : LBRACE object_properties RBRACE
+              | LBRACE RBRACE'''
+    properties = p[2] if len(p) == 4 else {}
+    p[0] = properties if _interner is None else _interner.object(properties)
+
+def p_object_properties(p):
+    '''object_properties : object_properties COMMA key_value
+                         | key_value'''
+    key, value = p[len(p) - 1]
+    if len(p) == 4:
+        p[1][key] = value
+        p[0] = p[1]
+    else:
+        p[0] = {key: value}
+
+def p_key_value(p):
+    '''key_value : ID COLON value
+                 | NUMBER COLON value'''  # Allow NUMBER as key
+    p[0] = (p[1] if _interner is None else _interner.scalar(p[1]), p[3])
+
+def p_value(p):
+    '''value : literal
+             | object
+             | value_array'''
+    p[0] = p[1]
+
+def p_value_array(p):
+    '''value_array : LBRACKET values RBRACKET
+                   | LBRACKET RBRACKET'''
+    elements = p[2] if len(p) == 4 else []
+    p[0] = elements if _interner is None else _interner.array(elements)
+
+def p_values(p):
+    '''values : values COMMA value
+              | value'''
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+
+# Function declarations, with an empty body
+def p_function_declaration(p):
+    '''function_declaration : FUNCTION ID LPAREN params RPAREN LBRACE RBRACE'''
+    p[0] = FunctionDecl(p[2], p[4], [], p.lexpos(1))
+
+def p_params(p):
+    '''params : param_list
+              | empty'''
+    p[0] = p[1] or []
+
+def p_param_list(p):
+    '''param_list : param_list COMMA ID
+                  | ID'''
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+
+# While loops, with conditions and values from the jsparse.expressions rules
+def p_while_loop(p):
+    '''while_loop : WHILE LPAREN expr RPAREN LBRACE statements RBRACE'''
+    p[0] = While(p[3], p[6], p.lexpos(1))
+
+def p_statements(p):
+    '''statements : statements statement
+                  | empty'''  # A block starts empty and gains one statement at a time
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = []
+
+def p_statement_assign(p):
+    '''statement : ID ASSIGN expr SEMICOLON'''
+    p[0] = Assign(p[1], p[3], p.lexpos(1))
+
+def p_statement_id(p):
+    '''statement : ID SEMICOLON'''
+    p[0] = ExprStatement(Identifier(p[1], p.lexpos(1)), p.lexpos(1))
+
+def p_empty(p):
+    'empty :'
+    pass
+
+
+def _productions():
+    """Return (rule function, left-hand side, right-hand side symbols) for every p_ function."""
+    productions = []
+    for name, function in sorted(globals().items()):
+        if not name.startswith('p_'):
+            continue
+        lhs = None
+        symbols = []
+        for line in function.__doc__.splitlines():
+            words = line.split()
+            if len(words) >= 2 and words[1] == ':':
+                lhs = words[0]
+                symbols += words[2:]
+            elif words and words[0] == '|':
+                symbols += words[1:]
+        productions.append((function, lhs, symbols))
+    return productions
+
+
+def _grammar(mode):
+    """Return a class holding only the rules, tokens and precedence reachable from mode's start symbol."""
+    productions = _productions()
+    nonterminals = {lhs for function, lhs, symbols in productions}
+    reachable = {MODES[mode]}
+    pending = [MODES[mode]]
+    while pending:
+        symbol = pending.pop()
+        for function, lhs, symbols in productions:
+            if lhs == symbol:
+                for child in symbols:
+                    if child in nonterminals and child not in reachable:
+                        reachable.add(child)
+                        pending.append(child)
+    rules = {function.__name__: function for function, lhs, symbols in productions if lhs in reachable}
+    used = {symbol for function, lhs, symbols in productions if lhs in reachable for symbol in symbols}
+    grammar_tokens = [name for name in tokens if name in used]
+    precedence = []
+    for assoc, *names in PRECEDENCE:
+        names = [name for name in names if name in used]
+        if names:
+            precedence.append((assoc, *names))
+
+    def p_error(t):
+        _syntax_errors.append(syntax_error(_parsers[mode], t))
+
+    return type(f'{mode}_grammar', (), dict(rules, __module__=__name__, tokens=grammar_tokens,
+                                            precedence=tuple(precedence), start=MODES[mode], p_error=p_error))
+
+
+_parsers = {}
+_syntax_errors = []  # Diagnostics of the current parse() call
+_interner = None  # LiteralInterner of the current parse() call
+
+
+def get_parser(mode):
+    """Return the PLY parser for mode, loading or building its tables on first use."""
+    parser = _parsers.get(mode)
+    if parser is None:
+        import ply.yacc as yacc  # Importing PLY is most of the cost of a first parse
+        parser = yacc.yacc(module=_grammar(mode), debug=False, tabmodule=f'jsparse.tables.parsetab_{mode}')
+        _parsers[mode] = parser
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def grammar_version():
+    """Return the version cache entries of every mode are keyed by, hashing the sources on first use."""
+    from jsparse.cache import grammar_version  # Only cached parses pay for importing and hashing
+    return grammar_version(__file__)
+
+
+def parse(mode, code, report=True, interner=None, cache=None):
+    """Parse one construct of the given mode and return a ParseResult.
+
+    With a jsparse.interning.LiteralInterner, literal values are frozen and
+    shared with identical ones from this and earlier calls using the same interner.
+    With a ParseCache, unchanged inputs are served from disk without lexing or
+    parsing; entries are keyed by the mode and grammar_version(). Interned
+    results are never cached, since read-only mappings cannot be pickled.
+    """
+    if cache is None or interner is not None:
+        return _parse(mode, code, report, interner)
+    return cache.get_or_parse(code, f'{mode}\0{grammar_version()}', functools.partial(_parse, mode, report=report))
+
+
+def _parse(mode, code, report=True, interner=None):
+    global _interner
+    parser = get_parser(mode)
+    token_stream = tokenize(code, report)
+    del _syntax_errors[:]
+    _interner = interner
+    try:
+        tree = parser.parse(lexer=lexer(), tokenfunc=functools.partial(next, iter(token_stream), None))
+    finally:
+        _interner = None
+    return ParseResult(tree, token_stream, list(_syntax_errors), list(lexer().errors))
+
+
+def describe(mode, tree):
+    """Return the line the per-construct scripts print for a parsed construct."""
+    if mode == 'function':
+        return f"Parsed function declaration: {tree.name}({', '.join(tree.params)}) {{ }}"
+    if mode == 'while':
+        return f"Parsed while loop: while ({to_infix(tree.test)}) {{ {' '.join(map(to_infix, tree.body))} }}"
+    if tree.value is None and mode == 'variable':
+        return f'Parsed variable declaration: {tree.kind} {tree.name}'
+    return f'Parsed {mode} declaration: {tree.kind} {tree.name} = {tree.value}'
+
+
+def repl(mode):
+    """Read constructs of one mode from the prompt, echoing the tokens and the result of each."""
+    while True:
+        try:
+            s = input(PROMPTS[mode])
+        except EOFError:
+            break
+        if not s:
+            continue
+        print(f"Input: '{s}'")
+        result = parse(mode, s)
+        for token in result.tokens:
+            print(f'Token: {token.type}, Value: {token.value}')
+        for error in result.errors:
+            print(error)
+        if result.tree is not None:
+            print(describe(mode, result.tree))
@@ -0,0 +1,70 @@
+"""Structured syntax error reports.
+
+A Diagnostic records where a syntax error happened, the token found there
+and the token types the parser would have accepted instead. str() gives
+the familiar "Syntax error at ..." message.
+
+column is only known for tokens from a TokenStream, which look it up in
+the input's line index; it is None for tokens lexed into a list, and for
+Diagnostics read back from a binary dump.
+"""
+import collections
+
+
+class Diagnostic(collections.namedtuple('Diagnostic', 'lineno lexpos found value expected column',
+                                        defaults=(None,))):
+    """found is the offending token type, or 'EOF' with value None at the end of input.
+
+    An error at the end of input is located at the last token before it.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self.found == 'EOF':
+            return 'Syntax error at EOF'
+        return f"Syntax error at '{self.value}'"
+
+    def describe(self):
+        """Return the message with its line and the expected tokens."""
+        where = f'line {self.lineno}' if self.column is None else f'line {self.lineno}, column {self.column}'
+        return f"{where}: {self}, expected {' or '.join(self.expected) or 'nothing'}"
+
+    def shifted(self, offset, lines):
+        """Return the diagnostic moved by offset characters and lines lines; the column is kept."""
+        return self._replace(lineno=self.lineno + lines, lexpos=self.lexpos + offset)
+
+
+def _accepts(parser, token_type):
+    """Return whether the parser, as it stands, could shift token_type after its pending reductions."""
+    # The parser's stack is left untouched: reductions first pop the states pushed here,
+    # then move `depth` down the original stack, so a deep stack is never copied
+    stack = parser.statestack
+    depth = len(stack)
+    pushed = []
+    # Bounded, so replaying reductions of empty productions can never loop
+    for _ in range(depth + len(parser.productions)):
+        action = parser.action[pushed[-1] if pushed else stack[depth - 1]].get(token_type)
+        if action is None:
+            return False
+        if action >= 0:  # Shift, or accept at the end of input
+            return True
+        production = parser.productions[-action]
+        popped = min(production.len, len(pushed))
+        del pushed[len(pushed) - popped:]
+        depth -= production.len - popped
+        pushed.append(parser.goto[pushed[-1] if pushed else stack[depth - 1]][production.name])
+    return False
+
+
+def syntax_error(parser, token):
+    """Build the Diagnostic for a PLY p_error call.
+
+    LALR tables merge the lookaheads of similar states, so the token types the
+    error state reduces on are replayed against the state stack and only the
+    ones that would actually be shifted are reported as expected.
+    """
+    expected = tuple(sorted('EOF' if name == '$end' else name
+                            for name in parser.action[parser.state] if _accepts(parser, name)))
+    if token is None:
+        return Diagnostic(None, None, 'EOF', None, expected)
+    return Diagnostic(token.lineno, token.lexpos, token.type, token.value, expected, token.column)
@@ -0,0 +1,59 @@
+"""Binary expression grammar shared by ALL.py and the while mode of jsparse.constructs.
+
+Operator precedence is declared in PRECEDENCE instead of being spelled out as
+layered expression/term/factor rules. Every operand is then a single `expr`
+reduction, and the LALR tables resolve operator conflicts from the table.
+A grammar module uses this by importing the p_expr_* rules into its own
+namespace, where yacc.yacc() finds them, and setting
+``precedence = PRECEDENCE``.
+"""
+from jsparse.nodes import BinOp, Identifier, Number
+
+# Binary operators from loosest to tightest binding, in PLY's precedence format
+PRECEDENCE = (
+    ('left', 'OR'),
+    ('left', 'AND'),
+    ('left', 'COMPARISON'),
+    ('left', 'PLUS', 'MINUS'),
+    ('left', 'TIMES', 'DIVIDE'),
+)
+
+_OPERATOR_TOKENS = {
+    '||': 'OR', '&&': 'AND',
+    '==': 'COMPARISON', '!=': 'COMPARISON', '<=': 'COMPARISON',
+    '>=': 'COMPARISON', '<': 'COMPARISON', '>': 'COMPARISON',
+    '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE',
+}
+
+# Operator text -> binding level, 1 being the loosest
+LEVELS = {
+    op: level
+    for level, (assoc, *names) in enumerate(PRECEDENCE, 1)
+    for op, name in _OPERATOR_TOKENS.items() if name in names
+}
+
+
+def p_expr_binop(p):
+    '''expr : expr OR expr
+            | expr AND expr
+            | expr COMPARISON expr
+            | expr PLUS expr
+            | expr MINUS expr
+            | expr TIMES expr
+            | expr DIVIDE expr'''
+    p[0] = BinOp(p[2], p[1], p[3], p[1].pos)
+
+
+def p_expr_number(p):
+    'expr : NUMBER'
+    p[0] = Number(p[1], p.lexpos(1))
+
+
+def p_expr_id(p):
+    'expr : ID'
+    p[0] = Identifier(p[1], p.lexpos(1))
+
+
+def p_expr_parens(p):
+    'expr : LPAREN expr RPAREN'
+    p[0] = p[2]
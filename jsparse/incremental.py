@@ -0,0 +1,207 @@
+"""Incremental reparsing of whole programs for editor-style use.
+
+A Document splits the text into segments, one per top-level statement
+(plus the whitespace after it). Each segment keeps its own tokens, with
+positions relative to the segment start, and its parse tree. An edit
+re-lexes and reparses only the segments it touches. The damaged range is
+widened one segment at a time while its last statement is left unfinished
+or a string literal fails to close. All other segments are reused as-is.
+
+Segment offsets and lines are stored in blocks of BLOCK_SIZE, relative to
+the block, so an edit only rewrites the blocks it touches and shifts one
+base offset per later block. Apart from copying the new text, the cost of
+an edit depends on the size of the damage, not the size of the file.
+
+An unmatched quote changes how everything after it lexes, so while the
+document contains one, edits after it are reparsed from that segment on.
+"""
+import bisect
+import importlib
+
+from jsparse.lexer import Token
+from jsparse.positions import LineIndex
+from jsparse.split import split_statements
+
+BLOCK_SIZE = 256
+
+
+class Segment:
+    __slots__ = ('tokens', 'tree', 'errors', 'open_quote')
+
+    def __init__(self, tokens, tree, errors, open_quote):
+        self.tokens = tokens  # lexpos/lineno relative to the segment start
+        self.tree = tree
+        self.errors = errors
+        self.open_quote = open_quote  # True if the segment holds a quote the lexer could not match
+
+
+def _build_segments(grammar, text, base, base_line):
+    """Lex and parse text, returning (starts, lines, segments, complete) for its statements."""
+    lexer = grammar.fast_lexer
+    tokens = lexer.tokenize(text)
+    # An unmatched quote may start a string that closes beyond this text
+    quotes = [pos for char, pos in lexer.errors if char == '"']
+    complete = not quotes
+    spans, tail = split_statements(tokens)
+    if tail < len(tokens):
+        spans.append((tail, len(tokens)))
+        complete = False
+
+    starts, lines, segments = [], [], []
+    # The lexer does not count newlines inside string literals, so lines come from the text itself.
+    # Token lines are kept relative to their segment
+    line_index = LineIndex(text)
+    token_lines = [line for line, column in line_index.positions([tok.lexpos for tok in tokens])]
+    for index, (first, end) in enumerate(spans):
+        start = 0 if index == 0 else tokens[first].lexpos
+        start_line = line_index.line(start)
+        statement = tokens[first:end]
+        for position, tok in enumerate(statement, first):
+            tok.lexpos -= start
+            tok.lineno = token_lines[position] - start_line + 1
+        tree, errors = grammar.parse_tokens(statement)
+        starts.append(base + start)
+        lines.append(base_line + start_line - 1)
+        segments.append(Segment(statement, tree, errors, False))
+    for pos in quotes:
+        # Characters between statements belong to the segment before them
+        index = bisect.bisect_right(starts, base + pos) - 1
+        if index >= 0:
+            segments[index].open_quote = True
+    return starts, lines, segments, complete
+
+
+class Block:
+    __slots__ = ('starts', 'lines', 'segments')
+
+    def __init__(self, starts, lines, segments):
+        self.starts = starts  # Segment offsets relative to the block's base offset
+        self.lines = lines  # Segment lines relative to the block's base line
+        self.segments = segments
+
+
+def _make_blocks(starts, lines, segments):
+    """Chunk absolute segment lists into (bases, base_lines, blocks)."""
+    bases, base_lines, blocks = [], [], []
+    for i in range(0, len(segments), BLOCK_SIZE):
+        base, base_line = starts[i], lines[i]
+        bases.append(base)
+        base_lines.append(base_line)
+        blocks.append(Block([start - base for start in starts[i:i + BLOCK_SIZE]],
+                            [line - base_line for line in lines[i:i + BLOCK_SIZE]],
+                            segments[i:i + BLOCK_SIZE]))
+    return bases, base_lines, blocks
+
+
+class Document:
+    """A parsed program; edit() returns an updated Document and leaves this one intact."""
+
+    def __init__(self, text, bases, base_lines, blocks, grammar, reparsed, open_quote):
+        self.text = text
+        self.bases = bases  # Absolute offset of each block's first segment
+        self.base_lines = base_lines  # Line number of each block's first segment
+        self.blocks = blocks
+        self.grammar = grammar
+        self.reparsed = reparsed  # Number of segments parsed to produce this document
+        self.open_quote = open_quote  # Offset of the first segment with an unmatched quote, or None
+
+    def _flatten(self, first, end):
+        """Return absolute (starts, lines, segments) for blocks[first:end]."""
+        starts, lines, segments = [], [], []
+        for base, base_line, block in zip(self.bases[first:end], self.base_lines[first:end], self.blocks[first:end]):
+            starts.extend(base + start for start in block.starts)
+            lines.extend(base_line + line for line in block.lines)
+            segments.extend(block.segments)
+        return starts, lines, segments
+
+    @property
+    def segments(self):
+        return [segment for block in self.blocks for segment in block.segments]
+
+    @property
+    def statements(self):
+        return [segment.tree for block in self.blocks for segment in block.segments]
+
+    @property
+    def errors(self):
+        """Diagnostics of every segment, with absolute positions."""
+        starts, lines, segments = self._flatten(0, len(self.blocks))
+        errors = []
+        for start, line, segment in zip(starts, lines, segments):
+            for error in segment.errors:
+                error = error.shifted(start, line - 1)
+                # Only the line of the error is scanned, so this stays independent of the document size
+                errors.append(error._replace(column=error.lexpos - self.text.rfind('\n', 0, error.lexpos)))
+        return errors
+
+    def tokens(self):
+        """Yield every token with absolute lexpos and lineno."""
+        starts, lines, segments = self._flatten(0, len(self.blocks))
+        for start, line, segment in zip(starts, lines, segments):
+            for tok in segment.tokens:
+                yield Token(tok.type, tok.value, line + tok.lineno - 1, start + tok.lexpos)
+
+    def edit(self, offset, deleted, inserted):
+        """Replace `deleted` characters at `offset` with `inserted` and reparse the damage."""
+        old_text = self.text
+        end = offset + deleted
+        text = old_text[:offset] + inserted + old_text[end:]
+        block_count = len(self.blocks)
+        if block_count == 0:
+            return parse_document(text, self.grammar)
+        delta = len(inserted) - deleted
+        line_delta = inserted.count('\n') - old_text.count('\n', offset, end)
+        low = offset if self.open_quote is None else min(offset, self.open_quote)
+
+        # Work on the blocks holding the damaged segments, pulling in more while the damage spreads
+        first_block = max(bisect.bisect_right(self.bases, low) - 1, 0)
+        next_block = max(bisect.bisect_right(self.bases, end) - 1, first_block) + 1
+        starts, lines, segments = self._flatten(first_block, next_block)
+        first = max(bisect.bisect_right(starts, low) - 1, 0)
+        last = max(bisect.bisect_right(starts, end) - 1, first)
+        at_start = first_block == 0 and first == 0
+        region_start = 0 if at_start else starts[first]
+        base_line = 1 if at_start else lines[first]
+        while True:
+            if last + 1 < len(starts):
+                region_end = starts[last + 1]
+            elif next_block < block_count:
+                region_end = self.bases[next_block]
+            else:
+                region_end = len(old_text)
+            new_starts, new_lines, new_segments, complete = _build_segments(
+                self.grammar, text[region_start:region_end + delta], region_start, base_line)
+            if complete or region_end == len(old_text):
+                break
+            if last + 1 == len(starts):
+                more = self._flatten(next_block, next_block + 1)
+                starts += more[0]
+                lines += more[1]
+                segments += more[2]
+                next_block += 1
+            last += 1
+
+        open_quote = next((start for start, segment in zip(new_starts, new_segments) if segment.open_quote), None)
+        if open_quote is None and self.open_quote is not None and self.open_quote >= region_end:
+            open_quote = self.open_quote + delta
+        bases, base_lines, blocks = _make_blocks(
+            starts[:first] + new_starts + [start + delta for start in starts[last + 1:]],
+            lines[:first] + new_lines + [line + line_delta for line in lines[last + 1:]],
+            segments[:first] + new_segments + segments[last + 1:])
+        return Document(
+            text,
+            self.bases[:first_block] + bases + [base + delta for base in self.bases[next_block:]],
+            self.base_lines[:first_block] + base_lines + [line + line_delta for line in self.base_lines[next_block:]],
+            self.blocks[:first_block] + blocks + self.blocks[next_block:],
+            self.grammar,
+            len(new_segments),
+            open_quote,
+        )
+
+
+def parse_document(text, grammar=None):
+    """Parse a whole program into a Document; grammar defaults to the ALL.py module."""
+    grammar = grammar or importlib.import_module('ALL')
+    starts, lines, segments, complete = _build_segments(grammar, text, 0, 1)
+    open_quote = next((start for start, segment in zip(starts, segments) if segment.open_quote), None)
+    return Document(text, *_make_blocks(starts, lines, segments), grammar, len(segments), open_quote)
@@ -0,0 +1,82 @@
+"""Hash-consing of immutable literal values for the array and object modes.
+
+Generated config and data files repeat identical sub-literals, such as
+[0, 0] or {x: 1}, thousands of times. Normally each copy gets its own list
+or dict. When a LiteralInterner is passed to jsparse.constructs.parse(),
+every literal is frozen as the parser reduces it, and looked up in the
+interner's table. Strings and numbers are kept as they are, arrays become
+tuples, and objects become read-only mappingproxy views. A literal that
+is already in the table is replaced by the stored copy.
+
+Literals are reduced bottom-up, so the elements of an array or the values
+of an object are already canonical when the container is looked up. Their
+identity therefore stands for their structure, and the lookup key of a
+container is its shape plus the ids of its elements. The table keeps every
+canonical value alive, so an id cannot be reused while it is in use. Keys
+compare values by type as well, so 1, 1.0 and true stay distinct. Object
+keys keep their order, since it is visible in JavaScript.
+
+The interner counts hits and misses. saved_bytes adds up the shallow size
+of every duplicate that a hit let go: the string or number, or the list
+or dict the parser built, which is the memory the duplicates would have
+kept. The table itself costs memory as long as the interner lives. Once
+parsing is done the interner can be dropped, and the trees keep sharing
+their literals.
+"""
+import sys
+import types
+
+_ARRAY = '['
+_OBJECT = '{'
+
+
+def _same(value):
+    return value
+
+
+class LiteralInterner:
+    __slots__ = ('_table', 'hits', 'misses', 'saved_bytes')
+
+    def __init__(self):
+        self._table = {}  # Key -> canonical value
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+    def _canonical(self, key, duplicate, freeze):
+        """Return the value stored under key, storing freeze(duplicate) first if there is none."""
+        canonical = self._table.get(key)
+        if canonical is None:
+            canonical = self._table[key] = freeze(duplicate)
+            self.misses += 1
+        else:
+            self.hits += 1
+            if canonical is not duplicate:
+                self.saved_bytes += sys.getsizeof(duplicate)
+        return canonical
+
+    def scalar(self, value):
+        """Return the canonical copy of a string or number."""
+        return self._canonical((type(value), value), value, _same)
+
+    def array(self, elements):
+        """Return the canonical tuple for a list of canonical elements."""
+        return self._canonical((_ARRAY, tuple(map(id, elements))), elements, tuple)
+
+    def object(self, properties):
+        """Return the canonical read-only mapping for a dict of canonical values."""
+        key = (_OBJECT, tuple((type(name), name, id(value)) for name, value in properties.items()))
+        return self._canonical(key, properties, types.MappingProxyType)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._table)
+
+    def stats(self):
+        """Return the counters as a dict."""
+        return {'entries': len(self._table), 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate, 'saved_bytes': self.saved_bytes}
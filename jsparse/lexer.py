@@ -0,0 +1,187 @@
+"""High-throughput lexer that feeds the PLY parsers.
+
+All token rules are combined into one compiled regular expression and the
+input is scanned with a single finditer() pass. The outer group of each
+rule maps to a precomputed integer code, so each match is dispatched with
+a list lookup. Identifiers are checked against the grammar's ``reserved``
+dict to find keywords, so no keyword needs a rule of its own.
+
+Tokens expose the ``type``, ``value``, ``lineno`` and ``lexpos`` attributes
+the PLY parser reads, and FastLexer provides the ``input()``/``token()``
+pair, so it can stand in for a ``lex.lex()`` lexer. tokenize_stream() scans
+the same way into a jsparse.tokenstream.TokenStream instead of a list.
+"""
+import gc
+import re
+
+from jsparse.tokenstream import TokenStream
+
+# Codes for the rules that do not produce a plain token
+SKIP, NEWLINE, ERROR, IDENT = range(4)
+FIRST_TOKEN_CODE = 4
+
+
+class Token:
+    # PLY attaches 'lexer' to the offending token before calling p_error
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+    column = None  # Only tokens of a TokenStream know their column
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+    def __reduce__(self):
+        # Leave out the lexer PLY may have attached
+        return Token, (self.type, self.value, self.lineno, self.lexpos)
+
+
+class FastLexer:
+    """Scan input with one master regex built from (token type, regex) rules.
+
+    Rules are tried in the order given, like PLY function rules. 'ID' is
+    looked up in ``reserved``, 'NEWLINE' only advances the line count,
+    characters in ``ignore`` are skipped, and ``converters`` maps a token
+    type, 'ID' included but not the reserved words, to a function applied
+    to its text.
+    """
+
+    def __init__(self, rules, reserved=None, ignore=' \t', converters=None):
+        self.reserved = reserved or {}
+        converters = converters or {}
+        self.type_names = [None] * FIRST_TOKEN_CODE
+        self.codes = {}
+        self._converters = [None] * FIRST_TOKEN_CODE
+        patterns = []
+        if ignore:
+            patterns.append(('_skip', SKIP, '[' + re.escape(ignore) + ']+'))
+        for name, regex in rules:
+            if name == 'NEWLINE':
+                code = NEWLINE
+            elif name == 'ID':
+                code = IDENT
+            else:
+                code = len(self.type_names)
+                self.type_names.append(name)
+                self._converters.append(converters.get(name))
+                self.codes[name] = code
+            patterns.append((name, code, regex))
+        patterns.append(('_error', ERROR, r'[\s\S]'))
+        # Identifiers and keywords get type codes too, for TokenStream
+        for name in ['ID'] + sorted(set(self.reserved.values())):
+            if name not in self.codes:
+                self.codes[name] = len(self.type_names)
+                self.type_names.append(name)
+                self._converters.append(converters.get('ID') if name == 'ID' else None)
+        self._id_convert = converters.get('ID')
+        self._word_codes = {word: self.codes[name] for word, name in self.reserved.items()}
+        self._id_code = self.codes['ID']
+
+        self._master = re.compile('|'.join(f'(?P<{name}>{regex})' for name, code, regex in patterns))
+        # Outer group index -> rule code; inner groups of a rule are never the last to close
+        self._group_codes = [SKIP] * (self._master.groups + 1)
+        for name, code, regex in patterns:
+            self._group_codes[self._master.groupindex[name]] = code
+        self.lineno = 1
+        self.lexpos = 0
+        self.errors = []  # (character, lexpos) of each illegal character in the last input
+        self._tokens = []
+
+    def tokenize(self, data, lineno=1, report=True):
+        """Return the list of tokens in data; report=False leaves illegal characters unprinted."""
+        tokens = []
+        append = tokens.append
+        group_codes = self._group_codes
+        type_names = self.type_names
+        converters = self._converters
+        reserved = self.reserved
+        id_convert = self._id_convert
+        errors = []
+        # Tokens never form reference cycles, so the cyclic GC passes triggered by
+        # allocating hundreds of thousands of them are pure overhead
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for match in self._master.finditer(data):
+                code = group_codes[match.lastindex]
+                if code >= FIRST_TOKEN_CODE:
+                    convert = converters[code]
+                    value = match.group()
+                    append(Token(type_names[code], convert(value) if convert else value, lineno, match.start()))
+                elif code == IDENT:
+                    value = match.group()
+                    token_type = reserved.get(value, 'ID')
+                    if id_convert and token_type == 'ID':
+                        value = id_convert(value)
+                    append(Token(token_type, value, lineno, match.start()))
+                elif code == NEWLINE:
+                    lineno += match.end() - match.start()
+                elif code == ERROR:
+                    errors.append((match.group(), match.start()))
+                    if report:
+                        print(f"Illegal character '{match.group()}'")
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.lineno = lineno
+        self.errors = errors
+        return tokens
+
+    def tokenize_stream(self, data, lineno=1, report=True):
+        """Like tokenize(), but return a TokenStream whose values are decoded only when read.
+
+        No line numbers are counted while scanning; the stream looks them up from lexpos when asked.
+        """
+        stream = self.empty_stream(data, lineno)
+        codes = stream.codes.append
+        starts = stream.starts.append
+        lengths = stream.lengths.append
+        group_codes = self._group_codes
+        word_codes = self._word_codes
+        id_code = self._id_code
+        errors = []
+        for match in self._master.finditer(data):
+            code = group_codes[match.lastindex]
+            if code >= FIRST_TOKEN_CODE or code == IDENT:
+                start, end = match.span()
+                if code == IDENT:
+                    code = word_codes.get(match.group(), id_code)
+                codes(code)
+                starts(start)
+                lengths(end - start)
+            elif code == ERROR:
+                errors.append((match.group(), match.start()))
+                if report:
+                    print(f"Illegal character '{match.group()}'")
+        self.lineno = lineno + data.count('\n')
+        self.errors = errors
+        return stream
+
+    def empty_stream(self, data, lineno=1):
+        """Return a TokenStream over data with no tokens yet, for tokens of data lexed elsewhere."""
+        return TokenStream(data, self.type_names, self._converters, lineno)
+
+    def match_end(self, data, pos):
+        """Return the offset where the scanner's match at pos in data ends."""
+        return self._master.match(data, pos).end()
+
+    # --- PLY lexer interface ---
+
+    def input(self, data):
+        self._tokens = self.tokenize(data)
+        self._tokens.reverse()
+        self.lexpos = 0
+
+    def token(self):
+        if not self._tokens:
+            return None
+        tok = self._tokens.pop()
+        self.lexpos = tok.lexpos
+        return tok
+
+    def __iter__(self):
+        return iter(self.token, None)
@@ -0,0 +1,215 @@
+"""AST node classes built by the ALL.py grammar.
+
+Nodes use __slots__ so large trees stay compact; turning a tree back into
+text is left to the printer in jsparse.printer.
+
+Every node has a pos: the offset (lexpos) in the source where the node
+starts, or None for a node that was not parsed from text. Its line and
+column come from the jsparse.positions.LineIndex of the input, e.g.
+result.tokens.line_index.position(node.pos). pos is not part of a node's
+value: equality, repr() and the output formats ignore it.
+
+Nodes pickle as a flat postorder list of their fields rather than as
+nested objects, so a tree of any depth can be sent to or from a worker
+process or stored in the parse cache without hitting the recursion limit.
+"""
+from jsparse.preparse import LazyBody
+
+
+class Node:
+    __slots__ = ('pos',)  # Subclasses list their value fields only
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _unflatten, (_flatten(self),)
+
+
+# Opcodes of the flat form: each entry is (opcode, argument)
+_VALUE, _LIST, _TUPLE, _NODE = range(4)
+
+
+class _Emit:
+    __slots__ = ('entry',)
+
+    def __init__(self, entry):
+        self.entry = entry
+
+
+def _flatten(root):
+    """Return the postorder list of entries that _unflatten() turns back into root."""
+    entries = []
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is _Emit:
+            entries.append(item.entry)
+        elif isinstance(item, Node):
+            stack.append(_Emit((_NODE, (kind, item.pos))))
+            stack.extend(getattr(item, name) for name in reversed(kind.__slots__))
+        elif kind is tuple:
+            stack.append(_Emit((_TUPLE, len(item))))
+            stack.extend(reversed(item))
+        elif isinstance(item, (list, LazyBody)):
+            stack.append(_Emit((_LIST, len(item))))
+            stack.extend(reversed(item))
+        else:
+            entries.append((_VALUE, item))
+    return entries
+
+
+def _unflatten(entries):
+    values = []
+    for opcode, argument in entries:
+        if opcode == _VALUE:
+            values.append(argument)
+        elif opcode == _NODE:
+            kind, pos = argument
+            node = kind.__new__(kind)
+            count = len(kind.__slots__)
+            if count:
+                for name, value in zip(kind.__slots__, values[-count:]):
+                    setattr(node, name, value)
+                del values[-count:]
+            node.pos = pos
+            values.append(node)
+        else:
+            items = values[len(values) - argument:]
+            del values[len(values) - argument:]
+            values.append(items if opcode == _LIST else tuple(items))
+    return values[0]
+
+
+# --- Expressions ---
+
+class Number(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, value, pos=None):
+        self.value = value
+        self.pos = pos
+
+
+class String(Node):
+    __slots__ = ('value',)  # Source text of the literal, quotes included
+
+    def __init__(self, value, pos=None):
+        self.value = value
+        self.pos = pos
+
+
+class Identifier(Node):
+    __slots__ = ('name',)
+
+    def __init__(self, name, pos=None):
+        self.name = name
+        self.pos = pos
+
+
+class BinOp(Node):
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right, pos=None):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.pos = pos
+
+
+class Call(Node):
+    __slots__ = ('callee', 'args')  # callee is the called function's name
+
+    def __init__(self, callee, args, pos=None):
+        self.callee = callee
+        self.args = args
+        self.pos = pos
+
+
+class ArrayLiteral(Node):
+    __slots__ = ('elements',)
+
+    def __init__(self, elements, pos=None):
+        self.elements = elements
+        self.pos = pos
+
+
+class ObjectLiteral(Node):
+    __slots__ = ('properties',)  # List of (key, value) pairs in source order
+
+    def __init__(self, properties, pos=None):
+        self.properties = properties
+        self.pos = pos
+
+
+# --- Statements ---
+
+class VarDecl(Node):
+    __slots__ = ('kind', 'name', 'init')  # kind is 'var', 'let' or 'const'; init may be None
+
+    def __init__(self, kind, name, init=None, pos=None):
+        self.kind = kind
+        self.name = name
+        self.init = init
+        self.pos = pos
+
+
+class Assign(Node):
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value, pos=None):
+        self.name = name
+        self.value = value
+        self.pos = pos
+
+
+class ExprStatement(Node):
+    __slots__ = ('expr',)
+
+    def __init__(self, expr, pos=None):
+        self.expr = expr
+        self.pos = pos
+
+
+class Return(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, value, pos=None):
+        self.value = value
+        self.pos = pos
+
+
+class While(Node):
+    __slots__ = ('test', 'body')
+
+    def __init__(self, test, body, pos=None):
+        self.test = test
+        self.body = body
+        self.pos = pos
+
+
+class FunctionDecl(Node):
+    __slots__ = ('name', 'params', 'body')
+
+    def __init__(self, name, params, body, pos=None):
+        self.name = name
+        self.params = params
+        self.body = body
+        self.pos = pos
+
+
+class Program(Node):
+    __slots__ = ('body',)  # Top-level statements in source order
+
+    def __init__(self, body, pos=None):
+        self.body = body
+        self.pos = pos
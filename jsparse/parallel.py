@@ -0,0 +1,107 @@
+"""Parse many files across a process pool.
+
+Each worker imports the parser module once from the pool initializer, so
+the lexer and LALR tables are built or loaded once per process and then
+reused for every file that worker receives. Results are yielded in input
+order; a file that fails to read or parse gives a FileResult with
+``exception`` set instead of stopping the run.
+"""
+import collections
+import concurrent.futures
+import functools
+import importlib
+import os
+import pickle
+import time
+
+from jsparse import stats as stats_module
+from jsparse.cache import ParseCache
+
+# tree and tokens are only kept when asked for, since sending them back to the parent costs a pickle round trip.
+# stats is the Stats object the file was profiled into, when profiling is on.
+# illegal lists the characters the lexer skipped as (character, offset, line, column).
+# cache_hit tells whether a worker's ParseCache answered the file; it is None without a cache.
+FileResult = collections.namedtuple('FileResult',
+                                    'path size tree tokens errors seconds exception stats illegal cache_hit',
+                                    defaults=(None, (), None))
+
+
+def parse_file(path, parse, keep_tree=False, stats=None):
+    """Read and parse one file with parse(code, verbose=False) and return its FileResult.
+
+    parse returns an ALL.ParseResult; its illegal characters are located with the token stream's line index.
+
+    keep_tree keeps both the tree and the token list in the result. With a
+    Stats object, reading the file is timed and stats is passed on to parse.
+    """
+    try:
+        with stats_module.phase(stats, 'read'):
+            with open(path, encoding='utf-8') as f:
+                code = f.read()
+        start = time.perf_counter()
+        if stats is None:
+            result = parse(code, verbose=False)
+        else:
+            result = parse(code, verbose=False, stats=stats)
+        elapsed = time.perf_counter() - start
+    except Exception as exc:
+        return FileResult(path, 0, None, None, [], 0.0, f'{type(exc).__name__}: {exc}', stats)
+    line_index = result.tokens.line_index
+    illegal = [(char, pos) + line_index.position(pos) for char, pos in result.illegal]
+    return FileResult(path, len(code.encode('utf-8')), result.tree if keep_tree else None,
+                      result.tokens if keep_tree else None, result.errors, elapsed, None, stats, illegal)
+
+
+_worker_parse = None
+_worker_keep_tree = False
+_worker_stats = False
+_worker_cache = None
+
+
+def _init_worker(parser_module, keep_tree, cache_dir, cache_bytes, collect_stats=False):
+    global _worker_parse, _worker_keep_tree, _worker_stats, _worker_cache
+    module = importlib.import_module(parser_module)
+    # Illegal characters come back in FileResult.illegal instead of being printed by the workers
+    _worker_parse = functools.partial(module.parse_js_code, report=False)
+    if cache_dir:
+        _worker_cache = ParseCache(cache_dir, cache_bytes, module.GRAMMAR_VERSION)
+        _worker_parse = functools.partial(_worker_parse, cache=_worker_cache)
+    _worker_keep_tree = keep_tree
+    _worker_stats = collect_stats
+
+
+def _parse_in_worker(path):
+    # Each file gets its own Stats, which the parent merges
+    stats = stats_module.Stats() if _worker_stats else None
+    hits = _worker_cache and _worker_cache.hits
+    result = parse_file(path, _worker_parse, _worker_keep_tree, stats)
+    if _worker_cache is not None and not result.exception:
+        result = result._replace(cache_hit=_worker_cache.hits > hits)
+    if stats is not None:
+        stats.sample_memory()
+    # Pickled here so a result that cannot be sent back fails its own file rather than the whole pool
+    try:
+        return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except (RecursionError, pickle.PicklingError) as exc:
+        failed = result._replace(tree=None, tokens=None, exception=f'{type(exc).__name__}: {exc}')
+        return pickle.dumps(failed, pickle.HIGHEST_PROTOCOL)
+
+
+def parse_files(paths, workers=None, parser_module='ALL', keep_tree=False, chunksize=None,
+                cache_dir=None, cache_bytes=256 * 1024 * 1024, collect_stats=False):
+    """Yield a FileResult per path, in input order, parsing on `workers` processes.
+
+    With cache_dir, each worker reads and fills a ParseCache in that directory; FileResult.cache_hit
+    tells which files it answered. Workers only see their own writes, so ParseCache.trim() the
+    directory afterwards to keep it under cache_bytes.
+    collect_stats profiles every file into a Stats object returned in FileResult.stats.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # A few chunks per worker keeps the pool balanced without a round trip per file
+        chunksize = max(1, len(paths) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(parser_module, keep_tree, cache_dir, cache_bytes, collect_stats)) as pool:
+        yield from map(pickle.loads, pool.map(_parse_in_worker, paths, chunksize=chunksize))
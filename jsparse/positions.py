@@ -0,0 +1,80 @@
+"""Line and column lookup from character offsets.
+
+The lexer records only where each token starts (its lexpos). A LineIndex
+holds the offset at which every line of the input starts and turns an
+offset into a line and column with a binary search. The index is built by
+one scan of the text the first time a position is asked for, so an input
+whose positions are never reported never pays for it.
+
+Lines start at first_line and columns at 1. For a fragment of a larger
+text, first_line and first_column give the position of its first
+character, so lookups return positions in the whole text. Every '\\n' ends
+a line, including one inside a string literal.
+"""
+import array
+import bisect
+import math
+import re
+
+_NEWLINE = re.compile('\n')
+
+# Typecode of the offsets: at least 4 bytes on every supported platform
+_OFFSET_TYPECODE = 'I' if array.array('I').itemsize >= 4 else 'L'
+
+
+class LineIndex:
+    __slots__ = ('text', 'first_line', 'first_column', '_starts')
+
+    def __init__(self, text, first_line=1, first_column=1):
+        self.text = text
+        self.first_line = first_line
+        self.first_column = first_column
+        self._starts = None
+
+    def starts(self):
+        """Return the array of line-start offsets, building it on first use."""
+        starts = self._starts
+        if starts is None:
+            starts = self._starts = array.array(_OFFSET_TYPECODE, [0])
+            starts.extend(match.end() for match in _NEWLINE.finditer(self.text))
+        return starts
+
+    def line(self, pos):
+        """Return the line holding offset pos."""
+        return bisect.bisect_right(self.starts(), pos) - 1 + self.first_line
+
+    def column(self, pos):
+        """Return the column of offset pos within its line."""
+        return self.position(pos)[1]
+
+    def position(self, pos):
+        """Return (line, column) of offset pos."""
+        starts = self.starts()
+        index = bisect.bisect_right(starts, pos) - 1
+        if index:
+            return index + self.first_line, pos - starts[index] + 1
+        return self.first_line, pos + self.first_column
+
+    def positions(self, offsets):
+        """Return the (line, column) of every offset in an ascending sequence, merging instead of searching."""
+        starts = self.starts()
+        count = len(starts)
+        result = []
+        append = result.append
+        if not offsets:
+            return result
+        index = bisect.bisect_right(starts, offsets[0]) - 1
+        next_start = starts[index + 1] if index + 1 < count else math.inf
+        for pos in offsets:
+            while pos >= next_start:
+                index += 1
+                next_start = starts[index + 1] if index + 1 < count else math.inf
+            if index:
+                append((index + self.first_line, pos - starts[index] + 1))
+            else:
+                append((self.first_line, pos + self.first_column))
+        return result
+
+    def __reduce__(self):
+        # The offsets are cheaper to rebuild than to pickle
+        return LineIndex, (self.text, self.first_line, self.first_column)
@@ -0,0 +1,101 @@
+"""Lazy parsing of while and function bodies ("preparse" mode).
+
+A consumer that only wants the declared functions and their parameters
+still pays for parsing every statement in every body. In preparse mode the
+parser reads only the header of a top-level while or function statement.
+Header means its test, or its name and parameters. The body's closing
+brace is already known from splitting the program into statements. The
+tokens in between become a LazyBody, which records their span and parses
+them the first time the body is read.
+
+A LazyBody is a read-only sequence, so code that iterates, indexes or
+compares bodies works unchanged. It pickles as the plain list of
+statements. Syntax errors inside a body are only found when it is parsed,
+and are kept in its errors attribute instead of the program's.
+"""
+import collections.abc
+
+from jsparse.tokenstream import token_types
+
+
+def body_start(tokens, first, end):
+    """Return the index of the '{' opening the body of the statement tokens[first:end], or None.
+
+    It is the first '{' outside parentheses, since a while test may hold object literals.
+    """
+    depth = 0
+    for index, kind in enumerate(token_types(tokens[first:end]), first):
+        if kind == 'LPAREN':
+            depth += 1
+        elif kind == 'RPAREN':
+            depth -= 1
+        elif kind == 'LBRACE' and depth <= 0:
+            return index
+    return None
+
+
+def function_header(tokens):
+    """Return (name, params) if tokens are exactly a valid 'function name(params) {', else None."""
+    kinds = list(token_types(tokens))
+    count = len(kinds)
+    if count < 5 or kinds[:3] != ['FUNCTION', 'ID', 'LPAREN'] or kinds[-2:] != ['RPAREN', 'LBRACE']:
+        return None
+    params = kinds[3:-2]
+    if params and (params[::2].count('ID') != (len(params) + 1) // 2
+                   or params[1::2].count('COMMA') != len(params) // 2 or len(params) % 2 == 0):
+        return None
+    return tokens[1].value, [tokens[index].value for index in range(3, count - 2, 2)]
+
+
+class LazyBody(collections.abc.Sequence):
+    """The statements of a while or function body, parsed by parse(tokens) on first access.
+
+    parse returns (Program, syntax errors), like ALL.parse_program_tokens.
+    """
+    __slots__ = ('span', 'errors', '_tokens', '_parse', '_statements')
+
+    def __init__(self, tokens, parse, span):
+        self.span = span  # (start, end) offsets of the body text between the braces
+        self.errors = None  # Syntax errors of the body once parsed
+        self._tokens = tokens
+        self._parse = parse
+        self._statements = None
+
+    @property
+    def parsed(self):
+        return self._statements is not None
+
+    def statements(self):
+        """Return the list of statements, parsing the body if it has not been yet."""
+        if self._statements is None:
+            program, self.errors = self._parse(self._tokens)
+            self._statements = program.body
+            self._tokens = None
+        return self._statements
+
+    def __len__(self):
+        return len(self.statements())
+
+    def __getitem__(self, index):
+        return self.statements()[index]
+
+    def __iter__(self):
+        return iter(self.statements())
+
+    def __reversed__(self):
+        return reversed(self.statements())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBody):
+            other = other.statements()
+        return self.statements() == other if isinstance(other, list) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        if self._statements is None:
+            return f'<unparsed body at {self.span[0]}:{self.span[1]}>'
+        return repr(self._statements)
+
+    def __reduce__(self):
+        return list, (self.statements(),)
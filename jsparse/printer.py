@@ -0,0 +1,135 @@
+"""Render AST nodes from jsparse.nodes back into text.
+
+The printer walks the tree with an explicit stack and joins the pieces
+once at the end, so output is linear in the size of the tree and deep
+expression chains cannot hit the recursion limit. to_source() brackets
+every binary operation; to_infix() only adds the parentheses the operator
+precedence in jsparse.expressions requires.
+"""
+from jsparse.expressions import LEVELS
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    Number, ObjectLiteral, Program, Return, String, VarDecl, While,
+)
+
+
+def _separated(items, separator):
+    parts = []
+    for item in items:
+        if parts:
+            parts.append(separator)
+        parts.append(item)
+    return parts
+
+
+def _block(statements):
+    if not statements:
+        return ['{ }']
+    return ['{ '] + _separated(statements, ' ') + [' }']
+
+
+def _object_parts(node):
+    parts = ['{']
+    for key, value in node.properties:
+        if len(parts) > 1:
+            parts.append(', ')
+        parts.append(f'{key}: ')
+        parts.append(value)
+    parts.append('}')
+    return parts
+
+
+def _var_parts(node):
+    if node.init is None:
+        return [f'{node.kind} {node.name};']
+    return [f'{node.kind} {node.name} = ', node.init, ';']
+
+
+# Each entry returns the pieces of a node: strings are emitted as-is, nodes are expanded in turn
+_PARTS = {
+    Number: lambda node: [str(node.value)],
+    String: lambda node: [node.value],
+    Identifier: lambda node: [node.name],
+    BinOp: lambda node: ['(', node.left, f' {node.op} ', node.right, ')'],
+    Call: lambda node: [f'{node.callee}('] + _separated(node.args, ', ') + [')'],
+    ArrayLiteral: lambda node: ['['] + _separated(node.elements, ', ') + [']'],
+    ObjectLiteral: _object_parts,
+    VarDecl: _var_parts,
+    Assign: lambda node: [f'{node.name} = ', node.value, ';'],
+    ExprStatement: lambda node: [node.expr, ';'],
+    Return: lambda node: ['return ', node.value, ';'],
+    While: lambda node: ['while (', node.test, ') '] + _block(node.body),
+    FunctionDecl: lambda node: [f"function {node.name}({', '.join(node.params)}) "] + _block(node.body),
+    Program: lambda node: _separated(node.body, '\n'),
+}
+
+
+def _infix_operand(node, level):
+    if type(node) is BinOp and LEVELS[node.op] < level:
+        return ['(', node, ')']
+    return [node]
+
+
+def _infix_parts(node):
+    level = LEVELS[node.op]
+    # Every operator is left-associative, so only a right operand at the same level needs parentheses
+    return (_infix_operand(node.left, level) + [f' {node.op} ']
+            + _infix_operand(node.right, level + 1))
+
+
+_INFIX_PARTS = dict(_PARTS)
+_INFIX_PARTS[BinOp] = _infix_parts
+
+
+def _render(node, parts):
+    out = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            out.append(item)
+        else:
+            stack.extend(reversed(parts[type(item)](item)))
+    return ''.join(out)
+
+
+def to_source(node):
+    """Return the text of an expression or statement node."""
+    return _render(node, _PARTS)
+
+
+def to_infix(node):
+    """Return the text of a node with binary operations parenthesized only where needed."""
+    return _render(node, _INFIX_PARTS)
+
+
+_VAR_LABELS = {
+    'var': 'Var declaration with assignment',
+    'let': 'Let declaration',
+    'const': 'Const declaration',
+}
+
+
+def describe(statement):
+    """Return the one-line summary ALL.py prints for a parsed top-level statement.
+
+    A Program gives one line per statement.
+    """
+    kind = type(statement)
+    if kind is Program:
+        return '\n'.join(describe(child) for child in statement.body)
+    if kind is VarDecl:
+        if statement.init is None:
+            return f'Var declaration without assignment: {statement.name}'
+        return f'{_VAR_LABELS[statement.kind]}: {statement.name} = {to_source(statement.init)}'
+    if kind is Assign:
+        return f'{statement.name} = {to_source(statement.value)}'
+    if kind is ExprStatement:
+        return f'Expression: {to_source(statement.expr)}'
+    if kind is Return:
+        return f'Return statement: {to_source(statement.value)}'
+    if kind is While:
+        return f'While loop: {to_source(statement)}'
+    if kind is FunctionDecl:
+        return f'Function declaration: {to_source(statement)}'
+    return to_source(statement)
@@ -0,0 +1,234 @@
+"""Scope and symbol-table pass over parsed programs.
+
+analyze() walks a Program from ALL.py once and builds its scope tree: the
+program scope, a scope for every function and a block scope for every
+while body that declares let or const names. var and function
+declarations are hoisted to the enclosing function (or the program), and
+let and const to their block, before the statements of that scope are
+visited, so a name refers to the same binding wherever it is used in the
+scope.
+
+While walking, every name in scope is kept in one dict mapping it to its
+innermost binding. Entering a scope records the bindings it shadows and
+leaving it puts them back, so resolving a name or checking a redeclaration
+is a single dict lookup however deeply scopes nest, and the pass is linear
+in the size of the tree. The walk uses an explicit stack, like the
+printer, so deep trees cannot hit the recursion limit.
+
+ALL.py interns identifiers as it lexes them, so every use of a name in a
+tree, and its Symbol, share one string. Names from other trees are interned
+here when they are declared.
+
+Reported as errors: let, const, function or parameter names declared twice
+in one scope (var may repeat var, and function), and assignments to const
+names. Names used without any declaration are treated as globals and
+counted in Analysis.unresolved.
+"""
+import collections
+import gc
+import sys
+
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    ObjectLiteral, Return, VarDecl, While,
+)
+
+# Result of analyze(): the program Scope, the SemanticErrors and {undeclared name: number of uses}
+Analysis = collections.namedtuple('Analysis', 'scope errors unresolved')
+
+_LEXICAL = ('let', 'const')
+
+
+class SemanticError(collections.namedtuple('SemanticError', 'message name node')):
+    """node is the VarDecl, Assign or FunctionDecl at fault; for a repeated parameter, its function."""
+    __slots__ = ()
+
+    def __str__(self):
+        return self.message
+
+
+class Symbol:
+    """One declared name. kind is 'var', 'let', 'const', 'function' or 'param'."""
+    __slots__ = ('name', 'kind', 'scope', 'node', 'reads', 'writes')
+
+    def __init__(self, name, kind, scope, node):
+        self.name = name
+        self.kind = kind
+        self.scope = scope
+        self.node = node  # The declaring VarDecl or FunctionDecl
+        self.reads = 0
+        self.writes = 0  # Assignments and initializers
+
+    def __repr__(self):
+        return f'<{self.kind} {self.name}>'
+
+
+class Scope:
+    """kind is 'program', 'function' or 'block'; node is the Program, FunctionDecl or While."""
+    __slots__ = ('kind', 'node', 'parent', 'symbols', 'children')
+
+    def __init__(self, kind, node, parent):
+        self.kind = kind
+        self.node = node
+        self.parent = parent
+        self.symbols = {}  # Name -> Symbol, in declaration order
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+    def __repr__(self):
+        return f"<{self.kind} scope: {', '.join(self.symbols)}>"
+
+
+def _hoisted(body):
+    """Yield the var and function declarations of a function body, including those in while loops."""
+    stack = list(reversed(body))
+    while stack:
+        statement = stack.pop()
+        kind = type(statement)
+        if kind is FunctionDecl or (kind is VarDecl and statement.kind == 'var'):
+            yield statement
+        elif kind is While:
+            stack.extend(reversed(statement.body))
+
+
+class _Body:
+    """Stack item for a while loop's body, visited after its test."""
+    __slots__ = ('loop',)
+
+    def __init__(self, loop):
+        self.loop = loop
+
+
+class _Analyzer:
+    def __init__(self):
+        self.bindings = {}  # Name -> innermost Symbol in scope
+        self.errors = []
+        self.unresolved = collections.Counter()
+
+    def declare(self, scope, name, kind, node, shadowed):
+        symbols = scope.symbols
+        previous = symbols.get(name)
+        if previous is not None:
+            if kind in _LEXICAL or previous.kind in _LEXICAL or kind == previous.kind == 'param':
+                self.errors.append(SemanticError(f"Identifier '{name}' has already been declared", name, node))
+            if kind == 'function' and previous.kind != 'function':
+                previous.kind = 'function'  # The function value replaces a var or parameter of the same name
+                previous.node = node
+            return previous
+        name = sys.intern(name)
+        symbol = symbols[name] = Symbol(name, kind, scope, node)
+        shadowed.append((name, self.bindings.get(name)))
+        self.bindings[name] = symbol
+        return symbol
+
+    def enter_function(self, scope, params, body):
+        """Declare the parameters and hoisted names of a function scope; return the bindings it shadows."""
+        shadowed = []
+        for param in params:
+            self.declare(scope, param, 'param', scope.node, shadowed)
+        for statement in _hoisted(body):
+            if type(statement) is FunctionDecl:
+                self.declare(scope, statement.name, 'function', statement, shadowed)
+            else:
+                self.declare(scope, statement.name, 'var', statement, shadowed)
+        self.declare_lexical(scope, body, shadowed)
+        return shadowed
+
+    def declare_lexical(self, scope, body, shadowed):
+        for statement in body:
+            if type(statement) is VarDecl and statement.kind in _LEXICAL:
+                self.declare(scope, statement.name, statement.kind, statement, shadowed)
+
+    def resolve(self, name):
+        symbol = self.bindings.get(name)
+        if symbol is None:
+            self.unresolved[name] += 1
+        return symbol
+
+    def run(self, program):
+        root = Scope('program', program, None)
+        shadowed = self.enter_function(root, (), program.body)
+        bindings = self.bindings
+        # Items are nodes to visit, a _Body, or a (Scope, shadowed bindings) pair marking the end of that scope
+        stack = [(root, shadowed)]
+        stack.extend(reversed(program.body))
+        scope = root
+        while stack:
+            node = stack.pop()
+            kind = type(node)
+            if kind is Identifier:
+                symbol = bindings.get(node.name)
+                if symbol is None:
+                    self.unresolved[node.name] += 1
+                else:
+                    symbol.reads += 1
+            elif kind is BinOp:
+                stack.append(node.right)
+                stack.append(node.left)
+            elif kind is Call:
+                symbol = self.resolve(node.callee)
+                if symbol is not None:
+                    symbol.reads += 1
+                stack.extend(reversed(node.args))
+            elif kind is ArrayLiteral:
+                stack.extend(reversed(node.elements))
+            elif kind is ObjectLiteral:
+                stack.extend(value for key, value in reversed(node.properties))
+            elif kind is VarDecl:
+                symbol = bindings[node.name]
+                if node.kind == 'var' and symbol.kind in _LEXICAL:
+                    # A var inside the block of a let or const of the same name
+                    self.errors.append(SemanticError(f"Identifier '{node.name}' has already been declared",
+                                                     node.name, node))
+                if node.init is not None:
+                    symbol.writes += 1
+                    stack.append(node.init)
+            elif kind is Assign:
+                symbol = self.resolve(node.name)
+                if symbol is not None:
+                    if symbol.kind == 'const':
+                        self.errors.append(SemanticError(f"Assignment to constant variable '{node.name}'",
+                                                         node.name, node))
+                    symbol.writes += 1
+                stack.append(node.value)
+            elif kind is ExprStatement:
+                stack.append(node.expr)
+            elif kind is Return:
+                stack.append(node.value)
+            elif kind is While:
+                stack.append(_Body(node))
+                stack.append(node.test)  # The test is outside the block, so it is resolved first
+            elif kind is _Body:
+                body = node.loop.body
+                if any(type(statement) is VarDecl and statement.kind in _LEXICAL for statement in body):
+                    scope = Scope('block', node.loop, scope)
+                    shadowed = []
+                    self.declare_lexical(scope, body, shadowed)
+                    stack.append((scope, shadowed))
+                stack.extend(reversed(body))
+            elif kind is FunctionDecl:
+                scope = Scope('function', node, scope)
+                stack.append((scope, self.enter_function(scope, node.params, node.body)))
+                stack.extend(reversed(node.body))
+            elif kind is tuple:
+                exited, shadowed = node
+                for name, symbol in reversed(shadowed):
+                    if symbol is None:
+                        del bindings[name]
+                    else:
+                        bindings[name] = symbol
+                scope = exited.parent
+        return Analysis(root, self.errors, dict(self.unresolved))
+
+
+def analyze(program):
+    """Build the scope tree of a Program and check its declarations; return an Analysis."""
+    # Collections triggered by allocating the symbols would rescan the whole tree each time
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _Analyzer().run(program)
+    finally:
+        if gc_enabled:
+            gc.enable()
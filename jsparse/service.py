@@ -0,0 +1,341 @@
+"""Long-lived parse service: an asyncio server in front of a warm worker pool.
+
+Clients connect over a Unix socket or localhost TCP and exchange
+newline-delimited JSON. A request looks like
+
+    {"id": 7, "op": "parse", "source": "var x = 1;", "mode": "program", "timeout": 2}
+
+op is "parse" or "validate"; mode is "program" (the ALL.py grammar, the
+default) or a jsparse.constructs mode; timeout (seconds) defaults to the
+server's. The response carries the request's id:
+
+    {"id": 7, "valid": true, "errors": [], "illegal": [], "tree": {...}}
+    {"id": 7, "failure": "timed out after 2 s"}
+
+errors holds syntax errors in the NDJSON error record format, illegal the
+[character, offset] pairs the lexer skipped, and tree is only sent for
+parse. A connection may have many requests in flight; responses come back
+in completion order.
+
+Worker processes import the grammars and load every parse table once when
+the pool starts, so a request never pays for start-up. Requests wait in a
+bounded queue. Whenever a worker slot frees up, the batcher sends it every
+queued small request (up to batch_size) as one task, so under load many
+small parses share one inter-process round trip; when the service is idle
+a request goes out alone, without waiting. A request over small_request
+bytes is always sent alone. Once the queue is full, connections stop being
+read until it drains, so fast clients are slowed by socket flow control
+instead of growing the server's memory. A request that has not been
+answered by its timeout gets a failure response; if it is still queued it
+is dropped, but a batch already running in a worker finishes in the
+background.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import importlib
+import itertools
+import json
+import os
+import signal
+import time
+
+from jsparse import constructs
+from jsparse.sinks import diagnostic_fields, to_json
+
+# Longest request line the server reads, in bytes
+MAX_REQUEST = 64 * 1024 * 1024
+
+_grammar = None
+
+
+def _init_worker(parser_module):
+    global _grammar
+    _grammar = importlib.import_module(parser_module)
+    for mode in constructs.MODES:
+        constructs.get_parser(mode)
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def _handle(op, mode, source):
+    """Parse one request in a worker and return the JSON text of its response, without the id."""
+    # Illegal characters are sent in the response rather than printed
+    if mode == 'program':
+        result = _grammar.parse_js_code(source, verbose=False, report=False)
+    else:
+        result = constructs.parse(mode, source, report=False)
+    body = (f'"valid": {"false" if result.errors or result.illegal else "true"}, '
+            f'"errors": {json.dumps([diagnostic_fields(error) for error in result.errors])}, '
+            f'"illegal": {json.dumps(result.illegal)}')
+    if op == 'parse':
+        body += f', "tree": {to_json(result.tree)}'
+    return body
+
+
+def _handle_batch(requests):
+    """Worker entry point: answer a list of (op, mode, source) requests."""
+    responses = []
+    for op, mode, source in requests:
+        try:
+            responses.append(_handle(op, mode, source))
+        except Exception as exc:
+            responses.append(f'"failure": {json.dumps(f"{type(exc).__name__}: {exc}")}')
+    return responses
+
+
+class _Job:
+    __slots__ = ('op', 'mode', 'source', 'future')
+
+    def __init__(self, op, mode, source, future):
+        self.op = op
+        self.mode = mode
+        self.source = source
+        self.future = future
+
+
+class ParseService:
+    def __init__(self, workers=None, parser_module='ALL', batch_size=64, small_request=4096, max_pending=1024,
+                 timeout=10.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.parser_module = parser_module
+        self.batch_size = batch_size
+        self.small_request = small_request
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.batches = 0
+        self.requests = 0
+        self._pool = None
+        self._server = None
+        self._queue = None
+        self._slots = None
+        self._batcher = None
+        self._held = None  # A large job taken off the queue while filling a batch, sent next
+        self._running = set()
+
+    async def start(self, path=None, host='127.0.0.1', port=0):
+        """Start the pool and listen on the Unix socket path, or on host:port when path is None."""
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.parser_module,))
+        loop = asyncio.get_running_loop()
+        # Start every worker now, so no request waits for a process to spawn and load tables
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)))
+        self._queue = asyncio.Queue(self.max_pending)
+        # Two batches per worker keep each one busy while the next is being pickled
+        self._slots = asyncio.Semaphore(2 * self.workers)
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve_connection, path, limit=MAX_REQUEST)
+        else:
+            self._server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_REQUEST)
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._batcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._batcher
+        self._pool.shutdown(cancel_futures=True)
+
+    # --- Connections ---
+
+    async def _serve_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        lock = asyncio.Lock()
+        responses = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Longer than MAX_REQUEST; the stream cannot be resynchronized
+                    await self._send(writer, lock, None, f'"failure": "request longer than {MAX_REQUEST} bytes"')
+                    break
+                if not line:
+                    break
+                # Reset per line, so a bad line is never answered with an earlier request's id
+                request = request_id = None
+                try:
+                    request = json.loads(line)
+                    request_id = request.get('id')
+                    op = request.get('op', 'parse')
+                    mode = request.get('mode', 'program')
+                    source = request['source']
+                    timeout = float(request.get('timeout', self.timeout))
+                    if op not in ('parse', 'validate') or (mode != 'program' and mode not in constructs.MODES):
+                        raise ValueError(f'unknown op {op!r} or mode {mode!r}')
+                    if not isinstance(source, str):
+                        raise ValueError('source must be a string')
+                except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                    request_id = request.get('id') if isinstance(request, dict) else None
+                    await self._send(writer, lock, request_id,
+                                     f'"failure": {json.dumps(f"bad request: {type(exc).__name__}: {exc}")}')
+                    continue
+                future = loop.create_future()
+                # Waits while the queue is full, which stops reading from this connection
+                await self._queue.put(_Job(op, mode, source, future))
+                task = asyncio.create_task(self._respond(writer, lock, request_id, future, timeout))
+                responses.add(task)
+                task.add_done_callback(responses.discard)
+            if responses:
+                await asyncio.gather(*responses)
+        except ConnectionError:
+            pass
+        finally:
+            for task in responses:
+                task.cancel()
+            writer.close()
+
+    async def _respond(self, writer, lock, request_id, future, timeout):
+        try:
+            # On timeout the future is cancelled, so the batcher skips the job if it is still queued
+            body = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            body = f'"failure": "timed out after {timeout:g} s"'
+        await self._send(writer, lock, request_id, body)
+
+    async def _send(self, writer, lock, request_id, body):
+        async with lock:
+            writer.write(f'{{"id": {json.dumps(request_id)}, {body}}}\n'.encode('utf-8'))
+            await writer.drain()
+
+    # --- Batching ---
+
+    async def _batch_loop(self):
+        while True:
+            job, self._held = self._held, None
+            if job is None:
+                job = await self._queue.get()
+            await self._slots.acquire()  # While every worker is busy, more requests queue up behind job
+            batch = [job]
+            if len(job.source) <= self.small_request:
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    queued = self._queue.get_nowait()
+                    if len(queued.source) > self.small_request:
+                        self._held = queued  # A large request goes out alone, next time round
+                        break
+                    batch.append(queued)
+            batch = [job for job in batch if not job.future.done()]
+            if not batch:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._run_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            self.batches += 1
+            self.requests += len(batch)
+            try:
+                bodies = await loop.run_in_executor(
+                    self._pool, _handle_batch, [(job.op, job.mode, job.source) for job in batch])
+            except Exception as exc:
+                bodies = [f'"failure": {json.dumps(f"worker failed: {type(exc).__name__}: {exc}")}'] * len(batch)
+            for job, body in zip(batch, bodies):
+                if not job.future.done():
+                    job.future.set_result(body)
+        finally:
+            self._slots.release()
+
+
+class Client:
+    """Send requests to a ParseService over one connection, with any number in flight."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._waiting = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, path=None, host='127.0.0.1', port=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_REQUEST)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_REQUEST)
+        return cls(reader, writer)
+
+    async def request(self, source, op='parse', mode='program', timeout=None):
+        """Send one request and return the decoded response."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        request = {'id': request_id, 'op': op, 'mode': mode, 'source': source}
+        if timeout is not None:
+            request['timeout'] = timeout
+        self._writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._waiting.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('service closed the connection'))
+
+    async def close(self):
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+        self._receiver.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._receiver
+
+
+async def _serve(args):
+    service = ParseService(workers=args.workers, batch_size=args.batch_size, small_request=args.small_request,
+                           max_pending=args.max_pending, timeout=args.timeout)
+    start = time.perf_counter()
+    address = await service.start(path=args.unix, host=args.host, port=args.port)
+    print(f'Listening on {address} with {service.workers} worker(s), ready in '
+          f'{time.perf_counter() - start:.2f} s', flush=True)
+    serving = asyncio.create_task(service.serve_forever())
+    # Stop on SIGTERM the way Ctrl-C does, so the worker processes are shut down too
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+    try:
+        await serving
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Serve parse and validate requests over a socket.')
+    arg_parser.add_argument('--unix', metavar='PATH', help='listen on this Unix socket instead of TCP')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8765)
+    arg_parser.add_argument('-j', '--workers', type=int, help='worker processes (default: CPU count)')
+    arg_parser.add_argument('--batch-size', type=int, default=64, help='most requests per worker task (default: 64)')
+    arg_parser.add_argument('--small-request', type=int, default=4096, metavar='BYTES',
+                            help='larger requests are never batched (default: 4096)')
+    arg_parser.add_argument('--max-pending', type=int, default=1024,
+                            help='queued requests before connections stop being read (default: 1024)')
+    arg_parser.add_argument('--timeout', type=float, default=10.0,
+                            help='seconds before a request without its own timeout fails (default: 10)')
+    args = arg_parser.parse_args(argv)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
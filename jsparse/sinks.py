@@ -0,0 +1,446 @@
+"""Output sinks for batch parse results.
+
+A sink receives one parallel.FileResult per parsed file through write()
+and is finished with close(). NullSink discards everything; NdjsonSink and
+BinarySink encode each file and hand the bytes to the underlying stream in
+batches of at least buffer_size bytes, so large runs do not pay for a
+write per file. Both formats are described in README.md; read_binary()
+decodes the binary one. CodeSink writes the programs back out as
+JavaScript with jsparse.codegen.
+"""
+import array
+import collections
+import gc
+import json
+import operator
+import struct
+import sys
+
+from jsparse.codegen import write_code
+from jsparse.diagnostics import Diagnostic
+from jsparse.lexer import Token
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    Node, Number, ObjectLiteral, Program, Return, String, VarDecl, While,
+)
+from jsparse.preparse import LazyBody
+from jsparse.tokenstream import token_positions
+
+# Node type codes of the binary format; new node classes must be appended
+NODE_TYPES = (Number, String, Identifier, BinOp, Call, ArrayLiteral, ObjectLiteral,
+              VarDecl, Assign, ExprStatement, Return, While, FunctionDecl, Program)
+_NODE_CODES = {node_type: code for code, node_type in enumerate(NODE_TYPES)}
+
+MAGIC = b'AFLP'
+VERSION = 1
+
+# Binary record kinds
+FILE, STRINGS, TOKENS, TREE, ERRORS, FAILURE, ILLEGAL = range(1, 8)
+
+# Binary value tags
+NULL, NUMBER, STRING, NODE, LIST = range(5)
+
+NO_STRING = 0xFFFFFFFF
+
+_RECORD = struct.Struct('<BI')
+_TOKEN = struct.Struct('<IIII')
+_ILLEGAL = struct.Struct('<IIII')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+_F64 = struct.Struct('<d')
+
+
+class NullSink:
+    """Discard every result."""
+
+    def write(self, result):
+        pass
+
+    def close(self):
+        pass
+
+
+class _BufferedSink:
+    def __init__(self, stream, buffer_size=1 << 20):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._chunks = []
+        self._pending = 0
+
+    def write(self, result):
+        # Encoding allocates many short-lived lists that never form reference cycles,
+        # so cyclic GC passes during it are pure overhead
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            data = self._encode(result)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self._emit(data)
+
+    def _emit(self, data):
+        self._chunks.append(data)
+        self._pending += len(data)
+        if self._pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            self.stream.write(b''.join(self._chunks))
+            self._chunks = []
+            self._pending = 0
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+def diagnostic_fields(error):
+    """Return the JSON fields of a Diagnostic, as NDJSON error records carry them."""
+    return {'line': error.lineno, 'pos': error.lexpos, 'found': error.found, 'value': error.value,
+            'expected': list(error.expected), 'column': error.column}
+
+
+def _json_value(value):
+    return value if isinstance(value, (Node, list, tuple, LazyBody)) else json.dumps(value)
+
+
+def _node_fields(node):
+    if type(node) is LazyBody:
+        return node.statements()
+    fields = {'node': type(node).__name__}
+    for name in type(node).__slots__:
+        fields[name] = getattr(node, name)
+    return fields
+
+
+_encode_json = json.JSONEncoder(default=_node_fields).encode
+
+
+def to_json(value):
+    """Return the JSON text of a node, list or scalar."""
+    try:
+        return _encode_json(value)
+    except RecursionError:
+        return _to_json_iterative(value)
+
+
+def _to_json_iterative(value):
+    # For trees too deep for the json module: strings on the stack are already-encoded JSON text
+    out = []
+    stack = [_json_value(value)]
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            out.append(item)
+            continue
+        if isinstance(item, Node):
+            parts = ['{"node": "' + type(item).__name__ + '"']
+            for name in type(item).__slots__:
+                parts.append(f', "{name}": ')
+                parts.append(_json_value(getattr(item, name)))
+            parts.append('}')
+        else:
+            parts = ['[']
+            for index, element in enumerate(item):
+                if index:
+                    parts.append(', ')
+                parts.append(_json_value(element))
+            parts.append(']')
+        stack.extend(reversed(parts))
+    return ''.join(out)
+
+
+class NdjsonSink(_BufferedSink):
+    """Write one JSON object per line: a file record, then its tokens, statements, errors and illegal characters."""
+
+    def __init__(self, stream, buffer_size=1 << 20, tokens=True):
+        super().__init__(stream, buffer_size)
+        self.tokens = tokens
+
+    def _encode(self, result):
+        lines = [json.dumps({'record': 'file', 'path': result.path, 'bytes': result.size,
+                             'failure': result.exception})]
+        if self.tokens and result.tokens is not None:
+            rows = [[tok.type, tok.value, line, tok.lexpos, column]
+                    for tok, (line, column) in zip(result.tokens, token_positions(result.tokens))]
+            lines.append('{"record": "tokens", "tokens": ' + _encode_json(rows) + '}')
+        if result.tree is not None:
+            for index, statement in enumerate(result.tree.body):
+                lines.append(f'{{"record": "statement", "index": {index}, "tree": {to_json(statement)}}}')
+        for error in result.errors:
+            lines.append(json.dumps(dict(record='error', **diagnostic_fields(error))))
+        for char, pos, line, column in result.illegal:
+            lines.append(json.dumps({'record': 'illegal', 'line': line, 'pos': pos, 'char': char, 'column': column}))
+        lines.append('')
+        return '\n'.join(lines).encode('utf-8')
+
+
+class CodeSink(_BufferedSink):
+    """Write the program of every file without errors or illegal characters as JavaScript, one after another."""
+
+    def __init__(self, stream, buffer_size=1 << 20, minify=False):
+        super().__init__(stream, buffer_size)
+        self.minify = minify
+
+    def write(self, result):
+        if result.tree is None or result.errors or result.illegal:
+            return
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            write_code(result.tree, self._emit_text, self.minify)
+            if self.minify:
+                self._emit(b'\n')
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _emit_text(self, text):
+        self._emit(text.encode('utf-8'))
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+
+    def __call__(self, text):
+        return self.index.setdefault(text, len(self.index))
+
+    def encode(self):
+        out = [_U32.pack(len(self.index))]
+        for text in self.index:
+            data = text.encode('utf-8')
+            out.append(_U32.pack(len(data)))
+            out.append(data)
+        return b''.join(out)
+
+
+def _inline_string(text):
+    data = text.encode('utf-8')
+    return _U32.pack(len(data)) + data
+
+
+def _token_value(value):
+    return value if type(value) is str else repr(value)
+
+
+def _reversed_fields(node_type):
+    names = node_type.__slots__[::-1]
+    if len(names) == 1:
+        name = names[0]
+        return lambda node: (getattr(node, name),)
+    return operator.attrgetter(*names)
+
+
+# Node type -> (tag bytes, function returning its fields last first)
+_NODE_ENCODING = {node_type: (bytes([NODE, code]), _reversed_fields(node_type))
+                  for node_type, code in _NODE_CODES.items()}
+
+
+def _encode_value(value, strings):
+    out = bytearray()
+    string_index = strings.index
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        encoding = _NODE_ENCODING.get(kind)
+        if encoding is not None:
+            out += encoding[0]
+            stack += encoding[1](item)
+        elif kind is str:
+            out.append(STRING)
+            out += _U32.pack(string_index.setdefault(item, len(string_index)))
+        elif kind is list or kind is tuple or kind is LazyBody:
+            out.append(LIST)
+            out += _U32.pack(len(item))
+            stack += item[::-1]
+        elif item is None:
+            out.append(NULL)
+        else:
+            out.append(NUMBER)
+            out += _F64.pack(item)
+    return bytes(out)
+
+
+def _u32_array(values):
+    """Return values packed as little-endian unsigned 32-bit integers."""
+    packed = array.array('I', values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _record(kind, payload):
+    return _RECORD.pack(kind, len(payload)) + payload
+
+
+class BinarySink(_BufferedSink):
+    """Write the compact binary dump described in README.md."""
+
+    def __init__(self, stream, buffer_size=1 << 20):
+        super().__init__(stream, buffer_size)
+        self._emit(MAGIC + bytes([VERSION]))
+
+    def _encode(self, result):
+        strings = _StringTable()
+        records = []
+        if result.tokens is not None:
+            index = strings.index
+            fields = []
+            for tok, (line, column) in zip(result.tokens, token_positions(result.tokens)):
+                value = tok.value
+                if type(value) is not str:
+                    value = repr(value)
+                fields += (index.setdefault(tok.type, len(index)), index.setdefault(value, len(index)),
+                           line, tok.lexpos)
+            records.append(_record(TOKENS, _U32.pack(len(result.tokens)) + _u32_array(fields)))
+        if result.tree is not None:
+            records.append(_record(TREE, _encode_value(result.tree, strings)))
+        if result.errors:
+            errors = [_U32.pack(len(result.errors))]
+            for error in result.errors:
+                errors.append(struct.pack('<IIIII', error.lineno or 0, error.lexpos or 0, strings(error.found),
+                                          NO_STRING if error.value is None else strings(_token_value(error.value)),
+                                          len(error.expected)))
+                errors.extend(_U32.pack(strings(name)) for name in error.expected)
+            records.append(_record(ERRORS, b''.join(errors)))
+        if result.illegal:
+            illegal = [_U32.pack(len(result.illegal))]
+            illegal.extend(_ILLEGAL.pack(strings(char), line, pos, column)
+                           for char, pos, line, column in result.illegal)
+            records.append(_record(ILLEGAL, b''.join(illegal)))
+        if result.exception:
+            records.append(_record(FAILURE, _inline_string(result.exception)))
+        return (_record(FILE, _inline_string(result.path) + _U64.pack(result.size))
+                + _record(STRINGS, strings.encode()) + b''.join(records))
+
+
+# A file decoded by read_binary(); fields missing from the dump are None.
+# illegal holds (character, offset, line, column) like FileResult.illegal.
+DumpedFile = collections.namedtuple('DumpedFile', 'path size tokens tree errors failure illegal')
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError('truncated binary dump')
+    return data
+
+
+def _decode_value(data, strings):
+    pos = 0
+    # Each open node or list waits on the stack for its remaining child count
+    root = []
+    stack = [(root, 1, None)]
+    while stack:
+        items, wanted, node_type = stack[-1]
+        if len(items) == wanted:
+            stack.pop()
+            value = node_type(*items) if node_type else items
+            if stack:
+                stack[-1][0].append(value)
+            continue
+        tag = data[pos]
+        pos += 1
+        if tag == NULL:
+            items.append(None)
+        elif tag == NUMBER:
+            items.append(_F64.unpack_from(data, pos)[0])
+            pos += 8
+        elif tag == STRING:
+            items.append(strings[_U32.unpack_from(data, pos)[0]])
+            pos += 4
+        elif tag == LIST:
+            count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            stack.append(([], count, None))
+        elif tag == NODE:
+            node_type = NODE_TYPES[data[pos]]
+            pos += 1
+            stack.append(([], len(node_type.__slots__), node_type))
+        else:
+            raise ValueError(f'bad value tag {tag}')
+    return root[0]
+
+
+def _object_properties(tree):
+    # Lists decode as lists, but ObjectLiteral keeps its (key, value) pairs as tuples
+    stack = [tree]
+    while stack:
+        item = stack.pop()
+        if type(item) is list:
+            stack.extend(item)
+        elif isinstance(item, Node):
+            if type(item) is ObjectLiteral:
+                item.properties = [tuple(pair) for pair in item.properties]
+            stack.extend(getattr(item, name) for name in type(item).__slots__)
+
+
+def read_binary(stream):
+    """Yield a DumpedFile for each file in a binary dump read from a binary stream."""
+    if _read_exact(stream, len(MAGIC) + 1) != MAGIC + bytes([VERSION]):
+        raise ValueError('not a version 1 AFLP dump')
+    current = None
+    strings = []
+    while True:
+        header = stream.read(_RECORD.size)
+        if not header:
+            break
+        if len(header) != _RECORD.size:
+            raise ValueError('truncated binary dump')
+        kind, length = _RECORD.unpack(header)
+        payload = _read_exact(stream, length)
+        if kind == FILE:
+            if current is not None:
+                yield DumpedFile(**current)
+            size = _U32.unpack_from(payload)[0]
+            current = dict(path=payload[4:4 + size].decode('utf-8'), size=_U64.unpack_from(payload, 4 + size)[0],
+                           tokens=None, tree=None, errors=[], failure=None, illegal=[])
+        elif kind == STRINGS:
+            strings = []
+            pos = 4
+            for _ in range(_U32.unpack_from(payload)[0]):
+                size = _U32.unpack_from(payload, pos)[0]
+                strings.append(payload[pos + 4:pos + 4 + size].decode('utf-8'))
+                pos += 4 + size
+        elif kind == TOKENS:
+            current['tokens'] = [Token(strings[kind_index], strings[value_index], lineno, lexpos)
+                                 for kind_index, value_index, lineno, lexpos in _TOKEN.iter_unpack(payload[4:])]
+        elif kind == TREE:
+            tree = _decode_value(payload, strings)
+            _object_properties(tree)
+            current['tree'] = tree
+        elif kind == ERRORS:
+            pos = 4
+            for _ in range(_U32.unpack_from(payload)[0]):
+                lineno, lexpos, found, value, count = struct.unpack_from('<IIIII', payload, pos)
+                pos += 20
+                expected = tuple(strings[index] for index in struct.unpack_from(f'<{count}I', payload, pos))
+                pos += 4 * count
+                current['errors'].append(Diagnostic(lineno, lexpos, strings[found],
+                                                    None if value == NO_STRING else strings[value], expected))
+        elif kind == FAILURE:
+            size = _U32.unpack_from(payload)[0]
+            current['failure'] = payload[4:4 + size].decode('utf-8')
+        elif kind == ILLEGAL:
+            current['illegal'] = [(strings[char], pos, line, column)
+                                  for char, line, pos, column in _ILLEGAL.iter_unpack(payload[4:])]
+        # Unknown record kinds are skipped, so later versions can add records
+    if current is not None:
+        yield DumpedFile(**current)
+
+
+def open_sink(output_format, stream):
+    """Return the sink for 'none', 'ndjson', 'binary', 'js' or 'minjs' output on a binary stream."""
+    if output_format == 'none':
+        return NullSink()
+    if output_format == 'ndjson':
+        return NdjsonSink(stream)
+    if output_format == 'binary':
+        return BinarySink(stream)
+    if output_format in ('js', 'minjs'):
+        return CodeSink(stream, minify=output_format == 'minjs')
+    raise ValueError(f'unknown output format {output_format!r}')
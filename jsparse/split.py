@@ -0,0 +1,45 @@
+"""Find top-level statement boundaries in a token list.
+
+The grammars parse one statement at a time, so whole programs are handled
+by cutting the token stream into statements first. A statement ends at a
+SEMICOLON outside any braces, or, for ``while`` and ``function``
+statements, at the RBRACE that closes their body. Parentheses and brackets
+are not tracked: the grammar never allows a ``;`` inside them, so an
+unclosed ``(`` costs one statement rather than the rest of the file.
+"""
+
+import itertools
+
+from jsparse.tokenstream import token_types
+
+_BLOCK_STATEMENTS = {'WHILE', 'FUNCTION'}
+
+
+def split_statements(tokens, start=0):
+    """Return (spans, tail) for tokens[start:].
+
+    tokens is a token list or a TokenStream. spans is a list of (first, end)
+    index pairs, one per complete statement; tokens[tail:] is an unfinished
+    statement at the end of the input (empty if the last statement was complete).
+    """
+    spans = []
+    depth = 0
+    first = start
+    block = False  # Whether the current statement is a while or function
+    kinds = itertools.islice(token_types(tokens), start, None)
+    for index, kind in enumerate(kinds, start):
+        if index == first:
+            block = kind in _BLOCK_STATEMENTS
+        if kind == 'LBRACE':
+            depth += 1
+        elif kind == 'RBRACE':
+            depth -= 1
+            if depth <= 0 and block:
+                depth = 0
+                spans.append((first, index + 1))
+                first = index + 1
+        elif kind == 'SEMICOLON' and depth <= 0:
+            depth = 0
+            spans.append((first, index + 1))
+            first = index + 1
+    return spans, first
@@ -0,0 +1,140 @@
+"""Profiling counters for parse runs.
+
+A Stats object collects wall time per phase, token counts by type,
+reduction counts and cumulative time per grammar rule (the p_* function
+that handles it) and peak memory. Parsing code records into one when it is
+given, and does nothing extra when it is None, so disabled profiling costs
+a few `is None` checks per file.
+"""
+import collections
+import contextlib
+import sys
+import time
+
+from jsparse.tokenstream import token_types
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+_DISABLED = contextlib.nullcontext()
+
+
+def peak_rss():
+    """Return this process's peak resident set size in bytes, or 0 where unknown."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other systems kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Stats:
+    def __init__(self):
+        self.phases = collections.Counter()  # Phase name -> seconds
+        self.tokens = collections.Counter()  # Token type -> count
+        self.reductions = collections.Counter()  # p_* function name -> reductions
+        self.rule_seconds = collections.Counter()  # p_* function name -> seconds spent in the action
+        self.files = 0
+        self.peak_memory = 0
+        self._wrappers = {}  # id(parser) -> timed actions, one per production
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def count_tokens(self, tokens):
+        self.tokens.update(token_types(tokens))
+
+    @contextlib.contextmanager
+    def instrument(self, parser):
+        """Count and time every grammar action of a PLY parser while the block runs."""
+        originals = [production.callable for production in parser.productions]
+        # Wrappers are built once per parser, since small inputs are instrumented many times
+        timed = self._wrappers.get(id(parser))
+        if timed is None:
+            timed = [None if action is None else self._timed(production.func, action)
+                     for production, action in zip(parser.productions, originals)]
+            self._wrappers[id(parser)] = timed
+        for production, action in zip(parser.productions, timed):
+            production.callable = action
+        try:
+            yield
+        finally:
+            for production, original in zip(parser.productions, originals):
+                production.callable = original
+
+    def _timed(self, name, action):
+        reductions = self.reductions
+        rule_seconds = self.rule_seconds
+        clock = time.perf_counter
+
+        def timed_action(p):
+            start = clock()
+            action(p)
+            rule_seconds[name] += clock() - start
+            reductions[name] += 1
+        return timed_action
+
+    def sample_memory(self):
+        self.peak_memory = max(self.peak_memory, peak_rss())
+
+    def __getstate__(self):
+        # The timed actions are closures, and only meaningful in the process that built them
+        state = dict(self.__dict__)
+        state['_wrappers'] = {}
+        return state
+
+    def merge(self, other):
+        """Add the counters of another Stats, such as one filled in a worker process."""
+        self.phases.update(other.phases)
+        self.tokens.update(other.tokens)
+        self.reductions.update(other.reductions)
+        self.rule_seconds.update(other.rule_seconds)
+        self.files += other.files
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+
+    def as_dict(self):
+        self.sample_memory()
+        return {
+            'files': self.files,
+            'phases': dict(self.phases),
+            'tokens': dict(self.tokens),
+            'rules': {name: {'reductions': self.reductions[name], 'seconds': self.rule_seconds[name]}
+                      for name in self.reductions},
+            'peak_memory': self.peak_memory,
+        }
+
+    def report(self):
+        """Return a human-readable summary."""
+        self.sample_memory()
+        lines = [f'Stats for {self.files} file(s)', f'{"Phase":30} {"seconds":>9}']
+        for name, seconds in self.phases.most_common():
+            lines.append(f'  {name:28} {seconds:9.4f}')
+        if 'parse' in self.phases and self.rule_seconds:
+            actions = sum(self.rule_seconds.values())
+            lines.append(f'  {"  rule actions":28} {actions:9.4f}')
+            lines.append(f'  {"  LR table dispatch":28} {self.phases["parse"] - actions:9.4f}')
+        lines.append(f'Tokens: {sum(self.tokens.values())}')
+        for name, count in self.tokens.most_common():
+            lines.append(f'  {name:28} {count:9}')
+        lines.append(f'{"Rule":30} {"reductions":>10} {"seconds":>9}')
+        for name, count in self.reductions.most_common():
+            lines.append(f'  {name:28} {count:10} {self.rule_seconds[name]:9.4f}')
+        lines.append(f'Peak memory: {self.peak_memory / 2**20:.1f} MiB (largest process)')
+        return '\n'.join(lines)
+
+
+def phase(stats, name):
+    """Return stats.phase(name), or a no-op context manager when stats is None."""
+    return _DISABLED if stats is None else stats.phase(name)
+
+
+def instrument(stats, parser):
+    """Return stats.instrument(parser), or a no-op context manager when stats is None."""
+    return _DISABLED if stats is None else stats.instrument(parser)
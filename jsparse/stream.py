@@ -0,0 +1,74 @@
+"""Statement-at-a-time parsing of programs read from a file-like object.
+
+parse_stream() reads the input in chunks and yields each top-level
+statement as soon as its terminating ``;`` or closing ``}`` has been read.
+Only the unfinished tail of the input is kept between chunks, so memory
+stays proportional to the largest statement rather than the whole file.
+"""
+import collections
+import importlib
+
+from jsparse.positions import LineIndex
+from jsparse.split import split_statements
+
+# offset and line locate the statement's first token in the whole input
+StreamedStatement = collections.namedtuple('StreamedStatement', 'tree errors offset line')
+
+
+def parse_stream(stream, grammar=None, chunk_size=1 << 16):
+    """Yield a StreamedStatement for every top-level statement read from stream."""
+    grammar = grammar or importlib.import_module('ALL')
+    lexer = grammar.fast_lexer
+    pending = ''
+    offset = 0  # Position of pending[0] in the whole input
+    line = 1  # Line of pending[0]
+    column = 1  # Column of pending[0]
+    next_attempt = 0
+    at_eof = False
+    while not at_eof:
+        chunk = stream.read(chunk_size)
+        at_eof = not chunk
+        pending += chunk
+        # Retry an unfinished statement only once the buffer has doubled, so a statement
+        # spanning many chunks is re-lexed a logarithmic number of times
+        if not at_eof and len(pending) < next_attempt:
+            continue
+
+        # The buffer may end inside a string literal, so its quote is not reported as illegal
+        tokens = lexer.tokenize(pending, report=False)
+        spans, tail = split_statements(tokens)
+        if at_eof:
+            if tail < len(tokens):
+                spans.append((tail, len(tokens)))
+            consumed = len(pending)
+        else:
+            # A quote the lexer could not match may open a string that ends in a later chunk
+            quotes = [pos for char, pos in lexer.errors if char == '"']
+            if quotes:
+                spans = [span for span in spans if tokens[span[1] - 1].lexpos < quotes[0]]
+            if not spans:
+                next_attempt = 2 * len(pending)
+                continue
+            # Statements end with a one-character SEMICOLON or RBRACE token
+            consumed = tokens[spans[-1][1] - 1].lexpos + 1
+
+        positions = LineIndex(pending, line, column)
+        lines_before = 0
+        previous = 0
+        for first, end in spans:
+            start = tokens[first].lexpos
+            lines_before += pending.count('\n', previous, start)
+            previous = start
+            tree, errors = grammar.parse_tokens(tokens[first:end])
+            located = []
+            for error in errors:
+                error_line, error_column = positions.position(error.lexpos)
+                located.append(error._replace(lineno=error_line, lexpos=offset + error.lexpos, column=error_column))
+            yield StreamedStatement(tree, located, offset + start, line + lines_before)
+
+        newline = pending.rfind('\n', 0, consumed)
+        column = consumed - newline if newline >= 0 else column + consumed
+        line += pending.count('\n', 0, consumed)
+        offset += consumed
+        pending = pending[consumed:]
+        next_attempt = 0
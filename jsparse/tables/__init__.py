@@ -0,0 +1,7 @@
+"""Precomputed LALR tables, one module per grammar.
+
+Each script loads its own ``parsetab_<grammar>`` module, so running one
+grammar never invalidates the tables of another. PLY stores the grammar
+signature in the module and rebuilds it only when the rules change; after
+editing a grammar, run its script once and commit the regenerated module.
+"""
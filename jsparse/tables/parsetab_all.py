@@ -0,0 +1,68 @@
+
+# parsetab_all.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'statementleftORleftANDleftCOMPARISONleftPLUSMINUSleftTIMESDIVIDEAND ASSIGN COLON COMMA COMPARISON CONST DIVIDE ELSE FUNCTION ID IF LBRACE LBRACKET LET LPAREN MINUS NUMBER OR PLUS RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING TIMES VAR WHILEexpr : expr OR expr\n            | expr AND expr\n            | expr COMPARISON expr\n            | expr PLUS expr\n            | expr MINUS expr\n            | expr TIMES expr\n            | expr DIVIDE exprexpr : NUMBERexpr : IDexpr : LPAREN expr RPARENstatement : RETURN expr SEMICOLONstatement : VAR ID ASSIGN expr SEMICOLONstatement : VAR ID SEMICOLONstatement : LET ID ASSIGN expr SEMICOLONstatement : CONST ID ASSIGN expr SEMICOLONstatement : ID ASSIGN expr SEMICOLONstatement : expr SEMICOLONexpr : STRINGexpr : ID LPAREN arguments RPARENarguments : arguments : elementsexpr : LBRACKET elements RBRACKETelements : exprelements : elements COMMA exprexpr : LBRACE object_members RBRACEobject_members : ID COLON exprobject_members : object_members COMMA ID COLON exprstatement : WHILE LPAREN expr RPAREN LBRACE statements RBRACEstatement : FUNCTION ID LPAREN params RPAREN LBRACE statements RBRACEparams : params : param_listparam_list : IDparam_list : param_list COMMA IDstatements : statements statementstatements : statement : error SEMICOLONstatement : WHILE LPAREN expr RPAREN LBRACE statements error RBRACEstatement : FUNCTION ID LPAREN params RPAREN LBRACE statements error RBRACE'
+    
+_lr_action_items = {'RETURN':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[2,-17,-36,-11,-13,-16,-12,-14,-15,-35,2,-35,-28,-34,2,-37,-29,-38,]),'VAR':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[4,-17,-36,-11,-13,-16,-12,-14,-15,-35,4,-35,-28,-34,4,-37,-29,-38,]),'LET':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[6,-17,-36,-11,-13,-16,-12,-14,-15,-35,6,-35,-28,-34,6,-37,-29,-38,]),'CONST':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[7,-17,-36,-11,-13,-16,-12,-14,-15,-35,7,-35,-28,-34,7,-37,-29,-38,]),'ID':([0,2,4,6,7,9,10,11,15,18,19,20,21,22,23,24,25,27,28,31,36,39,47,48,52,53,57,58,59,61,63,74,75,76,77,78,80,81,83,85,87,88,89,90,92,],[5,17,26,29,30,17,34,35,17,-17,17,17,17,17,17,17,17,17,17,17,-36,-11,17,-13,17,17,68,17,70,17,-16,-12,-14,-15,-35,17,84,5,-35,-28,-34,5,-37,-29,-38,]),'WHILE':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[8,-17,-36,-11,-13,-16,-12,-14,-15,-35,8,-35,-28,-34,8,-37,-29,-38,]),'FUNCTION':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[11,-17,-36,-11,-13,-16,-12,-14,-15,-35,11,-35,-28,-34,11,-37,-29,-38,]),'error':([0,18,36,39,48,63,74,75,76,77,81,83,85,87,88,89,90,92,],[12,-17,-36,-11,-13,-16,-12,-14,-15,-35,86,-35,-28,-34,91,-37,-29,-38,]),'NUMBER':([0,2,9,15,18,19,20,21,22,23,24,25,27,28,31,36,39,47,48,52,53,58,61,63,74,75,76,77,78,81,83,85,87,88,89,90,92,],[13,13,13,13,-17,13,13,13,13,13,13,13,13,13,13,-36,-11,13,-13,13,13,13,13,-16,-12,-14,-15,-35,13,13,-35,-28,-34,13,-37,-29,-38,]),'LPAREN':([0,2,5,8,9,15,17,18,19,20,21,22,23,24,25,27,28,31,35,36,39,47,48,52,53,58,61,63,74,75,76,77,78,81,83,85,87,88,89,90,92,],[9,9,28,31,9,9,28,-17,9,9,9,9,9,9,9,9,9,9,59,-36,-11,9,-13,9,9,9,9,-16,-12,-14,-15,-35,9,9,-35,-28,-34,9,-37,-29,-38,]),'STRING':([0,2,9,15,18,19,20,21,22,23,24,25,27,28,31,36,39,47,48,52,53,58,61,63,74,75,76,77,78,81,83,85,87,88,89,90,92,],[14,14,14,14,-17,14,14,14,14,14,14,14,14,14,14,-36,-11,14,-13,14,14,14,14,-16,-12,-14,-15,-35,14,14,-35,-28,-34,14,-37,-29,-38,]),'LBRACKET':([0,2,9,15,18,19,20,21,22,23,24,25,27,28,31,36,39,47,48,52,53,58,61,63,74,75,76,77,78,81,83,85,87,88,89,90,92,],[15,15,15,15,-17,15,15,15,15,15,15,15,15,15,15,-36,-11,15,-13,15,15,15,15,-16,-12,-14,-15,-35,15,15,-35,-28,-34,15,-37,-29,-38,]),'LBRACE':([0,2,9,15,18,19,20,21,22,23,24,25,27,28,31,36,39,47,48,52,53,58,61,63,67,74,75,76,77,78,79,81,83,85,87,88,89,90,92,],[10,10,10,10,-17,10,10,10,10,10,10,10,10,10,10,-36,-11,10,-13,10,10,10,10,-16,77,-12,-14,-15,-35,10,83,10,-35,-28,-34,10,-37,-29,-38,]),'$end':([1,18,36,39,48,63,74,75,76,85,89,90,92,],[0,-17,-36,-11,-13,-16,-12,-14,-15,-28,-37,-29,-38,]),'SEMICOLON':([3,5,12,13,14,16,17,26,40,41,42,43,44,45,46,49,55,56,60,62,64,65,66,86,91,],[18,-9,36,-8,-18,39,-9,48,-1,-2,-3,-4,-5,-6,-7,63,-10,-25,-22,74,-19,75,76,36,36,]),'OR':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[19,-9,-8,-18,19,-9,19,19,-1,-2,-3,-4,-5,-6,-7,19,19,-10,-25,-22,19,-19,19,19,19,19,19,]),'AND':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[20,-9,-8,-18,20,-9,20,20,20,-2,-3,-4,-5,-6,-7,20,20,-10,-25,-22,20,-19,20,20,20,20,20,]),'COMPARISON':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[21,-9,-8,-18,21,-9,21,21,21,21,-3,-4,-5,-6,-7,21,21,-10,-25,-22,21,-19,21,21,21,21,21,]),'PLUS':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[22,-9,-8,-18,22,-9,22,22,22,22,22,-4,-5,-6,-7,22,22,-10,-25,-22,22,-19,22,22,22,22,22,]),'MINUS':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[23,-9,-8,-18,23,-9,23,23,23,23,23,-4,-5,-6,-7,23,23,-10,-25,-22,23,-19,23,23,23,23,23,]),'TIMES':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[24,-9,-8,-18,24,-9,24,24,24,24,24,24,24,-6,-7,24,24,-10,-25,-22,24,-19,24,24,24,24,24,]),'DIVIDE':([3,5,13,14,16,17,32,38,40,41,42,43,44,45,46,49,54,55,56,60,62,64,65,66,69,73,82,],[25,-9,-8,-18,25,-9,25,25,25,25,25,25,25,-6,-7,25,25,-10,-25,-22,25,-19,25,25,25,25,25,]),'ASSIGN':([5,26,29,30,],[27,47,52,53,]),'RPAREN':([13,14,17,28,32,38,40,41,42,43,44,45,46,50,51,54,55,56,59,60,64,70,71,72,73,84,],[-8,-18,-9,-20,55,-23,-1,-2,-3,-4,-5,-6,-7,64,-21,67,-10,-25,-30,-22,-19,-32,79,-31,-24,-33,]),'RBRACKET':([13,14,17,37,38,40,41,42,43,44,45,46,55,56,60,64,73,],[-8,-18,-9,60,-23,-1,-2,-3,-4,-5,-6,-7,-10,-25,-22,-19,-24,]),'COMMA':([13,14,17,33,37,38,40,41,42,43,44,45,46,51,55,56,60,64,69,70,72,73,82,84,],[-8,-18,-9,57,61,-23,-1,-2,-3,-4,-5,-6,-7,61,-10,-25,-22,-19,-26,-32,80,-24,-27,-33,]),'RBRACE':([13,14,17,18,33,36,39,40,41,42,43,44,45,46,48,55,56,60,63,64,69,74,75,76,77,81,82,83,85,86,87,88,89,90,91,92,],[-8,-18,-9,-17,56,-36,-11,-1,-2,-3,-4,-5,-6,-7,-13,-10,-25,-22,-16,-19,-26,-12,-14,-15,-35,85,-27,-35,-28,89,-34,90,-37,-29,92,-38,]),'COLON':([34,68,],[58,78,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'statement':([0,81,88,],[1,87,87,]),'expr':([0,2,9,15,19,20,21,22,23,24,25,27,28,31,47,52,53,58,61,78,81,88,],[3,16,32,38,40,41,42,43,44,45,46,49,38,54,62,65,66,69,73,82,3,3,]),'object_members':([10,],[33,]),'elements':([15,28,],[37,51,]),'arguments':([28,],[50,]),'params':([59,],[71,]),'param_list':([59,],[72,]),'statements':([77,83,],[81,88,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> statement","S'",1,None,None,None),
+  ('expr -> expr OR expr','expr',3,'p_expr_binop','expressions.py',37),
+  ('expr -> expr AND expr','expr',3,'p_expr_binop','expressions.py',38),
+  ('expr -> expr COMPARISON expr','expr',3,'p_expr_binop','expressions.py',39),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','expressions.py',40),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','expressions.py',41),
+  ('expr -> expr TIMES expr','expr',3,'p_expr_binop','expressions.py',42),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binop','expressions.py',43),
+  ('expr -> NUMBER','expr',1,'p_expr_number','expressions.py',48),
+  ('expr -> ID','expr',1,'p_expr_id','expressions.py',53),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_parens','expressions.py',58),
+  ('statement -> RETURN expr SEMICOLON','statement',3,'p_statement_return','ALL.py',94),
+  ('statement -> VAR ID ASSIGN expr SEMICOLON','statement',5,'p_statement_var','ALL.py',98),
+  ('statement -> VAR ID SEMICOLON','statement',3,'p_statement_var_decl','ALL.py',102),
+  ('statement -> LET ID ASSIGN expr SEMICOLON','statement',5,'p_statement_let','ALL.py',106),
+  ('statement -> CONST ID ASSIGN expr SEMICOLON','statement',5,'p_statement_const','ALL.py',110),
+  ('statement -> ID ASSIGN expr SEMICOLON','statement',4,'p_statement_assign','ALL.py',114),
+  ('statement -> expr SEMICOLON','statement',2,'p_statement_expr','ALL.py',118),
+  ('expr -> STRING','expr',1,'p_expr_string','ALL.py',122),
+  ('expr -> ID LPAREN arguments RPAREN','expr',4,'p_expr_call','ALL.py',126),
+  ('arguments -> <empty>','arguments',0,'p_arguments_empty','ALL.py',130),
+  ('arguments -> elements','arguments',1,'p_arguments_list','ALL.py',134),
+  ('expr -> LBRACKET elements RBRACKET','expr',3,'p_expr_array','ALL.py',138),
+  ('elements -> expr','elements',1,'p_elements_single','ALL.py',144),
+  ('elements -> elements COMMA expr','elements',3,'p_elements_multiple','ALL.py',148),
+  ('expr -> LBRACE object_members RBRACE','expr',3,'p_expr_object','ALL.py',153),
+  ('object_members -> ID COLON expr','object_members',3,'p_object_members','ALL.py',157),
+  ('object_members -> object_members COMMA ID COLON expr','object_members',5,'p_object_members_multiple','ALL.py',161),
+  ('statement -> WHILE LPAREN expr RPAREN LBRACE statements RBRACE','statement',7,'p_statement_while','ALL.py',166),
+  ('statement -> FUNCTION ID LPAREN params RPAREN LBRACE statements RBRACE','statement',8,'p_statement_function','ALL.py',171),
+  ('params -> <empty>','params',0,'p_params_empty','ALL.py',176),
+  ('params -> param_list','params',1,'p_params_list','ALL.py',180),
+  ('param_list -> ID','param_list',1,'p_param_list_single','ALL.py',184),
+  ('param_list -> param_list COMMA ID','param_list',3,'p_param_list_multiple','ALL.py',188),
+  ('statements -> statements statement','statements',2,'p_statements_multiple','ALL.py',194),
+  ('statements -> <empty>','statements',0,'p_statements_empty','ALL.py',200),
+  ('statement -> error SEMICOLON','statement',2,'p_statement_error','ALL.py',206),
+  ('statement -> WHILE LPAREN expr RPAREN LBRACE statements error RBRACE','statement',8,'p_statement_while_error','ALL.py',210),
+  ('statement -> FUNCTION ID LPAREN params RPAREN LBRACE statements error RBRACE','statement',9,'p_statement_function_error','ALL.py',214),
+]
@@ -0,0 +1,46 @@
+
+# parsetab_array.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'array_declarationASSIGN COMMA CONST FALSE ID LBRACKET LET NULL NUMBER RBRACKET SEMICOLON STRING TRUE VARkind : VAR\n            | LET\n            | CONSTscalar : NUMBER\n              | STRINGscalar : TRUE\n              | FALSEliteral : scalarliteral : NULLarray_declaration : kind ID ASSIGN array SEMICOLONarray : LBRACKET array_elements RBRACKET\n             | LBRACKET RBRACKETarray_elements : array_elements COMMA array_element\n                      | array_elementarray_element : literal\n                     | array'
+    
+_lr_action_items = {'VAR':([0,],[3,]),'LET':([0,],[4,]),'CONST':([0,],[5,]),'$end':([1,10,],[0,-10,]),'ID':([2,3,4,5,],[6,-1,-2,-3,]),'ASSIGN':([6,],[7,]),'LBRACKET':([7,9,23,],[9,9,9,]),'SEMICOLON':([8,12,22,],[10,-12,-11,]),'RBRACKET':([9,11,12,13,14,15,16,17,18,19,20,21,22,24,],[12,22,-12,-14,-15,-16,-8,-9,-4,-5,-6,-7,-11,-13,]),'NULL':([9,23,],[17,17,]),'NUMBER':([9,23,],[18,18,]),'STRING':([9,23,],[19,19,]),'TRUE':([9,23,],[20,20,]),'FALSE':([9,23,],[21,21,]),'COMMA':([11,12,13,14,15,16,17,18,19,20,21,22,24,],[23,-12,-14,-15,-16,-8,-9,-4,-5,-6,-7,-11,-13,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'array_declaration':([0,],[1,]),'kind':([0,],[2,]),'array':([7,9,23,],[8,15,15,]),'array_elements':([9,],[11,]),'array_element':([9,23,],[13,24,]),'literal':([9,23,],[14,14,]),'scalar':([9,23,],[16,16,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> array_declaration","S'",1,None,None,None),
+  ('kind -> VAR','kind',1,'p_kind','constructs.py',93),
+  ('kind -> LET','kind',1,'p_kind','constructs.py',94),
+  ('kind -> CONST','kind',1,'p_kind','constructs.py',95),
+  ('scalar -> NUMBER','scalar',1,'p_scalar','constructs.py',99),
+  ('scalar -> STRING','scalar',1,'p_scalar','constructs.py',100),
+  ('scalar -> TRUE','scalar',1,'p_scalar_boolean','constructs.py',104),
+  ('scalar -> FALSE','scalar',1,'p_scalar_boolean','constructs.py',105),
+  ('literal -> scalar','literal',1,'p_literal','constructs.py',109),
+  ('literal -> NULL','literal',1,'p_literal_null','constructs.py',113),
+  ('array_declaration -> kind ID ASSIGN array SEMICOLON','array_declaration',5,'p_array_declaration','constructs.py',124),
+  ('array -> LBRACKET array_elements RBRACKET','array',3,'p_array','constructs.py',128),
+  ('array -> LBRACKET RBRACKET','array',2,'p_array','constructs.py',129),
+  ('array_elements -> array_elements COMMA array_element','array_elements',3,'p_array_elements','constructs.py',134),
+  ('array_elements -> array_element','array_elements',1,'p_array_elements','constructs.py',135),
+  ('array_element -> literal','array_element',1,'p_array_element','constructs.py',143),
+  ('array_element -> array','array_element',1,'p_array_element','constructs.py',144),
+]
@@ -0,0 +1,36 @@
+
+# parsetab_function.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'function_declarationCOMMA FUNCTION ID LBRACE LPAREN RBRACE RPARENfunction_declaration : FUNCTION ID LPAREN params RPAREN LBRACE RBRACEparams : param_list\n              | emptyparam_list : param_list COMMA ID\n                  | IDempty :'
+    
+_lr_action_items = {'FUNCTION':([0,],[2,]),'$end':([1,13,],[0,-1,]),'ID':([2,4,10,],[3,5,12,]),'LPAREN':([3,],[4,]),'RPAREN':([4,5,6,7,8,12,],[-6,-5,9,-2,-3,-4,]),'COMMA':([5,7,12,],[-5,10,-4,]),'LBRACE':([9,],[11,]),'RBRACE':([11,],[13,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'function_declaration':([0,],[1,]),'params':([4,],[6,]),'param_list':([4,],[7,]),'empty':([4,],[8,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> function_declaration","S'",1,None,None,None),
+  ('function_declaration -> FUNCTION ID LPAREN params RPAREN LBRACE RBRACE','function_declaration',7,'p_function_declaration','constructs.py',194),
+  ('params -> param_list','params',1,'p_params','constructs.py',198),
+  ('params -> empty','params',1,'p_params','constructs.py',199),
+  ('param_list -> param_list COMMA ID','param_list',3,'p_param_list','constructs.py',203),
+  ('param_list -> ID','param_list',1,'p_param_list','constructs.py',204),
+  ('empty -> <empty>','empty',0,'p_empty','constructs.py',234),
+]
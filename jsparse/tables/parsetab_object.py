@@ -0,0 +1,53 @@
+
+# parsetab_object.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'object_declarationASSIGN COLON COMMA CONST FALSE ID LBRACE LBRACKET LET NULL NUMBER RBRACE RBRACKET SEMICOLON STRING TRUE VARkind : VAR\n            | LET\n            | CONSTscalar : NUMBER\n              | STRINGscalar : TRUE\n              | FALSEliteral : scalarliteral : NULLobject_declaration : kind ID ASSIGN object SEMICOLONobject : LBRACE object_properties RBRACE\n              | LBRACE RBRACEobject_properties : object_properties COMMA key_value\n                         | key_valuekey_value : ID COLON value\n                 | NUMBER COLON valuevalue : literal\n             | object\n             | value_arrayvalue_array : LBRACKET values RBRACKET\n                   | LBRACKET RBRACKETvalues : values COMMA value\n              | value'
+    
+_lr_action_items = {'VAR':([0,],[3,]),'LET':([0,],[4,]),'CONST':([0,],[5,]),'$end':([1,10,],[0,-10,]),'ID':([2,3,4,5,9,17,],[6,-1,-2,-3,14,14,]),'ASSIGN':([6,],[7,]),'LBRACE':([7,18,19,27,37,],[9,9,9,9,9,]),'SEMICOLON':([8,12,16,],[10,-12,-11,]),'RBRACE':([9,11,12,13,16,20,21,22,23,24,25,26,28,29,30,31,32,34,36,],[12,16,-12,-14,-11,-13,-15,-17,-18,-19,-8,-9,-4,-5,-6,-7,-16,-21,-20,]),'NUMBER':([9,17,18,19,27,37,],[15,15,28,28,28,28,]),'COMMA':([11,12,13,16,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,38,],[17,-12,-14,-11,-13,-15,-17,-18,-19,-8,-9,-4,-5,-6,-7,-16,37,-21,-23,-20,-22,]),'RBRACKET':([12,16,22,23,24,25,26,27,28,29,30,31,33,34,35,36,38,],[-12,-11,-17,-18,-19,-8,-9,34,-4,-5,-6,-7,36,-21,-23,-20,-22,]),'COLON':([14,15,],[18,19,]),'NULL':([18,19,27,37,],[26,26,26,26,]),'LBRACKET':([18,19,27,37,],[27,27,27,27,]),'STRING':([18,19,27,37,],[29,29,29,29,]),'TRUE':([18,19,27,37,],[30,30,30,30,]),'FALSE':([18,19,27,37,],[31,31,31,31,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'object_declaration':([0,],[1,]),'kind':([0,],[2,]),'object':([7,18,19,27,37,],[8,23,23,23,23,]),'object_properties':([9,],[11,]),'key_value':([9,17,],[13,20,]),'value':([18,19,27,37,],[21,32,35,38,]),'literal':([18,19,27,37,],[22,22,22,22,]),'value_array':([18,19,27,37,],[24,24,24,24,]),'scalar':([18,19,27,37,],[25,25,25,25,]),'values':([27,],[33,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> object_declaration","S'",1,None,None,None),
+  ('kind -> VAR','kind',1,'p_kind','constructs.py',93),
+  ('kind -> LET','kind',1,'p_kind','constructs.py',94),
+  ('kind -> CONST','kind',1,'p_kind','constructs.py',95),
+  ('scalar -> NUMBER','scalar',1,'p_scalar','constructs.py',99),
+  ('scalar -> STRING','scalar',1,'p_scalar','constructs.py',100),
+  ('scalar -> TRUE','scalar',1,'p_scalar_boolean','constructs.py',104),
+  ('scalar -> FALSE','scalar',1,'p_scalar_boolean','constructs.py',105),
+  ('literal -> scalar','literal',1,'p_literal','constructs.py',109),
+  ('literal -> NULL','literal',1,'p_literal_null','constructs.py',113),
+  ('object_declaration -> kind ID ASSIGN object SEMICOLON','object_declaration',5,'p_object_declaration','constructs.py',149),
+  ('object -> LBRACE object_properties RBRACE','object',3,'p_object','constructs.py',153),
+  ('object -> LBRACE RBRACE','object',2,'p_object','constructs.py',154),
+  ('object_properties -> object_properties COMMA key_value','object_properties',3,'p_object_properties','constructs.py',158),
+  ('object_properties -> key_value','object_properties',1,'p_object_properties','constructs.py',159),
+  ('key_value -> ID COLON value','key_value',3,'p_key_value','constructs.py',168),
+  ('key_value -> NUMBER COLON value','key_value',3,'p_key_value','constructs.py',169),
+  ('value -> literal','value',1,'p_value','constructs.py',173),
+  ('value -> object','value',1,'p_value','constructs.py',174),
+  ('value -> value_array','value',1,'p_value','constructs.py',175),
+  ('value_array -> LBRACKET values RBRACKET','value_array',3,'p_value_array','constructs.py',179),
+  ('value_array -> LBRACKET RBRACKET','value_array',2,'p_value_array','constructs.py',180),
+  ('values -> values COMMA value','values',3,'p_values','constructs.py',184),
+  ('values -> value','values',1,'p_values','constructs.py',185),
+]
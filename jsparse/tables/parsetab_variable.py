@@ -0,0 +1,39 @@
+
+# parsetab_variable.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'variable_declarationASSIGN CONST FALSE ID LET NUMBER SEMICOLON STRING TRUE VARkind : VAR\n            | LET\n            | CONSTscalar : NUMBER\n              | STRINGscalar : TRUE\n              | FALSEvariable_declaration : kind ID SEMICOLON\n                            | kind ID ASSIGN scalar SEMICOLON'
+    
+_lr_action_items = {'VAR':([0,],[3,]),'LET':([0,],[4,]),'CONST':([0,],[5,]),'$end':([1,7,14,],[0,-8,-9,]),'ID':([2,3,4,5,],[6,-1,-2,-3,]),'SEMICOLON':([6,9,10,11,12,13,],[7,14,-4,-5,-6,-7,]),'ASSIGN':([6,],[8,]),'NUMBER':([8,],[10,]),'STRING':([8,],[11,]),'TRUE':([8,],[12,]),'FALSE':([8,],[13,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'variable_declaration':([0,],[1,]),'kind':([0,],[2,]),'scalar':([8,],[9,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> variable_declaration","S'",1,None,None,None),
+  ('kind -> VAR','kind',1,'p_kind','constructs.py',93),
+  ('kind -> LET','kind',1,'p_kind','constructs.py',94),
+  ('kind -> CONST','kind',1,'p_kind','constructs.py',95),
+  ('scalar -> NUMBER','scalar',1,'p_scalar','constructs.py',99),
+  ('scalar -> STRING','scalar',1,'p_scalar','constructs.py',100),
+  ('scalar -> TRUE','scalar',1,'p_scalar_boolean','constructs.py',104),
+  ('scalar -> FALSE','scalar',1,'p_scalar_boolean','constructs.py',105),
+  ('variable_declaration -> kind ID SEMICOLON','variable_declaration',3,'p_variable_declaration','constructs.py',118),
+  ('variable_declaration -> kind ID ASSIGN scalar SEMICOLON','variable_declaration',5,'p_variable_declaration','constructs.py',119),
+]
@@ -0,0 +1,46 @@
+
+# parsetab_while.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'while_loopleftORleftANDleftCOMPARISONleftPLUSMINUSleftTIMESDIVIDEAND ASSIGN COMPARISON DIVIDE ID LBRACE LPAREN MINUS NUMBER OR PLUS RBRACE RPAREN SEMICOLON TIMES WHILEexpr : expr OR expr\n            | expr AND expr\n            | expr COMPARISON expr\n            | expr PLUS expr\n            | expr MINUS expr\n            | expr TIMES expr\n            | expr DIVIDE exprexpr : NUMBERexpr : IDexpr : LPAREN expr RPARENwhile_loop : WHILE LPAREN expr RPAREN LBRACE statements RBRACEstatements : statements statement\n                  | emptystatement : ID ASSIGN expr SEMICOLONstatement : ID SEMICOLONempty :'
+    
+_lr_action_items = {'WHILE':([0,],[2,]),'$end':([1,28,],[0,-11,]),'LPAREN':([2,3,4,10,11,12,13,14,15,16,31,],[3,4,4,4,4,4,4,4,4,4,4,]),'NUMBER':([3,4,10,11,12,13,14,15,16,31,],[6,6,6,6,6,6,6,6,6,6,]),'ID':([3,4,10,11,12,13,14,15,16,18,26,27,29,31,32,34,],[7,7,7,7,7,7,7,7,7,-16,30,-13,-12,7,-15,-14,]),'RPAREN':([5,6,7,8,17,19,20,21,22,23,24,25,],[9,-8,-9,17,-10,-1,-2,-3,-4,-5,-6,-7,]),'OR':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[10,-8,-9,10,-10,-1,-2,-3,-4,-5,-6,-7,10,]),'AND':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[11,-8,-9,11,-10,11,-2,-3,-4,-5,-6,-7,11,]),'COMPARISON':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[12,-8,-9,12,-10,12,12,-3,-4,-5,-6,-7,12,]),'PLUS':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[13,-8,-9,13,-10,13,13,13,-4,-5,-6,-7,13,]),'MINUS':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[14,-8,-9,14,-10,14,14,14,-4,-5,-6,-7,14,]),'TIMES':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[15,-8,-9,15,-10,15,15,15,15,15,-6,-7,15,]),'DIVIDE':([5,6,7,8,17,19,20,21,22,23,24,25,33,],[16,-8,-9,16,-10,16,16,16,16,16,-6,-7,16,]),'SEMICOLON':([6,7,17,19,20,21,22,23,24,25,30,33,],[-8,-9,-10,-1,-2,-3,-4,-5,-6,-7,32,34,]),'LBRACE':([9,],[18,]),'RBRACE':([18,26,27,29,32,34,],[-16,28,-13,-12,-15,-14,]),'ASSIGN':([30,],[31,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'while_loop':([0,],[1,]),'expr':([3,4,10,11,12,13,14,15,16,31,],[5,8,19,20,21,22,23,24,25,33,]),'statements':([18,],[26,]),'empty':([18,],[27,]),'statement':([26,],[29,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> while_loop","S'",1,None,None,None),
+  ('expr -> expr OR expr','expr',3,'p_expr_binop','expressions.py',37),
+  ('expr -> expr AND expr','expr',3,'p_expr_binop','expressions.py',38),
+  ('expr -> expr COMPARISON expr','expr',3,'p_expr_binop','expressions.py',39),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','expressions.py',40),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','expressions.py',41),
+  ('expr -> expr TIMES expr','expr',3,'p_expr_binop','expressions.py',42),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binop','expressions.py',43),
+  ('expr -> NUMBER','expr',1,'p_expr_number','expressions.py',48),
+  ('expr -> ID','expr',1,'p_expr_id','expressions.py',53),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_parens','expressions.py',58),
+  ('while_loop -> WHILE LPAREN expr RPAREN LBRACE statements RBRACE','while_loop',7,'p_while_loop','constructs.py',213),
+  ('statements -> statements statement','statements',2,'p_statements','constructs.py',217),
+  ('statements -> empty','statements',1,'p_statements','constructs.py',218),
+  ('statement -> ID ASSIGN expr SEMICOLON','statement',4,'p_statement_assign','constructs.py',226),
+  ('statement -> ID SEMICOLON','statement',2,'p_statement_id','constructs.py',230),
+  ('empty -> <empty>','empty',0,'p_empty','constructs.py',234),
+]
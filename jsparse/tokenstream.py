@@ -0,0 +1,167 @@
+"""Compact token storage: parallel typed arrays over the source text.
+
+A TokenStream keeps three numbers per token (type code, start offset,
+length) in array.array columns plus one reference to the source text. It
+stores no per-token objects, and no literal is sliced out or converted
+during lexing. Indexing or iterating a stream produces a LazyToken. A
+LazyToken has the type, value, lineno and lexpos attributes the PLY
+parser and the rest of jsparse read, but it only slices (and converts, for
+NUMBER) its text when ``value`` is read. A grammar action reads it through
+p[n]; an operator or punctuation token is never decoded. Lines and columns
+are not stored either: ``lineno`` and ``column`` are looked up in the
+stream's jsparse.positions.LineIndex when they are read.
+
+Slicing a stream returns a view that shares the arrays, so cutting a
+program into statements copies nothing.
+"""
+import array
+import itertools
+
+from jsparse.positions import LineIndex
+
+# Typecode of the offset, length and line columns: at least 4 bytes on every supported platform
+_INDEX_TYPECODE = 'I' if array.array('I').itemsize >= 4 else 'L'
+
+
+class LazyToken:
+    """One token of a TokenStream, decoded on attribute access."""
+    # PLY attaches 'lexer' to the offending token before calling p_error
+    __slots__ = ('type', '_stream', '_index', 'lexer')
+
+    def __init__(self, stream, index, type):
+        self.type = type
+        self._stream = stream
+        self._index = index
+
+    @property
+    def value(self):
+        # Inlined TokenStream.value(), since grammar actions read values in the parser's inner loop
+        stream = self._stream
+        index = self._index
+        start = stream.starts[index]
+        text = stream.text[start:start + stream.lengths[index]]
+        convert = stream.converters[stream.codes[index]]
+        return convert(text) if convert else text
+
+    @property
+    def lineno(self):
+        return self._stream.line_index.line(self._stream.starts[self._index])
+
+    @property
+    def column(self):
+        return self._stream.line_index.column(self._stream.starts[self._index])
+
+    @property
+    def lexpos(self):
+        return self._stream.starts[self._index]
+
+    def __repr__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+    def __reduce__(self):
+        # Pickles as a plain token, without the whole stream
+        from jsparse.lexer import Token
+        return Token, (self.type, self.value, self.lineno, self.lexpos)
+
+
+class TokenStream:
+    """A sequence of LazyTokens backed by typed arrays; see the module docstring."""
+    __slots__ = ('text', 'type_names', 'converters', 'codes', 'starts', 'lengths', 'line_index', '_first', '_stop')
+
+    def __init__(self, text, type_names, converters, first_line=1):
+        self.text = text
+        self.type_names = type_names  # Type code -> token type name
+        self.converters = converters  # Type code -> function applied to the text, or None
+        self.codes = array.array('B')
+        self.starts = array.array(_INDEX_TYPECODE)
+        self.lengths = array.array(_INDEX_TYPECODE)
+        self.line_index = LineIndex(text, first_line)  # Shared with every view of the stream
+        self._first = 0
+        self._stop = None  # None while the stream is still being filled, and for a full stream
+
+    def append(self, code, start, length):
+        self.codes.append(code)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def value(self, index):
+        """Return the decoded value of the token at absolute index in the arrays."""
+        start = self.starts[index]
+        text = self.text[start:start + self.lengths[index]]
+        convert = self.converters[self.codes[index]]
+        return convert(text) if convert else text
+
+    def _bounds(self):
+        return self._first, len(self.codes) if self._stop is None else self._stop
+
+    def __len__(self):
+        first, stop = self._bounds()
+        return stop - first
+
+    def __getitem__(self, index):
+        first, stop = self._bounds()
+        if isinstance(index, slice):
+            start, end, step = index.indices(stop - first)
+            if step != 1:
+                raise ValueError('TokenStream slices cannot have a step')
+            view = TokenStream.__new__(TokenStream)
+            view.text = self.text
+            view.type_names = self.type_names
+            view.converters = self.converters
+            view.codes = self.codes
+            view.starts = self.starts
+            view.lengths = self.lengths
+            view.line_index = self.line_index
+            view._first = first + start
+            view._stop = first + max(start, end)
+            return view
+        if index < 0:
+            index += stop - first
+        if not 0 <= index < stop - first:
+            raise IndexError('token index out of range')
+        index += first
+        return LazyToken(self, index, self.type_names[self.codes[index]])
+
+    def __iter__(self):
+        first, stop = self._bounds()
+        return map(LazyToken, itertools.repeat(self), range(first, stop), self.types())
+
+    def types(self):
+        """Return an iterator over the token type names, without creating tokens."""
+        first, stop = self._bounds()
+        return map(self.type_names.__getitem__, self.codes[first:stop])
+
+    def positions(self):
+        """Return the (line, column) of every token, in one pass over the line index."""
+        first, stop = self._bounds()
+        return self.line_index.positions(self.starts[first:stop])
+
+    def __getstate__(self):
+        # A view pickles only its own tokens
+        first, stop = self._bounds()
+        return (self.text, self.type_names, self.converters, self.codes[first:stop], self.starts[first:stop],
+                self.lengths[first:stop], self.line_index.first_line)
+
+    def __setstate__(self, state):
+        self.text, self.type_names, self.converters, self.codes, self.starts, self.lengths, first_line = state
+        self.line_index = LineIndex(self.text, first_line)
+        self._first = 0
+        self._stop = None
+
+    def nbytes(self):
+        """Return the bytes held by the arrays of the whole stream, not counting the source text or line index."""
+        return sum(column.itemsize * len(column) for column in (self.codes, self.starts, self.lengths))
+
+
+def token_types(tokens):
+    """Iterate over the type names of a token list or TokenStream."""
+    if isinstance(tokens, TokenStream):
+        return tokens.types()
+    return (tok.type for tok in tokens)
+
+
+def token_positions(tokens):
+    """Return the (line, column) of every token in a token list or TokenStream."""
+    if isinstance(tokens, TokenStream):
+        return tokens.positions()
+    return [(tok.lineno, tok.column) for tok in tokens]
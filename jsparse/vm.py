@@ -0,0 +1,362 @@
+"""Compile parsed programs to closures and run them.
+
+compile_program() turns a Program from ALL.py into a Function. Every
+statement and expression in it is compiled once into a Python closure
+specialised for its node type and operands. A body is a flat tuple of
+statement closures that run() steps through, so executing a program does
+no type dispatch on tree nodes.
+
+Function parameters and the names declared with var/let/const inside a
+function are local slots in a list; every other name is a global. Function
+declarations are hoisted to the top of their body. There are no closures
+at the JavaScript level: a nested function sees its own locals and the
+globals only.
+
+Every loop iteration and call counts as one step against the budget;
+running past max_steps or timeout raises BudgetExceeded.
+"""
+import math
+import operator
+import sys
+import time
+
+from jsparse.nodes import (
+    ArrayLiteral, Assign, BinOp, Call, ExprStatement, FunctionDecl, Identifier,
+    Number, ObjectLiteral, Return, String, VarDecl, While,
+)
+
+# Operators that never need JavaScript coercion between two numbers
+_ARITHMETIC = {'-': operator.sub, '*': operator.mul,
+               '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+               '==': operator.eq, '!=': operator.ne}
+
+# Checking the clock on every step would dominate tight loops
+_CLOCK_INTERVAL = 4096
+
+# Python stack frames a single JavaScript call can use, for sizing the recursion limit
+_FRAMES_PER_CALL = 8
+
+
+class ExecutionError(Exception):
+    pass
+
+
+class BudgetExceeded(ExecutionError):
+    pass
+
+
+class Function:
+    __slots__ = ('name', 'params', 'body', 'nlocals')
+
+    def __init__(self, name, params, body, nlocals):
+        self.name = name
+        self.params = params
+        self.body = body  # body(local_values, context) returns None, or a 1-tuple holding the return value
+        self.nlocals = nlocals
+
+    def __repr__(self):
+        return f'<function {self.name}>'
+
+
+class _Context:
+    """Per-run state shared by every compiled closure."""
+    __slots__ = ('globals', 'steps_left', 'max_steps', 'deadline', 'timeout', 'clock_in', 'depth', 'max_depth')
+
+    def __init__(self, globals_, max_steps, timeout, max_depth):
+        self.globals = globals_
+        self.max_steps = max_steps
+        self.steps_left = math.inf if max_steps is None else max_steps
+        self.timeout = timeout
+        self.deadline = None if timeout is None else time.perf_counter() + timeout
+        self.clock_in = _CLOCK_INTERVAL
+        self.depth = 0
+        self.max_depth = max_depth
+
+    def step(self):
+        """Charge one step, raising BudgetExceeded once the budget is spent."""
+        self.steps_left -= 1
+        if self.steps_left < 0:
+            raise BudgetExceeded(f'step budget of {self.max_steps} exhausted')
+        self.clock_in -= 1
+        if not self.clock_in:
+            self.clock_in = _CLOCK_INTERVAL
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise BudgetExceeded(f'time budget of {self.timeout} s exhausted')
+
+
+def _string_value(text):
+    """Return the value of a string literal's source text."""
+    escapes = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+    out = []
+    chars = iter(text[1:-1])
+    for char in chars:
+        if char == '\\':
+            char = next(chars)
+            char = escapes.get(char, char)
+        out.append(char)
+    return ''.join(out)
+
+
+def to_display(value):
+    """Format a value the way JavaScript prints it."""
+    if value is None:
+        return 'undefined'
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    if type(value) is float:
+        if value != value:
+            return 'NaN'
+        if value in (math.inf, -math.inf):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return str(int(value)) if value.is_integer() else repr(value)
+    if type(value) is list:
+        return ','.join('' if item is None else to_display(item) for item in value)
+    if type(value) is dict:
+        return '[object Object]'
+    return str(value)
+
+
+def _add(a, b):
+    if type(a) is str or type(b) is str:
+        return (a if type(a) is str else to_display(a)) + (b if type(b) is str else to_display(b))
+    return a + b
+
+
+def _divide(a, b):
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or a != a:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def _truthy(value):
+    if type(value) is float:
+        return value != 0 and value == value  # NaN is falsy
+    # Empty arrays and objects are truthy in JavaScript, unlike in Python
+    return bool(value) or type(value) is list or type(value) is dict
+
+
+def _walk_statements(body):
+    """Yield the statements of a body, descending into while loops but not nested functions."""
+    stack = list(reversed(body))
+    while stack:
+        statement = stack.pop()
+        yield statement
+        if type(statement) is While:
+            stack.extend(reversed(statement.body))
+
+
+class _Compiler:
+    def __init__(self, params):
+        # Slot of each local name; None compiles the top level, where every name is global
+        self.locals = None
+        if params is not None:
+            self.locals = {}
+            for param in params:
+                self.locals.setdefault(param, len(self.locals))
+
+    def function(self, name, params, body):
+        if self.locals is not None:
+            for statement in _walk_statements(body):
+                if type(statement) is VarDecl or type(statement) is FunctionDecl:
+                    self.locals.setdefault(statement.name, len(self.locals))
+        hoisted = [self.declare_function(statement)
+                   for statement in _walk_statements(body) if type(statement) is FunctionDecl]
+        return Function(name, params or [], self.block(hoisted + self.statements(body)),
+                        len(self.locals or ()))
+
+    def statements(self, body):
+        return [self.statement(statement) for statement in body if type(statement) is not FunctionDecl]
+
+    def block(self, closures):
+        closures = tuple(closures)
+        if len(closures) == 1:
+            return closures[0]
+
+        def run_block(l, c):
+            for closure in closures:
+                result = closure(l, c)
+                if result is not None:
+                    return result
+        return run_block
+
+    def store(self, name, value):
+        if self.locals is not None and name in self.locals:
+            slot = self.locals[name]
+
+            def store_local(l, c):
+                l[slot] = value(l, c)
+            return store_local
+
+        def store_global(l, c):
+            c.globals[name] = value(l, c)
+        return store_global
+
+    def declare_function(self, node):
+        function = _Compiler(node.params).function(node.name, node.params, node.body)
+        return self.store(node.name, lambda l, c: function)
+
+    def statement(self, node):
+        kind = type(node)
+        if kind is VarDecl:
+            if node.init is not None:
+                return self.store(node.name, self.expression(node.init))
+            if self.locals is not None and node.name in self.locals:
+                return lambda l, c: None
+            name = node.name
+
+            def declare_global(l, c):
+                c.globals.setdefault(name, None)
+            return declare_global
+        if kind is Assign:
+            return self.store(node.name, self.expression(node.value))
+        if kind is ExprStatement:
+            expr = self.expression(node.expr)
+
+            def expression_statement(l, c):
+                expr(l, c)
+            return expression_statement
+        if kind is Return:
+            value = self.expression(node.value)
+            return lambda l, c: (value(l, c),)
+        if kind is While:
+            test = self.expression(node.test)
+            body = self.block(self.statements(node.body))
+
+            def while_loop(l, c):
+                while True:
+                    value = test(l, c)
+                    if value is not True and not _truthy(value):
+                        return None
+                    c.step()
+                    result = body(l, c)
+                    if result is not None:
+                        return result
+            return while_loop
+        raise ExecutionError(f'cannot compile {kind.__name__}')
+
+    def expression(self, node):
+        kind = type(node)
+        if kind is Number or kind is String:
+            value = node.value if kind is Number else _string_value(node.value)
+            return lambda l, c: value
+        if kind is Identifier:
+            name = node.name
+            if self.locals is not None and name in self.locals:
+                slot = self.locals[name]
+                return lambda l, c: l[slot]
+
+            def load_global(l, c):
+                try:
+                    return c.globals[name]
+                except KeyError:
+                    raise ExecutionError(f'{name} is not defined') from None
+            return load_global
+        if kind is BinOp:
+            return self.binary(node)
+        if kind is Call:
+            return self.call(node)
+        if kind is ArrayLiteral:
+            elements = tuple(self.expression(element) for element in node.elements)
+            return lambda l, c: [element(l, c) for element in elements]
+        if kind is ObjectLiteral:
+            properties = tuple((key, self.expression(value)) for key, value in node.properties)
+            return lambda l, c: {key: value(l, c) for key, value in properties}
+        raise ExecutionError(f'cannot compile {kind.__name__}')
+
+    def binary(self, node):
+        op = node.op
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        if op == '&&':
+            def logical_and(l, c):
+                value = left(l, c)
+                return right(l, c) if value is True or _truthy(value) else value
+            return logical_and
+        if op == '||':
+            def logical_or(l, c):
+                value = left(l, c)
+                return value if value is True or _truthy(value) else right(l, c)
+            return logical_or
+        if op == '+':
+            def add(l, c):
+                a = left(l, c)
+                b = right(l, c)
+                if type(a) is float and type(b) is float:
+                    return a + b
+                return _add(a, b)
+            return add
+        if op == '/':
+            return lambda l, c: _divide(left(l, c), right(l, c))
+        function = _ARITHMETIC[op]
+        # Constant right operands, as in `i < 10` or `n - 1`, skip one closure call
+        if type(node.right) is Number:
+            constant = node.right.value
+            return lambda l, c: function(left(l, c), constant)
+        return lambda l, c: function(left(l, c), right(l, c))
+
+    def call(self, node):
+        callee = self.expression(Identifier(node.callee))
+        args = tuple(self.expression(arg) for arg in node.args)
+
+        def call(l, c):
+            function = callee(l, c)
+            values = [arg(l, c) for arg in args]
+            if type(function) is not Function:
+                if callable(function):
+                    return function(*values)
+                raise ExecutionError(f'{to_display(function)} is not a function')
+            c.step()
+            # Missing arguments are undefined and extra ones dropped; declared locals follow the parameters
+            nparams = len(function.params)
+            if len(values) != nparams:
+                values = (values + [None] * nparams)[:nparams]
+            values += [None] * (function.nlocals - nparams)
+            c.depth += 1
+            if c.depth > c.max_depth:
+                raise ExecutionError('maximum call stack size exceeded')
+            result = function.body(values, c)
+            c.depth -= 1
+            return None if result is None else result[0]
+        return call
+
+
+def compile_program(program):
+    """Compile a Program node into a Function for run()."""
+    return _Compiler(None).function('<program>', None, program.body)
+
+
+def _print(*values):
+    print(' '.join(to_display(value) for value in values))
+
+
+# Python callables a program can call by name
+BUILTINS = {'print': _print}
+
+
+def run(function, globals_=None, builtins=BUILTINS, max_steps=1000000, timeout=None, max_depth=1000):
+    """Run a compiled program and return its top-level return value, or None.
+
+    globals_ is updated in place when given. max_steps and timeout may be
+    None for no limit; max_depth bounds the number of nested calls.
+    """
+    if globals_ is None:
+        globals_ = {}
+    if builtins:
+        for name, value in builtins.items():
+            globals_.setdefault(name, value)
+    context = _Context(globals_, max_steps, timeout, max_depth)
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, max_depth * _FRAMES_PER_CALL + 1000))
+    try:
+        result = function.body([None] * function.nlocals, context)
+    except TypeError as exc:
+        # Operations JavaScript would coerce, such as "a" - 1 or "a" < 1
+        raise ExecutionError(str(exc)) from None
+    except RecursionError:
+        raise ExecutionError('expression nesting too deep') from None
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    return None if result is None else result[0]
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse.cache import ParseCache
+from jsparse.printer import to_source
+
+DEPTH = 300
+DEEP = f"let objects = {'{a: ' * DEPTH}1{'}' * DEPTH};\nvar sum = {'(' * DEPTH}1{' + 1)' * DEPTH};\n"
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ParseCache(directory.name)
+
+    def test_deep_tree_is_cached(self):
+        first = ALL.parse_js_code(DEEP, verbose=False, cache=self.cache)
+        second = ALL.parse_js_code(DEEP, verbose=False, cache=self.cache)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(to_source(second.tree), to_source(first.tree))
+
+    def test_value_too_deep_to_pickle_is_skipped(self):
+        value = []
+        for _ in range(100000):
+            value = [value]
+        key = self.cache.key('deep', 'test')
+        self.cache.put(key, value)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertIsNone(self.cache.get(key))
+
+    def test_trim_counts_entries_written_by_other_instances(self):
+        other = ParseCache(self.cache.directory, self.cache.max_bytes)
+        for index in range(4):
+            self.cache.put(self.cache.key(str(index), 'test'), 'x' * 1000)
+            other.put(other.key(str(index), 'other'), 'x' * 1000)
+        self.cache.max_bytes = 3000
+        self.cache.trim()
+        self.assertLessEqual(self.cache.stats()['bytes'], 3000)
+        self.assertEqual(self.cache.evictions, 6)
+        self.assertEqual(len(os.listdir(self.cache.directory)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
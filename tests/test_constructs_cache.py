@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsparse import constructs
+from jsparse.cache import ParseCache
+from jsparse.interning import LiteralInterner
+
+
+class ConstructsCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ParseCache(directory.name)
+
+    def test_second_parse_is_a_hit(self):
+        first = constructs.parse('array', 'var a = [1, [2, 3]];', cache=self.cache)
+        second = constructs.parse('array', 'var a = [1, [2, 3]];', cache=self.cache)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(second.tree, first.tree)
+        self.assertEqual(second.errors, first.errors)
+        self.assertEqual([tok.type for tok in second.tokens], [tok.type for tok in first.tokens])
+
+    def test_modes_do_not_share_entries(self):
+        code = 'var a = [1];'
+        constructs.parse('array', code, cache=self.cache)
+        result = constructs.parse('object', code, report=False, cache=self.cache)
+        self.assertEqual(self.cache.stats()['hits'], 0)
+        self.assertTrue(result.errors)
+
+    def test_interned_parses_bypass_the_cache(self):
+        constructs.parse('array', 'var a = [1];', cache=self.cache, interner=LiteralInterner())
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
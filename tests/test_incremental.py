@@ -0,0 +1,30 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse.incremental import parse_document
+
+
+class MultiLineStringTest(unittest.TestCase):
+    TEXT = 'var a = 1;\nvar s = "one\ntwo\nthree" + b;\nvar t = "x\ny" + ;\nvar c = 2;\n'
+
+    def test_errors_match_full_parse(self):
+        expected = ALL.parse_js_code(self.TEXT, verbose=False).errors
+        self.assertTrue(expected)
+        self.assertEqual(parse_document(self.TEXT).errors, expected)
+
+    def test_token_lines_match_full_parse(self):
+        expected = [(tok.type, tok.lineno, tok.lexpos) for tok in ALL.parse_js_code(self.TEXT, verbose=False).tokens]
+        self.assertEqual([(tok.type, tok.lineno, tok.lexpos) for tok in parse_document(self.TEXT).tokens()], expected)
+
+    def test_lines_after_edit(self):
+        document = parse_document(self.TEXT).edit(0, 0, 'var z = "p\nq";\n')
+        text = 'var z = "p\nq";\n' + self.TEXT
+        self.assertEqual(document.errors, ALL.parse_js_code(text, verbose=False).errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsparse import constructs
+from jsparse.interning import LiteralInterner
+
+
+class LiteralInternerTest(unittest.TestCase):
+    def test_int_and_float_keys_stay_distinct(self):
+        interner = LiteralInterner()
+        first = constructs.parse('object', 'var a = {1: 5};', report=False, interner=interner).tree.value
+        second = constructs.parse('object', 'var b = {1.0: 5};', report=False, interner=interner).tree.value
+        self.assertIsNot(first, second)
+        self.assertIs(type(next(iter(first))), int)
+        self.assertIs(type(next(iter(second))), float)
+
+    def test_identical_literals_are_shared(self):
+        interner = LiteralInterner()
+        value = constructs.parse('object', 'var a = {p: {x: 1}, q: {x: 1}};', report=False,
+                                 interner=interner).tree.value
+        self.assertIs(value['p'], value['q'])
+        self.assertEqual(interner.hits, 3)  # The key x, the value 1 and the object {x: 1}
+        self.assertGreater(interner.saved_bytes, 0)
+
+    def test_saved_bytes_counts_the_duplicate_container(self):
+        interner = LiteralInterner()
+        interner.array([])
+        duplicate = []
+        interner.array(duplicate)
+        self.assertEqual(interner.saved_bytes, sys.getsizeof(duplicate))
+        interner.object({})
+        duplicate = {}
+        interner.object(duplicate)
+        self.assertEqual(interner.saved_bytes, sys.getsizeof([]) + sys.getsizeof(duplicate))
+
+
+if __name__ == '__main__':
+    unittest.main()
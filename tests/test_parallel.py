@@ -0,0 +1,53 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse import parallel
+from jsparse.printer import to_source
+
+DEPTH = 300
+DEEP = (f"let objects = {'{a: ' * DEPTH}1{'}' * DEPTH};\n"
+        f"let arrays = {'[' * DEPTH}1{']' * DEPTH};\n"
+        f"var sum = {'(' * DEPTH}1{' + 1)' * DEPTH};\n")
+
+
+class DeepTreeTest(unittest.TestCase):
+    def test_deep_tree_pickles(self):
+        tree = ALL.parse_js_code(DEEP, verbose=False).tree
+        copy = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(to_source(copy), to_source(tree))
+        self.assertEqual([node.pos for node in copy.body], [node.pos for node in tree.body])
+
+    def test_deep_tree_comes_back_from_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'deep.js')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(DEEP)
+            [result] = parallel.parse_files([path], workers=2, keep_tree=True)
+        self.assertIsNone(result.exception)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(to_source(result.tree), to_source(ALL.parse_js_code(DEEP, verbose=False).tree))
+
+
+class WorkerCacheTest(unittest.TestCase):
+    def test_results_tell_cache_hits(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.js')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('var a = 1;\n')
+            cache_dir = os.path.join(directory, 'cache')
+            [first] = parallel.parse_files([path], workers=2, cache_dir=cache_dir)
+            [second] = parallel.parse_files([path], workers=2, cache_dir=cache_dir)
+            [uncached] = parallel.parse_files([path], workers=2)
+        self.assertIs(first.cache_hit, False)
+        self.assertIs(second.cache_hit, True)
+        self.assertIsNone(uncached.cache_hit)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse import scopes
+
+
+def analyze(code):
+    result = ALL.parse_js_code(code, verbose=False)
+    assert not result.errors, result.errors
+    return scopes.analyze(result.tree)
+
+
+def messages(analysis):
+    return [str(error) for error in analysis.errors]
+
+
+class RedeclarationTest(unittest.TestCase):
+    def test_let_and_const_cannot_be_redeclared(self):
+        self.assertEqual(messages(analyze('let a = 1; let a = 2;')), ["Identifier 'a' has already been declared"])
+        self.assertEqual(messages(analyze('const b = 1; var b = 2;')), ["Identifier 'b' has already been declared"])
+        self.assertEqual(messages(analyze('var c = 1; let c = 2;')), ["Identifier 'c' has already been declared"])
+
+    def test_var_and_function_merge(self):
+        analysis = analyze('var f = 1; var f = 2; function f() { return 1; }')
+        self.assertEqual(analysis.errors, [])
+        symbol = analysis.scope.symbols['f']
+        self.assertEqual(symbol.kind, 'function')
+        self.assertEqual(symbol.writes, 2)
+
+    def test_repeated_parameter(self):
+        analysis = analyze('function f(a, a) { return a; }')
+        [error] = analysis.errors
+        self.assertEqual(error.name, 'a')
+        self.assertEqual(error.node.name, 'f')
+
+    def test_var_inside_block_of_same_let(self):
+        analysis = analyze('while (1) { let x = 1; var x = 2; }')
+        self.assertEqual(messages(analysis), ["Identifier 'x' has already been declared"])
+        self.assertEqual(analysis.errors[0].node.kind, 'var')
+
+    def test_let_in_block_may_shadow_outer_let(self):
+        self.assertEqual(analyze('let x = 1; while (1) { let x = 2; }').errors, [])
+
+
+class ConstTest(unittest.TestCase):
+    def test_assignment_to_const(self):
+        analysis = analyze('const k = 1; k = 2;')
+        self.assertEqual(messages(analysis), ["Assignment to constant variable 'k'"])
+        self.assertEqual(analysis.errors[0].node.name, 'k')
+
+    def test_assignment_to_shadowing_let_is_allowed(self):
+        self.assertEqual(analyze('const k = 1; function f() { let k = 0; k = 2; }').errors, [])
+
+
+class ShadowingTest(unittest.TestCase):
+    def test_binding_restored_after_while_block(self):
+        analysis = analyze('let x = 1; while (x) { let x = 2; print(x); } print(x);')
+        outer = analysis.scope.symbols['x']
+        [block] = analysis.scope.children
+        inner = block.symbols['x']
+        self.assertEqual(block.kind, 'block')
+        self.assertEqual((outer.reads, inner.reads), (2, 1))
+
+    def test_binding_restored_after_function(self):
+        analysis = analyze('var a = 1; function f(a) { return a; } print(a);')
+        [function] = analysis.scope.children
+        self.assertEqual(analysis.scope.symbols['a'].reads, 1)
+        self.assertEqual(function.symbols['a'].kind, 'param')
+        self.assertEqual(function.symbols['a'].reads, 1)
+
+    def test_while_without_lexical_names_has_no_scope(self):
+        self.assertEqual(analyze('var i = 0; while (i < 2) { i = i + 1; }').scope.children, [])
+
+
+class UnresolvedTest(unittest.TestCase):
+    def test_undeclared_names_are_counted(self):
+        analysis = analyze('var a = y + y; g(a); z = 1; function f() { return y; }')
+        self.assertEqual(analysis.unresolved, {'y': 3, 'g': 1, 'z': 1})
+        self.assertEqual(analysis.errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
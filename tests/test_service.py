@@ -0,0 +1,73 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsparse.service import Client, ParseService
+
+
+class MalformedRequestTest(unittest.TestCase):
+    def exchange(self, lines):
+        """Send lines on one connection and return a decoded response to each."""
+        async def run():
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'service.sock')
+                service = ParseService(workers=1)
+                await service.start(path)
+                try:
+                    reader, writer = await asyncio.open_unix_connection(path)
+                    responses = []
+                    for line in lines:
+                        writer.write(line + b'\n')
+                        await writer.drain()
+                        responses.append(json.loads(await asyncio.wait_for(reader.readline(), 30)))
+                    writer.close()
+                    return responses
+                finally:
+                    await service.close()
+        return asyncio.run(run())
+
+    def test_malformed_first_line(self):
+        [response] = self.exchange([b'{not json'])
+        self.assertIsNone(response['id'])
+        self.assertIn('bad request', response['failure'])
+
+    def test_malformed_line_after_good_request(self):
+        good, bad = self.exchange([json.dumps({'id': 1, 'op': 'validate', 'source': 'var x = 1;'}).encode(),
+                                   b'{not json'])
+        self.assertEqual(good['id'], 1)
+        self.assertTrue(good['valid'])
+        self.assertIsNone(bad['id'])
+        self.assertIn('bad request', bad['failure'])
+
+
+class BatchingTest(unittest.TestCase):
+    def test_small_and_large_requests_are_all_answered(self):
+        large = 'var x = 1;\n' * 1000
+        sources = ['var a = 1;', large, 'var b = @2;', large, 'var c = 3;'] * 4
+
+        async def run():
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'service.sock')
+                service = ParseService(workers=1, small_request=100)
+                await service.start(path)
+                try:
+                    client = await Client.connect(path)
+                    try:
+                        return await asyncio.gather(*(client.request(source, op='validate', timeout=30)
+                                                      for source in sources))
+                    finally:
+                        await client.close()
+                finally:
+                    await service.close()
+        responses = asyncio.run(run())
+        self.assertEqual([response['valid'] for response in responses], [True, True, False, True, True] * 4)
+        self.assertEqual(responses[2]['illegal'], [['@', 8]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import contextlib
+import functools
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse import parallel, sinks
+from jsparse.parallel import FileResult
+
+CODE = 'var a = 1;\nfunction f(x, y) { var z = x + y; return z; }\nwhile (a < 3) { a = a + 1; }\n'
+
+
+def encode(sink_type, lazy_bodies):
+    result = ALL.parse_js_code(CODE, verbose=False, lazy_bodies=lazy_bodies)
+    stream = io.BytesIO()
+    sink = sink_type(stream)
+    sink.write(FileResult('a.js', len(CODE), result.tree, result.tokens, result.errors, 0.0, None))
+    sink.close()
+    return stream.getvalue()
+
+
+class LazyBodySinkTest(unittest.TestCase):
+    def test_ndjson_writes_lazy_bodies_like_parsed_ones(self):
+        self.assertEqual(encode(sinks.NdjsonSink, True), encode(sinks.NdjsonSink, False))
+
+    def test_binary_writes_lazy_bodies_like_parsed_ones(self):
+        data = encode(sinks.BinarySink, True)
+        self.assertEqual(data, encode(sinks.BinarySink, False))
+        [dumped] = sinks.read_binary(io.BytesIO(data))
+        self.assertEqual(dumped.tree, ALL.parse_js_code(CODE, verbose=False).tree)
+
+
+class IllegalCharacterSinkTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'a.js')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('var a = 1;\nvar b = @2;\n')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.result = parallel.parse_file(path, functools.partial(ALL.parse_js_code, report=False), True)
+        self.assertEqual(output.getvalue(), '')
+
+    def test_ndjson_writes_illegal_records(self):
+        stream = io.BytesIO()
+        sink = sinks.NdjsonSink(stream)
+        sink.write(self.result)
+        sink.close()
+        records = [json.loads(line) for line in stream.getvalue().decode().splitlines()]
+        self.assertEqual([record for record in records if record['record'] == 'illegal'],
+                         [{'record': 'illegal', 'line': 2, 'pos': 19, 'char': '@', 'column': 9}])
+
+    def test_binary_round_trips_illegal_characters(self):
+        stream = io.BytesIO()
+        sink = sinks.BinarySink(stream)
+        sink.write(self.result)
+        sink.close()
+        [dumped] = sinks.read_binary(io.BytesIO(stream.getvalue()))
+        self.assertEqual(dumped.illegal, [('@', 19, 2, 9)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ALL
+from jsparse import vm
+
+
+def run(code, **options):
+    result = ALL.parse_js_code(code, verbose=False)
+    assert not result.errors, result.errors
+    return vm.run(vm.compile_program(result.tree), **options)
+
+
+class ArithmeticTest(unittest.TestCase):
+    def test_precedence(self):
+        self.assertEqual(run('return 1 + 2 * 3;'), 7)
+        self.assertEqual(run('return (1 + 2) * 3;'), 9)
+        self.assertEqual(run('return 2 * 3 < 1 + 6;'), True)
+
+    def test_left_associative(self):
+        self.assertEqual(run('return 10 - 4 - 3;'), 3)
+        self.assertEqual(run('return 8 / 2 / 2;'), 2)
+
+    def test_string_concatenation(self):
+        self.assertEqual(run('return "a" + 1;'), 'a1')
+
+
+class ScopeTest(unittest.TestCase):
+    def test_top_level_names_are_globals(self):
+        globals_ = {}
+        run('var a = 1; let b = 2; const c = a + b;', globals_=globals_)
+        self.assertEqual((globals_['a'], globals_['b'], globals_['c']), (1, 2, 3))
+
+    def test_function_locals_do_not_leak(self):
+        globals_ = {}
+        self.assertEqual(run('var x = 1; function f() { let x = 5; var y = x; return y; } return f() + x;',
+                             globals_=globals_), 6)
+        self.assertEqual(globals_['x'], 1)
+        self.assertNotIn('y', globals_)
+
+    def test_function_sees_globals_but_not_callers_locals(self):
+        self.assertEqual(run('var g = 2; function f() { return g; } return f();'), 2)
+        with self.assertRaisesRegex(vm.ExecutionError, 'x is not defined'):
+            run('function inner() { return x; } function outer() { var x = 1; return inner(); } outer();')
+
+
+class ControlFlowTest(unittest.TestCase):
+    def test_while_loop(self):
+        self.assertEqual(run('var i = 0; var s = 0; while (i < 5) { s = s + i; i = i + 1; } return s;'), 10)
+
+    def test_return_from_inside_loop(self):
+        self.assertEqual(run('function f() { var i = 0; while (1) { i = i + 1; while (i > 3) { return i; } } } '
+                             'return f();'), 4)
+
+    def test_calls_and_returns(self):
+        self.assertEqual(run('function add(a, b) { return a + b; } return add(2, add(3, 4));'), 9)
+        self.assertEqual(run('function fact(n) { return (n < 2 && 1) || n * fact(n - 1); } return fact(5);'), 120)
+
+    def test_missing_arguments_are_undefined(self):
+        self.assertEqual(run('function f(a, b) { return b || a; } return f(1) + f(1, 2, 3);'), 3)
+
+    def test_function_without_return(self):
+        self.assertIsNone(run('function f() { var a = 1; } return f();'))
+
+
+class ErrorTest(unittest.TestCase):
+    def test_step_budget(self):
+        with self.assertRaisesRegex(vm.BudgetExceeded, 'step budget of 100 exhausted'):
+            run('while (1) { }', max_steps=100)
+
+    def test_time_budget(self):
+        with self.assertRaises(vm.BudgetExceeded):
+            run('while (1) { }', max_steps=None, timeout=0.05)
+
+    def test_call_depth(self):
+        with self.assertRaisesRegex(vm.ExecutionError, 'maximum call stack size exceeded'):
+            run('function r(n) { return r(n); } r(1);', max_depth=50)
+
+    def test_undefined_name(self):
+        with self.assertRaisesRegex(vm.ExecutionError, 'y is not defined'):
+            run('return y;')
+        with self.assertRaisesRegex(vm.ExecutionError, 'g is not defined'):
+            run('g();')
+
+    def test_not_a_function(self):
+        with self.assertRaisesRegex(vm.ExecutionError, 'is not a function'):
+            run('var a = 1; a();')
+
+    def test_invalid_operands(self):
+        with self.assertRaises(vm.ExecutionError):
+            run('return "a" - 1;')
+
+
+if __name__ == '__main__':
+    unittest.main()